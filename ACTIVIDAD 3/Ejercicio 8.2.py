@@ -1,4 +1,3 @@
-from math import sqrt
 try:
     import tkinter as tk
     from tkinter import messagebox
@@ -6,26 +5,7 @@ except ImportError:
     tk = None
     messagebox = None
 
-
-class Notas:
-    def __init__(self, tamanio=5):
-        self.lista_notas = [0.0] * tamanio
-
-    def calcular_promedio(self):
-        return sum(self.lista_notas) / len(self.lista_notas) if self.lista_notas else 0.0
-
-    def calcular_desviacion(self):
-        if not self.lista_notas:
-            return 0.0
-        promedio = self.calcular_promedio()
-        suma_cuadrados = sum((n - promedio) ** 2 for n in self.lista_notas)
-        return sqrt(suma_cuadrados / len(self.lista_notas))
-
-    def calcular_menor(self):
-        return min(self.lista_notas) if self.lista_notas else 0.0
-
-    def calcular_mayor(self):
-        return max(self.lista_notas) if self.lista_notas else 0.0
+from modelo_notas import Notas
 
 
 class VentanaPrincipal(tk.Tk if tk is not None else object):
@@ -1,81 +1,7 @@
-import math
 import tkinter as tk
 from tkinter import ttk, messagebox
 
-
-class FiguraGeometrica:
-    """Clase base que almacena el volumen y la superficie de una figura."""
-
-    def __init__(self) -> None:
-        self.volumen: float = 0.0
-        self.superficie: float = 0.0
-
-    def set_volumen(self, volumen: float) -> None:
-        self.volumen = volumen
-
-    def set_superficie(self, superficie: float) -> None:
-        self.superficie = superficie
-
-    def get_volumen(self) -> float:
-        return self.volumen
-
-    def get_superficie(self) -> float:
-        return self.superficie
-
-
-class Cilindro(FiguraGeometrica):
-    """Representa un cilindro definido por su radio y altura."""
-
-    def __init__(self, radio: float, altura: float) -> None:
-        super().__init__()
-        self.radio = radio
-        self.altura = altura
-        self.set_volumen(self.calcular_volumen())
-        self.set_superficie(self.calcular_superficie())
-
-    def calcular_volumen(self) -> float:
-        return math.pi * self.altura * self.radio ** 2
-
-    def calcular_superficie(self) -> float:
-        area_lateral = 2 * math.pi * self.radio * self.altura
-        area_bases = 2 * math.pi * self.radio ** 2
-        return area_lateral + area_bases
-
-
-class Esfera(FiguraGeometrica):
-    """Representa una esfera definida unicamente por su radio."""
-
-    def __init__(self, radio: float) -> None:
-        super().__init__()
-        self.radio = radio
-        self.set_volumen(self.calcular_volumen())
-        self.set_superficie(self.calcular_superficie())
-
-    def calcular_volumen(self) -> float:
-        return (4.0 / 3.0) * math.pi * self.radio ** 3
-
-    def calcular_superficie(self) -> float:
-        return 4.0 * math.pi * self.radio ** 2
-
-
-class Piramide(FiguraGeometrica):
-    """Representa una piramide de base cuadrada con apotema."""
-
-    def __init__(self, base: float, altura: float, apotema: float) -> None:
-        super().__init__()
-        self.base = base
-        self.altura = altura
-        self.apotema = apotema
-        self.set_volumen(self.calcular_volumen())
-        self.set_superficie(self.calcular_superficie())
-
-    def calcular_volumen(self) -> float:
-        return (self.base ** 2) * self.altura / 3.0
-
-    def calcular_superficie(self) -> float:
-        area_base = self.base ** 2
-        area_lados = 2.0 * self.base * self.apotema
-        return area_base + area_lados
+from modelo_figuras import Cilindro, Esfera, Piramide
 
 
 class FiguraApp:
@@ -0,0 +1,29 @@
+"""
+Las cinco notas de un estudiante: promedio, desviación, menor y mayor.
+
+La ventana de "Ejercicio 8.2.py" llena ``lista_notas`` y muestra lo que
+calcula esta clase.
+"""
+
+from math import sqrt
+
+
+class Notas:
+    def __init__(self, tamanio=5):
+        self.lista_notas = [0.0] * tamanio
+
+    def calcular_promedio(self):
+        return sum(self.lista_notas) / len(self.lista_notas) if self.lista_notas else 0.0
+
+    def calcular_desviacion(self):
+        if not self.lista_notas:
+            return 0.0
+        promedio = self.calcular_promedio()
+        suma_cuadrados = sum((n - promedio) ** 2 for n in self.lista_notas)
+        return sqrt(suma_cuadrados / len(self.lista_notas))
+
+    def calcular_menor(self):
+        return min(self.lista_notas) if self.lista_notas else 0.0
+
+    def calcular_mayor(self):
+        return max(self.lista_notas) if self.lista_notas else 0.0
@@ -1,26 +1,7 @@
 import tkinter as tk
 from tkinter import messagebox
-import math
 
-
-# =========================================================
-# Clase que contiene los métodos estáticos solicitados
-# =========================================================
-class CalculosNumericos:
-
-    @staticmethod
-    def logaritmo_neperiano(valor):
-        
-        if valor <= 0:
-            raise ArithmeticError("Error: El valor debe ser positivo para calcular el logaritmo.")
-        return math.log(valor)
-
-    @staticmethod
-    def raiz_cuadrada(valor):
-        
-        if valor < 0:
-            raise ArithmeticError("Error: El valor debe ser positivo para calcular la raíz cuadrada.")
-        return math.sqrt(valor)
+from calculos_numericos import CalculosNumericos
 
 
 # =========================================================
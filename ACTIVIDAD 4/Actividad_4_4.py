@@ -1,48 +1,7 @@
 import tkinter as tk
 from tkinter import messagebox
 
-
-# ==========================================================
-# Clase Programador
-# ==========================================================
-class Programador:
-    def __init__(self, nombre, apellido):
-        
-        self.nombre = nombre
-        self.apellido = apellido
-
-
-# ==========================================================
-# Clase EquipoProgramadores
-# ==========================================================
-class EquipoProgramadores:
-
-    def __init__(self, nombre_equipo, universidad, lenguaje, tamano):
-        
-        self.nombre_equipo = nombre_equipo
-        self.universidad = universidad
-        self.lenguaje = lenguaje
-        self.tamano = tamano
-        self.programadores = []  # Lista que almacenará objetos Programador
-
-    def equipo_completo(self):
-        
-        return len(self.programadores) >= self.tamano
-
-    def validar_nombre(self, texto):
-       
-        if not texto.isalpha():
-            raise ValueError("El nombre o apellido solo puede contener letras.")
-        if len(texto) >= 20:
-            raise ValueError("El texto no puede tener 20 caracteres o más.")
-
-    def agregar_programador(self, nombre, apellido):
-        
-        if self.equipo_completo():
-            raise OverflowError("El equipo ya tiene el número máximo de programadores.")
-        self.validar_nombre(nombre)
-        self.validar_nombre(apellido)
-        self.programadores.append(Programador(nombre, apellido))
+from modelo_programadores import EquipoProgramadores, Programador
 
 
 # ==========================================================
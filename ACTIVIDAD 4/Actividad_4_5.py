@@ -1,19 +1,143 @@
 
-import io
+import re
 import sys
 from pathlib import Path
 import tkinter as tk
+import tkinter.font as tkfont
 from tkinter import filedialog, messagebox
+from typing import Callable
+
+from lectura_archivos import (
+    AUTO,
+    ArchivoMapeado,
+    BusquedaEnSegundoPlano,
+    Coincidencia,
+    LecturaEnSegundoPlano,
+    SeguimientoArchivo,
+    TareaEnSegundoPlano,
+    leer_archivo_bytes_a_texto,
+)
 
 APP_TITLE = "Lector de archivos — Tkinter"
-ENCODINGS = ("utf-8", "latin-1", "cp1252")
+ENCODINGS = (AUTO, "utf-8", "latin-1", "cp1252")  # "auto": se detecta al abrir
+INTERVALO_CARGA_MS = 15     # cada cuánto se pasan bloques del hilo lector al Text
+BLOQUES_POR_TICK = 2        # bloques insertados por tick (mantiene la interfaz fluida)
+TAM_BLOQUE_INTERFAZ = 256 * 1024  # bloques chicos: cada insert en el Text es corto
+UMBRAL_ARCHIVO_GRANDE = 50 * 1024 * 1024  # desde este tamaño se usa el visor virtual
+INTERVALO_BUSQUEDA_MS = 50  # cada cuánto se actualiza el contador de coincidencias
+INTERVALO_SEGUIMIENTO_MS = 500  # cada cuánto se revisa si el archivo creció (modo seguir)
+
+
+class VisorVirtual(tk.Frame):
+    """
+    Muestra un ``ArchivoMapeado`` dibujando solo las líneas que caben en pantalla.
+
+    El Text nunca contiene más que la ventana visible; la barra vertical se
+    maneja a mano y representa la posición dentro del archivo completo, así
+    que desplazarse cuesta lo mismo en un archivo de 1 KB que en uno de 2 GB.
+    """
+
+    def __init__(self, master, al_mover: Callable[[int, int, int], None] | None = None):
+        super().__init__(master, padx=8, pady=8)
+        self.archivo: ArchivoMapeado | None = None
+        self.primera = 0
+        self.resaltado: Coincidencia | None = None
+        self._al_mover = al_mover
+
+        self.txt = tk.Text(self, wrap=tk.NONE, state=tk.DISABLED)
+        sx = tk.Scrollbar(self, orient=tk.HORIZONTAL, command=self.txt.xview)
+        self.sy = tk.Scrollbar(self, orient=tk.VERTICAL, command=self._desplazar)
+        self.txt.configure(xscrollcommand=sx.set)
+        self.txt.tag_configure("coincidencia", background="yellow")
+
+        self.sy.pack(side=tk.RIGHT, fill=tk.Y)
+        sx.pack(side=tk.BOTTOM, fill=tk.X)
+        self.txt.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        self._fuente = tkfont.Font(font=self.txt["font"])
+        self.txt.bind("<Configure>", lambda _e: self._dibujar())
+        self.txt.bind("<MouseWheel>", self._rueda)
+        self.txt.bind("<Button-4>", lambda _e: self._mover(-3))   # X11
+        self.txt.bind("<Button-5>", lambda _e: self._mover(3))
+        for tecla, paso in (("<Up>", -1), ("<Down>", 1)):
+            self.txt.bind(tecla, lambda _e, p=paso: self._mover(p))
+        self.txt.bind("<Prior>", lambda _e: self._mover(-self.visibles()))
+        self.txt.bind("<Next>", lambda _e: self._mover(self.visibles()))
+        self.txt.bind("<Control-Home>", lambda _e: self.ir_a(0))
+        self.txt.bind("<Control-End>", lambda _e: self.ir_a(self._total()))
+
+    # ---------- Contenido ----------
+
+    def mostrar(self, archivo: ArchivoMapeado | None):
+        if self.archivo is not None and self.archivo is not archivo:
+            self.archivo.cerrar()
+        self.archivo = archivo
+        self.primera = 0
+        self.resaltado = None
+        self._dibujar()
+
+    def cerrar(self):
+        self.mostrar(None)
+
+    def _total(self) -> int:
+        return self.archivo.total_lineas if self.archivo is not None else 0
+
+    def visibles(self) -> int:
+        alto = max(self.txt.winfo_height(), 1)
+        return max(alto // self._fuente.metrics("linespace"), 1)
+
+    # ---------- Desplazamiento ----------
+
+    def ir_a(self, linea: int):
+        maximo = max(self._total() - self.visibles(), 0)
+        self.primera = min(max(linea, 0), maximo)
+        self._dibujar()
+        return "break"
+
+    def mostrar_coincidencia(self, coincidencia: Coincidencia):
+        """Centra la línea de la coincidencia y la resalta."""
+        self.resaltado = coincidencia
+        self.ir_a(coincidencia[0] - self.visibles() // 2)
+        linea, columna, _ = coincidencia
+        self.txt.see(f"{linea - self.primera + 1}.{columna}")
+
+    def _mover(self, lineas: int):
+        return self.ir_a(self.primera + lineas)
+
+    def _rueda(self, event):
+        # Windows: múltiplos de 120; macOS: valores chicos
+        paso = event.delta // 120 if abs(event.delta) >= 120 else event.delta
+        return self._mover(-3 * paso)
+
+    def _desplazar(self, accion, cantidad, unidad=None):
+        if accion == tk.MOVETO:
+            self.ir_a(int(float(cantidad) * self._total()))
+        elif unidad == tk.PAGES:
+            self._mover(int(cantidad) * self.visibles())
+        else:
+            self._mover(int(cantidad))
+
+    def _dibujar(self):
+        total = self._total()
+        cantidad = self.visibles()
+        lineas = self.archivo.lineas(self.primera, cantidad) if self.archivo else []
+
+        self.txt.configure(state=tk.NORMAL)
+        self.txt.delete("1.0", tk.END)
+        self.txt.insert("1.0", "\n".join(lineas))
+        if self.resaltado is not None and 0 <= self.resaltado[0] - self.primera < len(lineas):
+            linea, columna, largo = self.resaltado
+            inicio = f"{linea - self.primera + 1}.{columna}"
+            self.txt.tag_add("coincidencia", inicio, f"{inicio}+{largo}c")
+        self.txt.configure(state=tk.DISABLED)
+
+        if total:
+            self.sy.set(self.primera / total, min((self.primera + cantidad) / total, 1.0))
+        else:
+            self.sy.set(0.0, 1.0)
+        if self._al_mover is not None and self.archivo is not None:
+            self._al_mover(self.primera, len(lineas), total)
 
-def leer_archivo_bytes_a_texto(path: Path, encoding: str) -> str:
-    """Lee el archivo en binario -> buffer -> texto y devuelve el contenido."""
-    with path.open("rb") as fb:                     # flujo de bytes
-        with io.BufferedReader(fb) as buf:          # buffer de bytes
-            with io.TextIOWrapper(buf, encoding=encoding, errors="replace") as txt:
-                return txt.read()
 
 class App(tk.Tk):
     def __init__(self, ruta_inicial: Path | None = None):
@@ -29,17 +153,47 @@ class App(tk.Tk):
         self.encoding_var = tk.StringVar(value=ENCODINGS[0])
         tk.Button(top, text="Abrir archivo…", command=self.abrir).pack(side=tk.LEFT)
         tk.Button(top, text="Limpiar", command=self.limpiar).pack(side=tk.LEFT, padx=(8,0))
+        self.modo_grande_var = tk.BooleanVar(value=False)
+        self.guardar_indice_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(top, text="Modo archivo grande", variable=self.modo_grande_var)\
+            .pack(side=tk.LEFT, padx=(12,0))
+        tk.Checkbutton(top, text="Guardar índice (.idx)", variable=self.guardar_indice_var)\
+            .pack(side=tk.LEFT, padx=(4,0))
+        self.seguir_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(top, text="Seguir (tail -f)", variable=self.seguir_var,
+                       command=self._alternar_seguimiento).pack(side=tk.LEFT, padx=(4,0))
         tk.Label(top, text="Encoding:").pack(side=tk.RIGHT)
         tk.OptionMenu(top, self.encoding_var, *ENCODINGS).pack(side=tk.RIGHT, padx=(4,8))
 
+        # --- Barra de búsqueda (expresiones regulares sobre el archivo en disco)
+        barra = tk.Frame(self, padx=8)
+        barra.pack(side=tk.TOP, fill=tk.X)
+
+        self.buscar_var = tk.StringVar()
+        self.mayusculas_var = tk.BooleanVar(value=False)
+        self.resultado_busqueda = tk.StringVar(value="")
+        tk.Label(barra, text="Buscar (regex):").pack(side=tk.LEFT)
+        entrada = tk.Entry(barra, textvariable=self.buscar_var, width=32)
+        entrada.pack(side=tk.LEFT, padx=(4,0))
+        entrada.bind("<Return>", lambda _e: self.buscar())
+        tk.Checkbutton(barra, text="Ignorar mayúsculas", variable=self.mayusculas_var)\
+            .pack(side=tk.LEFT, padx=(8,0))
+        tk.Button(barra, text="Buscar", command=self.buscar).pack(side=tk.LEFT, padx=(8,0))
+        tk.Button(barra, text="◀", command=lambda: self.saltar_coincidencia(-1)).pack(side=tk.LEFT, padx=(4,0))
+        tk.Button(barra, text="▶", command=lambda: self.saltar_coincidencia(1)).pack(side=tk.LEFT)
+        tk.Label(barra, textvariable=self.resultado_busqueda).pack(side=tk.LEFT, padx=(8,0))
+        self.bind("<F3>", lambda _e: self.saltar_coincidencia(1))
+        self.bind("<Shift-F3>", lambda _e: self.saltar_coincidencia(-1))
+
         # --- Área de texto con scroll
-        wrap = tk.Frame(self, padx=8, pady=8)
+        wrap = self._zona_texto = tk.Frame(self, padx=8, pady=8)
         wrap.pack(fill=tk.BOTH, expand=True)
 
         self.txt = tk.Text(wrap, wrap=tk.NONE, undo=True)
         sx = tk.Scrollbar(wrap, orient=tk.HORIZONTAL, command=self.txt.xview)
         sy = tk.Scrollbar(wrap, orient=tk.VERTICAL, command=self.txt.yview)
         self.txt.configure(xscrollcommand=sx.set, yscrollcommand=sy.set)
+        self.txt.tag_configure("coincidencia", background="yellow")
 
         self.txt.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         sy.pack(side=tk.RIGHT, fill=tk.Y)
@@ -50,6 +204,16 @@ class App(tk.Tk):
         tk.Label(self, textvariable=self.status, anchor="w", relief=tk.SUNKEN, padx=8)\
             .pack(side=tk.BOTTOM, fill=tk.X)
 
+        # --- Visor para archivos grandes (se muestra en lugar del área de texto)
+        self.visor = VisorVirtual(self, al_mover=self._informar_posicion)
+
+        self._lectura: LecturaEnSegundoPlano | None = None
+        self._indexado: TareaEnSegundoPlano | None = None
+        self._ruta_actual: Path | None = None
+        self._busqueda: BusquedaEnSegundoPlano | None = None
+        self._seguimiento: SeguimientoArchivo | None = None
+        self._coincidencia_actual = -1
+
         # Carga inicial (si se pasó una ruta por argumento)
         if ruta_inicial:
             self.cargar_desde_ruta(ruta_inicial)
@@ -64,23 +228,261 @@ class App(tk.Tk):
             self.cargar_desde_ruta(Path(ruta))
 
     def cargar_desde_ruta(self, path: Path):
+        """Empieza a leer el archivo en segundo plano; el texto aparece a medida que llega."""
+        self._cancelar_lectura()
+        self._cancelar_busqueda()
+        self._ruta_actual = path
+        if self.seguir_var.get():
+            self._empezar_seguimiento(path)
+            return
+        if self.modo_grande_var.get() or self._es_grande(path):
+            self._abrir_grande(path)
+            return
+        self._usar_visor(False)
+        self.txt.delete("1.0", tk.END)
+        # sin historial de deshacer mientras se carga (duplicaría la memoria)
+        self.txt.configure(undo=False)
+        self.status.set(f"Cargando: {path}…")
+        self._lectura = LecturaEnSegundoPlano(
+            path, self.encoding_var.get(), tam_bloque=TAM_BLOQUE_INTERFAZ
+        ).iniciar()
+        self.after(INTERVALO_CARGA_MS, self._continuar_carga, self._lectura)
+
+    def _continuar_carga(self, lectura: LecturaEnSegundoPlano):
+        if lectura is not self._lectura:
+            return  # se canceló o se abrió otro archivo
+        for texto in lectura.tomar_bloques(BLOQUES_POR_TICK):
+            self.txt.insert(tk.END, texto)
+
+        if not lectura.terminado:
+            self.status.set(f"Cargando: {lectura.path}… {lectura.lineas.total} líneas")
+            self.after(INTERVALO_CARGA_MS, self._continuar_carga, lectura)
+            return
+
+        self._lectura = None
+        self.txt.edit_reset()
+        self.txt.configure(undo=True)
+        if lectura.error is not None:
+            self._mostrar_error_lectura(lectura.path, lectura.error)
+            self.status.set("Listo")
+            return
+        self.status.set(f"Leído: {lectura.path} — {lectura.lineas.total} líneas ({lectura.encoding})")
+
+    # ---------- Modo archivo grande ----------
+
+    @staticmethod
+    def _es_grande(path: Path) -> bool:
         try:
-            contenido = leer_archivo_bytes_a_texto(path, self.encoding_var.get())
-        except FileNotFoundError:
-            messagebox.showerror("Error", f"Archivo no encontrado:\n{path}")
+            return path.stat().st_size >= UMBRAL_ARCHIVO_GRANDE
+        except OSError:
+            return False  # el error se informa al intentar leerlo
+
+    def _usar_visor(self, activo: bool):
+        actual, otro = (self.visor, self._zona_texto) if activo else (self._zona_texto, self.visor)
+        if not actual.winfo_manager():
+            otro.pack_forget()
+            actual.pack(fill=tk.BOTH, expand=True)
+        if not activo:
+            self.visor.cerrar()
+
+    def _abrir_grande(self, path: Path):
+        """Proyecta el archivo con mmap e indexa sus líneas en segundo plano."""
+        self.txt.delete("1.0", tk.END)
+        self._usar_visor(True)
+        self.visor.cerrar()
+        self.status.set(f"Indexando: {path}…")
+        self._indexado = TareaEnSegundoPlano(
+            ArchivoMapeado, path, self.encoding_var.get(), self.guardar_indice_var.get()
+        )
+        self.after(INTERVALO_CARGA_MS, self._continuar_indexado, self._indexado, path)
+
+    def _continuar_indexado(self, tarea: TareaEnSegundoPlano, path: Path):
+        if not tarea.terminada:
+            self.after(INTERVALO_CARGA_MS, self._continuar_indexado, tarea, path)
             return
-        except PermissionError:
-            messagebox.showerror("Error", f"Permiso denegado:\n{path}")
+        if tarea is not self._indexado:
+            if tarea.resultado is not None:
+                tarea.resultado.cerrar()  # se abrió otro archivo mientras tanto
             return
-        except OSError as e:
-            messagebox.showerror("Error de lectura", f"{e}")
+
+        self._indexado = None
+        if tarea.error is not None:
+            self._mostrar_error_lectura(path, tarea.error)
+            self.status.set("Listo")
             return
+        self.visor.mostrar(tarea.resultado)
+        self.visor.txt.focus_set()
+
+    def _informar_posicion(self, primera: int, cantidad: int, total: int):
+        archivo = self.visor.archivo
+        if total:
+            self.status.set(f"{archivo.path} — líneas {primera + 1}–{primera + cantidad} "
+                            f"de {total} ({archivo.encoding})")
+        else:
+            self.status.set(f"{archivo.path} — archivo vacío")
+
+    # ---------- Modo seguir (tail -f) ----------
 
+    def _alternar_seguimiento(self):
+        if self.seguir_var.get():
+            if self._ruta_actual is not None:
+                self.cargar_desde_ruta(self._ruta_actual)
+        else:
+            self._detener_seguimiento()
+            self.status.set("Seguimiento detenido")
+
+    def _empezar_seguimiento(self, path: Path):
+        self._usar_visor(False)
         self.txt.delete("1.0", tk.END)
-        self.txt.insert(tk.END, contenido)
-        self.status.set(f"Leído: {path} — {len(contenido.splitlines())} líneas")
+        self.txt.configure(undo=False)
+        try:
+            self._seguimiento = SeguimientoArchivo(path, self.encoding_var.get())
+        except (OSError, LookupError, ValueError) as e:
+            self._mostrar_error_lectura(path, e)
+            self.seguir_var.set(False)
+            self.status.set("Listo")
+            return
+        self._revisar_seguimiento(self._seguimiento)
+
+    def _revisar_seguimiento(self, seguimiento: SeguimientoArchivo):
+        if seguimiento is not self._seguimiento:
+            return
+        try:
+            novedades = seguimiento.revisar()
+        except OSError as e:
+            self._detener_seguimiento()
+            self.seguir_var.set(False)
+            self._mostrar_error_lectura(seguimiento.path, e)
+            return
+
+        if novedades is not None:
+            al_final = self.txt.yview()[1] >= 1.0  # solo se baja solo si ya estaba abajo
+            if novedades.reiniciado:
+                self.txt.delete("1.0", tk.END)
+                self.txt.insert(tk.END, seguimiento.contenido())
+            else:
+                self.txt.insert(tk.END, novedades.texto)
+                self._recortar_lineas(seguimiento.lineas.maxlen)
+            if al_final:
+                self.txt.see(tk.END)
+        evento = f" (archivo {novedades.evento})" if novedades and novedades.evento else ""
+        self.status.set(f"Siguiendo: {seguimiento.path} — byte {seguimiento.posicion} "
+                        f"({seguimiento.encoding}){evento}")
+        espera = INTERVALO_CARGA_MS if novedades and novedades.pendiente else INTERVALO_SEGUIMIENTO_MS
+        self.after(espera, self._revisar_seguimiento, seguimiento)
+
+    def _recortar_lineas(self, maximo: int):
+        """Deja en el Text las últimas ``maximo`` líneas completas (más la parcial)."""
+        lineas = int(self.txt.index("end-1c").split(".")[0])
+        sobrantes = lineas - 1 - maximo
+        if sobrantes > 0:
+            self.txt.delete("1.0", f"{sobrantes + 1}.0")
+
+    def _detener_seguimiento(self):
+        if self._seguimiento is not None:
+            self._seguimiento.cerrar()
+            self._seguimiento = None
+            self.txt.configure(undo=True)
+
+    # ---------- Búsqueda ----------
+
+    def buscar(self):
+        """Lanza la búsqueda en un hilo; las coincidencias se van contando mientras llegan."""
+        self._cancelar_busqueda()
+        patron = self.buscar_var.get()
+        if not patron or self._ruta_actual is None:
+            return
+        if self._seguimiento is not None:
+            # las líneas del Text no coinciden con las del archivo: solo se ve la cola
+            messagebox.showinfo("Buscar", "Detén el modo seguir para buscar en el archivo.")
+            return
+        encoding = self.visor.archivo.encoding if self._en_visor() and self.visor.archivo \
+            else self.encoding_var.get()
+        try:
+            self._busqueda = BusquedaEnSegundoPlano(
+                self._ruta_actual, patron, encoding, self.mayusculas_var.get()
+            ).iniciar()
+        except re.error as e:
+            messagebox.showerror("Buscar", f"Expresión regular inválida:\n{e}")
+            return
+        except (ValueError, LookupError, OSError) as e:  # incluye UnicodeEncodeError
+            messagebox.showerror("Buscar", f"No se puede buscar en este archivo:\n{e}")
+            return
+        self.resultado_busqueda.set("Buscando…")
+        self.after(INTERVALO_BUSQUEDA_MS, self._continuar_busqueda, self._busqueda)
+
+    def _continuar_busqueda(self, busqueda: BusquedaEnSegundoPlano):
+        if busqueda is not self._busqueda:
+            return
+        if self._coincidencia_actual < 0 and busqueda.coincidencias:
+            self.saltar_coincidencia(1)  # la primera se muestra en cuanto aparece
+        if not busqueda.terminado:
+            self._mostrar_conteo(" …")
+            self.after(INTERVALO_BUSQUEDA_MS, self._continuar_busqueda, busqueda)
+            return
+        if busqueda.error is not None:
+            self._mostrar_error_lectura(busqueda.path, busqueda.error)
+        self._mostrar_conteo("+" if busqueda.truncada else "")
+
+    def _mostrar_conteo(self, sufijo: str = ""):
+        total = len(self._busqueda.coincidencias) if self._busqueda else 0
+        if total:
+            self.resultado_busqueda.set(f"{self._coincidencia_actual + 1}/{total}{sufijo}")
+        else:
+            self.resultado_busqueda.set(f"Sin coincidencias{sufijo}")
+
+    def saltar_coincidencia(self, paso: int):
+        if self._busqueda is None or not self._busqueda.coincidencias:
+            return
+        coincidencias = self._busqueda.coincidencias
+        self._coincidencia_actual = (self._coincidencia_actual + paso) % len(coincidencias)
+        coincidencia = coincidencias[self._coincidencia_actual]
+        if self._en_visor():
+            self.visor.mostrar_coincidencia(coincidencia)
+        else:
+            linea, columna, largo = coincidencia
+            inicio = f"{linea + 1}.{columna}"
+            self.txt.tag_remove("coincidencia", "1.0", tk.END)
+            self.txt.tag_add("coincidencia", inicio, f"{inicio}+{largo}c")
+            self.txt.see(inicio)
+        self._mostrar_conteo("" if self._busqueda.terminado else " …")
+
+    def _cancelar_busqueda(self):
+        if self._busqueda is not None:
+            self._busqueda.cancelar()
+            self._busqueda = None
+        self._coincidencia_actual = -1
+        self.resultado_busqueda.set("")
+        self.txt.tag_remove("coincidencia", "1.0", tk.END)
+        self.visor.resaltado = None
+
+    def _en_visor(self) -> bool:
+        return bool(self.visor.winfo_manager())
+
+    def _cancelar_lectura(self):
+        self._indexado = None
+        self._detener_seguimiento()
+        if self._lectura is not None:
+            self._lectura.cancelar()
+            self._lectura = None
+            self.txt.configure(undo=True)
+
+    @staticmethod
+    def _mostrar_error_lectura(path: Path, error: BaseException):
+        if isinstance(error, FileNotFoundError):
+            messagebox.showerror("Error", f"Archivo no encontrado:\n{path}")
+        elif isinstance(error, PermissionError):
+            messagebox.showerror("Error", f"Permiso denegado:\n{path}")
+        elif isinstance(error, LookupError):
+            messagebox.showerror("Error", f"Encoding desconocido:\n{error}")
+        else:
+            messagebox.showerror("Error de lectura", f"{error}")
 
     def limpiar(self):
+        self._cancelar_lectura()
+        self._cancelar_busqueda()
+        self._ruta_actual = None
+        self._usar_visor(False)
         self.txt.delete("1.0", tk.END)
         self.status.set("Listo")
 
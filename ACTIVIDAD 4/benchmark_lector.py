@@ -0,0 +1,207 @@
+"""
+Mediciones de rendimiento del lector de archivos (lectura_archivos.py).
+
+Uso:
+    python benchmark_lector.py encoding [--tamanios 1 10 100] [--repeticiones 20]
+    python benchmark_lector.py seguimiento [--megas 20]
+    python benchmark_lector.py busqueda [--megas 4]
+
+``encoding`` genera archivos de varios tamaños (en MB) en UTF-8 y en
+cp1252 y mide cuánto tarda ``detectar_encoding`` frente a decodificar el
+archivo completo. La detección solo lee ``TAM_MUESTRA`` bytes, así que su
+tiempo debería mantenerse igual aunque el archivo crezca.
+
+``seguimiento`` comprueba primero que ``SeguimientoArchivo`` no pierda ni
+junte líneas cuando el archivo se rota (con y sin una última línea a
+medias en el archivo viejo, y con más de ``MAX_LECTURA_POR_REVISION``
+bytes pendientes) y luego mide cuánto tarda en seguir ``--megas`` MB
+que se van agregando al archivo.
+
+``busqueda`` mide ``BusquedaEnSegundoPlano`` sobre un archivo de una sola
+línea de ``--megas`` MB con una coincidencia cada ~100 bytes (el caso de
+un log minificado) y sobre el mismo texto partido en líneas; antes
+compara las posiciones con las de ``re`` sobre el texto decodificado.
+"""
+
+import argparse
+import os
+import re
+import tempfile
+import time
+from pathlib import Path
+
+from lectura_archivos import (
+    MAX_LECTURA_POR_REVISION, TAM_MUESTRA, BusquedaEnSegundoPlano, SeguimientoArchivo,
+    detectar_encoding, leer_en_bloques,
+)
+
+_LINEA = "Año {i}: la niña pagó 12 € por el café — “oferta” del día\n"
+
+
+def generar_archivo(ruta: Path, megas: int, encoding: str) -> None:
+    objetivo = megas * 1024 * 1024
+    escritos = 0
+    i = 0
+    with ruta.open("wb") as archivo:
+        while escritos < objetivo:
+            datos = "".join(_LINEA.format(i=i + j) for j in range(1000)).encode(encoding)
+            archivo.write(datos)
+            escritos += len(datos)
+            i += 1000
+
+
+def benchmark_encoding(tamanios, repeticiones: int) -> None:
+    print(f"Muestra para la detección: {TAM_MUESTRA // 1024} KB")
+    print(f"{'archivo':>16} {'detectado':>10} {'detección':>12} {'lectura completa':>18}")
+    with tempfile.TemporaryDirectory() as carpeta:
+        for megas in tamanios:
+            for encoding in ("utf-8", "cp1252"):
+                ruta = Path(carpeta) / f"{megas}mb-{encoding}.txt"
+                generar_archivo(ruta, megas, encoding)
+
+                inicio = time.perf_counter()
+                for _ in range(repeticiones):
+                    detectado = detectar_encoding(ruta)
+                t_deteccion = (time.perf_counter() - inicio) / repeticiones
+                assert detectado == encoding, (detectado, encoding)
+
+                inicio = time.perf_counter()
+                for _ in leer_en_bloques(ruta, detectado):
+                    pass
+                t_lectura = time.perf_counter() - inicio
+
+                print(f"{f'{megas} MB {encoding}':>16} {detectado:>10} "
+                      f"{t_deteccion * 1000:>9.2f} ms {t_lectura * 1000:>15.1f} ms")
+                os.remove(ruta)
+
+
+def _revisar_todo(seguimiento: SeguimientoArchivo) -> str:
+    """Revisa hasta que no quede nada pendiente y devuelve el texto recibido."""
+    textos = []
+    while True:
+        novedades = seguimiento.revisar()
+        if novedades is None:
+            return "".join(textos)
+        textos.append(novedades.texto)
+        if not novedades.pendiente:
+            return "".join(textos)
+
+
+def comprobar_rotacion() -> None:
+    largo = "x" * 100
+    viejo_grande = "".join(f"{largo} {i}\n" for i in range(MAX_LECTURA_POR_REVISION // 50))
+    casos = (
+        ("última línea a medias", "a1\na2\nparcial", "b1\nb2\n"),
+        ("última línea completa", "a1\na2\n", "b1\nb2\n"),
+        ("viejo con mucho pendiente", viejo_grande + "fin", "b1\n"),
+    )
+    with tempfile.TemporaryDirectory() as carpeta:
+        ruta = Path(carpeta) / "registro.log"
+        for descripcion, viejo, nuevo in casos:
+            ruta.write_text("", encoding="utf-8")
+            seguimiento = SeguimientoArchivo(ruta, "utf-8", max_lineas=1_000_000)
+            with ruta.open("a", encoding="utf-8", newline="") as f:
+                f.write(viejo)
+            recibido = _revisar_todo(seguimiento)
+            os.replace(ruta, ruta.with_suffix(".1"))
+            ruta.write_text(nuevo, encoding="utf-8")
+            recibido += _revisar_todo(seguimiento)
+            seguimiento.cerrar()
+
+            esperado = viejo + ("" if viejo.endswith("\n") else "\n") + nuevo
+            assert recibido == esperado, f"rotación ({descripcion}): el texto recibido difiere"
+            assert list(seguimiento.lineas) == esperado.splitlines(), \
+                f"rotación ({descripcion}): las líneas retenidas difieren"
+            assert seguimiento.parcial == ""
+            print(f"Rotación, {descripcion}: correcta")
+
+
+def benchmark_seguimiento(megas: int) -> None:
+    comprobar_rotacion()
+    with tempfile.TemporaryDirectory() as carpeta:
+        ruta = Path(carpeta) / "registro.log"
+        ruta.write_text("", encoding="utf-8")
+        seguimiento = SeguimientoArchivo(ruta, "utf-8")
+        bloque = "".join(_LINEA.format(i=i) for i in range(10_000)).encode("utf-8")
+        escritos = 0
+        inicio = time.perf_counter()
+        with ruta.open("ab") as archivo:
+            while escritos < megas * 1024 * 1024:
+                archivo.write(bloque)
+                archivo.flush()
+                escritos += len(bloque)
+                _revisar_todo(seguimiento)
+        duracion = time.perf_counter() - inicio
+        seguimiento.cerrar()
+        print(f"Seguimiento de {escritos / 2**20:.0f} MB: {duracion:.2f} s "
+              f"({escritos / 2**20 / duracion:.0f} MB/s, {len(seguimiento.lineas)} líneas retenidas)")
+
+
+_TROZO_BUSQUEDA = "la niña pagó 12 € por el café — clave {i:06d} — "  # ~60 caracteres
+
+
+def _texto_busqueda(bytes_aproximados: int, separador: str) -> str:
+    cantidad = bytes_aproximados // 100
+    return separador.join(_TROZO_BUSQUEDA.format(i=i) + "relleno " * 4 for i in range(cantidad))
+
+
+def _buscar(ruta: Path, patron: str) -> "BusquedaEnSegundoPlano":
+    busqueda = BusquedaEnSegundoPlano(ruta, patron, "utf-8").iniciar()
+    while not busqueda.terminado:
+        time.sleep(0.01)
+    if busqueda.error is not None:
+        raise busqueda.error
+    return busqueda
+
+
+def _coincidencias_esperadas(texto: str, patron: str):
+    esperadas = []
+    for m in re.finditer(patron, texto, re.MULTILINE):
+        inicio_linea = texto.rfind("\n", 0, m.start()) + 1
+        esperadas.append((texto.count("\n", 0, m.start()), m.start() - inicio_linea, len(m.group())))
+    return esperadas
+
+
+def benchmark_busqueda(megas: int) -> None:
+    patron = r"clave \d+"
+    with tempfile.TemporaryDirectory() as carpeta:
+        ruta = Path(carpeta) / "busqueda.txt"
+        for separador, descripcion in ((" ", "una sola línea"), ("\n", "una línea por trozo")):
+            texto = _texto_busqueda(200_000, separador)
+            ruta.write_text(texto, encoding="utf-8")
+            assert _buscar(ruta, patron).coincidencias == _coincidencias_esperadas(texto, patron), \
+                f"búsqueda ({descripcion}): las posiciones difieren de re"
+
+            ruta.write_text(_texto_busqueda(megas * 1024 * 1024, separador), encoding="utf-8")
+            inicio = time.perf_counter()
+            busqueda = _buscar(ruta, patron)
+            duracion = time.perf_counter() - inicio
+            print(f"{megas} MB, {descripcion:<20} {duracion:8.2f} s "
+                  f"({len(busqueda.coincidencias)} coincidencias, posiciones comprobadas)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    sub = parser.add_subparsers(dest="prueba", required=True)
+
+    p_enc = sub.add_parser("encoding", help="costo de detectar el encoding según el tamaño")
+    p_enc.add_argument("--tamanios", type=int, nargs="+", default=[1, 10, 100], help="en MB")
+    p_enc.add_argument("--repeticiones", type=int, default=20)
+
+    p_seg = sub.add_parser("seguimiento", help="rotación y velocidad del modo seguir")
+    p_seg.add_argument("--megas", type=int, default=20)
+
+    p_bus = sub.add_parser("busqueda", help="búsqueda en líneas muy largas")
+    p_bus.add_argument("--megas", type=int, default=4)
+
+    args = parser.parse_args()
+    if args.prueba == "encoding":
+        benchmark_encoding(args.tamanios, args.repeticiones)
+    elif args.prueba == "seguimiento":
+        benchmark_seguimiento(args.megas)
+    elif args.prueba == "busqueda":
+        benchmark_busqueda(args.megas)
+
+
+if __name__ == "__main__":
+    main()
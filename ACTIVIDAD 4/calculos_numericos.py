@@ -0,0 +1,26 @@
+"""
+Logaritmo neperiano y raíz cuadrada con ``ArithmeticError`` para valores
+fuera de dominio, como pide Actividad_4_3.py.
+"""
+
+import math
+
+
+# =========================================================
+# Clase que contiene los métodos estáticos solicitados
+# =========================================================
+class CalculosNumericos:
+
+    @staticmethod
+    def logaritmo_neperiano(valor):
+        
+        if valor <= 0:
+            raise ArithmeticError("Error: El valor debe ser positivo para calcular el logaritmo.")
+        return math.log(valor)
+
+    @staticmethod
+    def raiz_cuadrada(valor):
+        
+        if valor < 0:
+            raise ArithmeticError("Error: El valor debe ser positivo para calcular la raíz cuadrada.")
+        return math.sqrt(valor)
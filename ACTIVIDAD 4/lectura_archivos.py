@@ -0,0 +1,675 @@
+"""
+Lectura de archivos de texto para el lector de Actividad_4_5.
+
+- ``detectar_encoding``: elige el encoding mirando solo el comienzo del
+  archivo; todas las funciones aceptan ``"auto"`` en lugar de un encoding.
+- ``leer_archivo_bytes_a_texto``: lee todo el archivo de una vez.
+- ``leer_en_bloques``: decodifica el archivo por bloques de tamaño fijo
+  con un decodificador incremental, sin cargarlo completo en memoria.
+- ``LecturaEnSegundoPlano``: hace lo mismo en un hilo aparte y deja los
+  bloques en una cola para que la interfaz los consuma con ``after()``.
+- ``ArchivoMapeado``: proyecta el archivo con ``mmap`` y usa un
+  ``IndiceLineas`` para leer solo las líneas que se van a mostrar.
+- ``BusquedaEnSegundoPlano``: busca una expresión regular en los bytes
+  del archivo desde un hilo y va publicando las coincidencias.
+- ``SeguimientoArchivo``: modo ``tail -f``; lee solo lo que se agregó al
+  archivo desde la última revisión y conserva las últimas N líneas.
+"""
+
+import codecs
+import io
+import mmap
+import os
+import queue
+import re
+import struct
+import threading
+from array import array
+from bisect import bisect_right
+from collections import deque
+from pathlib import Path
+from typing import Any, Callable, Deque, Iterator, List, NamedTuple, Optional, Tuple
+
+TAM_BLOQUE = 1 << 20           # 1 MiB por lectura
+MAX_BLOQUES_EN_COLA = 16       # limita la memoria si la interfaz va más lenta que el disco
+
+AUTO = "auto"
+CANDIDATOS_ENCODING = ("utf-8", "cp1252", "latin-1")  # en caso de empate gana el primero
+TAM_MUESTRA = 64 * 1024        # bytes que se miran para detectar el encoding
+_BOMS = (
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+# caracteres que casi nunca aparecen en texto real: controles (salvo \t \n \f \r),
+# controles C1 (típicos de leer cp1252 como latin-1) y el carácter de reemplazo
+_SOSPECHOSOS = re.compile("[\x00-\x08\x0b\x0e-\x1f\x7f-\x9f\ufffd]")
+
+
+# ==========================
+#  DETECCIÓN DE ENCODING
+# ==========================
+
+def detectar_encoding_muestra(
+    muestra: bytes, completa: bool, candidatos=CANDIDATOS_ENCODING
+) -> str:
+    """
+    Elige el encoding más probable para ``muestra``.
+
+    ``completa`` indica si la muestra es el archivo entero; si no lo es, un
+    carácter multibyte cortado al final no cuenta como error. Cada candidato
+    se prueba con un decodificador incremental estricto: los que fallan se
+    descartan y entre los demás gana el que produce menos caracteres
+    sospechosos. Hay dos salidas tempranas: una marca BOM, o una muestra que
+    UTF-8 decodifica sin errores (texto en otro encoding casi nunca es UTF-8
+    válido por casualidad).
+    """
+    for bom, encoding in _BOMS:
+        if muestra.startswith(bom):
+            return encoding
+
+    mejor, mejor_puntaje = None, None
+    for encoding in candidatos:
+        decodificador = codecs.getincrementaldecoder(encoding)(errors="strict")
+        try:
+            texto = decodificador.decode(muestra, final=completa)
+        except UnicodeDecodeError:
+            continue
+        if codecs.lookup(encoding).name == "utf-8":
+            return encoding
+        puntaje = len(_SOSPECHOSOS.findall(texto))
+        if mejor_puntaje is None or puntaje < mejor_puntaje:
+            mejor, mejor_puntaje = encoding, puntaje
+            if puntaje == 0:
+                break
+    # latin-1 nunca falla, pero si no está entre los candidatos algo hay que devolver
+    return mejor if mejor is not None else candidatos[-1]
+
+
+def detectar_encoding(path: Path, tam_muestra: int = TAM_MUESTRA) -> str:
+    """Detecta el encoding leyendo como mucho ``tam_muestra`` bytes del archivo."""
+    with path.open("rb") as fb:
+        muestra = fb.read(tam_muestra + 1)
+    completa = len(muestra) <= tam_muestra
+    return detectar_encoding_muestra(muestra[:tam_muestra], completa)
+
+
+def resolver_encoding(path: Path, encoding: str) -> str:
+    """Devuelve ``encoding`` tal cual, o el detectado si es ``"auto"``."""
+    return detectar_encoding(path) if encoding == AUTO else encoding
+
+
+_MUESTRA_ASCII = "\t\n\r azAZ09"
+
+
+def _exigir_compatible_con_ascii(encoding: str) -> None:
+    """
+    Falla si ``encoding`` no escribe el ASCII byte por byte (UTF-16, por ejemplo).
+
+    ``ArchivoMapeado``, ``BusquedaEnSegundoPlano`` y ``SeguimientoArchivo``
+    trabajan sobre los bytes: cortan las líneas en ``b"\\n"`` y buscan el
+    patrón codificado, lo que solo es correcto en esos encodings. Los demás
+    se pueden leer igual con ``leer_en_bloques``.
+    """
+    if _MUESTRA_ASCII.encode(encoding) != _MUESTRA_ASCII.encode("ascii"):
+        raise ValueError(
+            f"El encoding {encoding} no es compatible con ASCII; "
+            "solo se puede leer completo o por bloques."
+        )
+
+
+# ==========================
+#  LECTURA
+# ==========================
+
+def leer_archivo_bytes_a_texto(path: Path, encoding: str) -> str:
+    """Lee el archivo en binario -> buffer -> texto y devuelve el contenido."""
+    encoding = resolver_encoding(path, encoding)
+    with path.open("rb") as fb:                     # flujo de bytes
+        with io.BufferedReader(fb) as buf:          # buffer de bytes
+            with io.TextIOWrapper(buf, encoding=encoding, errors="replace") as txt:
+                return txt.read()
+
+
+def leer_en_bloques(path: Path, encoding: str, tam_bloque: int = TAM_BLOQUE) -> Iterator[str]:
+    """
+    Devuelve el contenido del archivo como una secuencia de trozos de texto.
+
+    Los caracteres multibyte o los ``\\r\\n`` que quedan partidos entre dos
+    bloques se completan con el bloque siguiente, y los finales de línea se
+    normalizan a ``\\n`` igual que al abrir el archivo en modo texto.
+    """
+    encoding = resolver_encoding(path, encoding)
+    decodificador = io.IncrementalNewlineDecoder(
+        codecs.getincrementaldecoder(encoding)(errors="replace"), translate=True
+    )
+    with path.open("rb") as fb:
+        while True:
+            datos = fb.read(tam_bloque)
+            if not datos:
+                break
+            texto = decodificador.decode(datos)
+            if texto:
+                yield texto
+    resto = decodificador.decode(b"", final=True)
+    if resto:
+        yield resto
+
+
+class ContadorLineas:
+    """Cuenta líneas a medida que llegan los trozos de texto."""
+
+    def __init__(self) -> None:
+        self.saltos = 0
+        self._termina_en_salto = True
+
+    def agregar(self, texto: str) -> None:
+        if texto:
+            self.saltos += texto.count("\n")
+            self._termina_en_salto = texto.endswith("\n")
+
+    @property
+    def total(self) -> int:
+        # una última línea sin salto final también cuenta (como splitlines)
+        return self.saltos + (0 if self._termina_en_salto else 1)
+
+
+class LecturaEnSegundoPlano:
+    """
+    Lee un archivo por bloques en un hilo y deja el texto en una cola.
+
+    El hilo nunca toca la interfaz: el hilo principal llama a
+    ``tomar_bloques`` periódicamente (con ``after()``) e inserta lo que
+    haya. La cola tiene tamaño máximo, así que si la interfaz no da abasto
+    el hilo se detiene en lugar de acumular el archivo en memoria.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        encoding: str,
+        tam_bloque: int = TAM_BLOQUE,
+        max_bloques: int = MAX_BLOQUES_EN_COLA,
+    ) -> None:
+        self.path = path
+        self.encoding = encoding
+        self.tam_bloque = tam_bloque
+        self.lineas = ContadorLineas()
+        self.error: Optional[BaseException] = None
+        self.terminado = False
+        self._cola: "queue.Queue[Optional[str]]" = queue.Queue(maxsize=max_bloques)
+        self._cancelado = threading.Event()
+        self._hilo = threading.Thread(target=self._trabajar, daemon=True)
+
+    def iniciar(self) -> "LecturaEnSegundoPlano":
+        self._hilo.start()
+        return self
+
+    def cancelar(self) -> None:
+        self._cancelado.set()
+
+    @property
+    def cancelado(self) -> bool:
+        return self._cancelado.is_set()
+
+    def _poner(self, elemento: Optional[str]) -> bool:
+        while not self._cancelado.is_set():
+            try:
+                self._cola.put(elemento, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _trabajar(self) -> None:
+        try:
+            # la detección lee solo el comienzo, así que se hace también en el hilo
+            self.encoding = resolver_encoding(self.path, self.encoding)
+            for texto in leer_en_bloques(self.path, self.encoding, self.tam_bloque):
+                if not self._poner(texto):
+                    return
+        except BaseException as e:  # se informa a la interfaz desde el hilo principal
+            self.error = e
+        self._poner(None)  # marca de fin
+
+    def tomar_bloques(self, maximo: int) -> List[str]:
+        """Saca hasta ``maximo`` bloques de la cola sin bloquear (hilo principal)."""
+        bloques: List[str] = []
+        while len(bloques) < maximo:
+            try:
+                texto = self._cola.get_nowait()
+            except queue.Empty:
+                break
+            if texto is None:
+                self.terminado = True
+                break
+            self.lineas.agregar(texto)
+            bloques.append(texto)
+        return bloques
+
+
+# ==========================
+#  ARCHIVOS GRANDES (MMAP)
+# ==========================
+
+class IndiceLineas:
+    """
+    Índice disperso de líneas de un archivo proyectado en memoria.
+
+    En lugar de guardar dónde empieza cada línea (8 bytes por línea), se
+    guarda un punto de control cada ``tam_tramo`` bytes: el número de la
+    línea que contiene ese byte y dónde empieza. Para llegar a una línea
+    se salta al punto de control anterior y se avanza con ``find``, que
+    recorre como mucho un tramo. Construirlo es una sola pasada que solo
+    cuenta saltos de línea por tramo, y ocupa unos pocos KB por GB.
+    """
+
+    TAM_TRAMO = 16 * 1024
+    _MAGIA = b"IDXL"
+    # magia, versión, tamaño del archivo, mtime_ns, tamaño de tramo, puntos, total de líneas
+    _CABECERA = struct.Struct("<4sHQqIQQ")
+
+    def __init__(self, lineas: array, inicios: array, total: int, tam_tramo: int) -> None:
+        self._lineas = lineas      # número de línea en cada punto de control
+        self._inicios = inicios    # byte donde empieza esa línea
+        self.total = total
+        self.tam_tramo = tam_tramo
+
+    @classmethod
+    def construir(cls, mapa: "mmap.mmap", tam_tramo: int = TAM_TRAMO) -> "IndiceLineas":
+        lineas, inicios = array("q"), array("q")
+        tamanio = len(mapa)
+        saltos = 0
+        inicio_linea = 0  # comienzo de la línea en curso, tras el último salto visto
+        for posicion in range(0, tamanio, tam_tramo):
+            lineas.append(saltos)
+            inicios.append(inicio_linea)
+            fin = posicion + tam_tramo
+            saltos += mapa[posicion:fin].count(b"\n")
+            # rfind solo dentro del tramo: buscar desde el principio sería cuadrático
+            # en archivos con líneas muy largas o sin saltos
+            ultimo = mapa.rfind(b"\n", posicion, fin)
+            if ultimo != -1:
+                inicio_linea = ultimo + 1
+        ultima_sin_salto = tamanio > 0 and mapa[tamanio - 1:tamanio] != b"\n"
+        return cls(lineas, inicios, saltos + ultima_sin_salto, tam_tramo)
+
+    # ---------- Persistencia junto al archivo ----------
+
+    @staticmethod
+    def ruta_para(path: Path) -> Path:
+        return path.with_name(path.name + ".idx")
+
+    def guardar(self, path: Path, estado: os.stat_result) -> None:
+        destino = self.ruta_para(path)
+        temporal = destino.with_name(destino.name + ".tmp")
+        with temporal.open("wb") as f:
+            f.write(self._CABECERA.pack(
+                self._MAGIA, 1, estado.st_size, estado.st_mtime_ns,
+                self.tam_tramo, len(self._lineas), self.total,
+            ))
+            self._lineas.tofile(f)
+            self._inicios.tofile(f)
+        os.replace(temporal, destino)
+
+    @classmethod
+    def cargar(cls, path: Path, estado: os.stat_result) -> Optional["IndiceLineas"]:
+        """Lee el índice guardado si corresponde a esta versión del archivo."""
+        try:
+            with cls.ruta_para(path).open("rb") as f:
+                cabecera = f.read(cls._CABECERA.size)
+                if len(cabecera) != cls._CABECERA.size:
+                    return None
+                magia, version, tamanio, mtime, tam_tramo, puntos, total = \
+                    cls._CABECERA.unpack(cabecera)
+                if (magia, version, tamanio, mtime) != (cls._MAGIA, 1, estado.st_size, estado.st_mtime_ns):
+                    return None
+                lineas, inicios = array("q"), array("q")
+                lineas.fromfile(f, puntos)
+                inicios.fromfile(f, puntos)
+        except (OSError, EOFError):
+            return None
+        return cls(lineas, inicios, total, tam_tramo)
+
+    # ---------- Consulta ----------
+
+    def inicio_de(self, mapa: "mmap.mmap", numero: int) -> int:
+        """Byte donde empieza la línea ``numero`` (0 = primera)."""
+        punto = bisect_right(self._lineas, numero) - 1
+        posicion, linea = self._inicios[punto], self._lineas[punto]
+        while linea < numero:
+            posicion = mapa.find(b"\n", posicion) + 1
+            linea += 1
+        return posicion
+
+    def linea_de(self, mapa: "mmap.mmap", posicion: int) -> int:
+        """Número de la línea que contiene el byte ``posicion``."""
+        punto = min(posicion // self.tam_tramo, len(self._lineas) - 1)
+        inicio = self._inicios[punto]
+        linea = self._lineas[punto]
+        return linea + mapa[inicio:posicion].count(b"\n")
+
+
+class ArchivoMapeado:
+    """
+    Archivo de texto de cualquier tamaño abierto en modo solo lectura.
+
+    Solo se decodifican las líneas que se piden, así que la memoria usada
+    depende de cuántas líneas se muestran y no del tamaño del archivo.
+    """
+
+    def __init__(self, path: Path, encoding: str, persistir_indice: bool = False) -> None:
+        if encoding != AUTO:
+            _exigir_compatible_con_ascii(encoding)  # falla pronto si no sirve o no existe
+        self.path = path
+        self.encoding = encoding
+        self._archivo = path.open("rb")
+        estado = os.fstat(self._archivo.fileno())
+        self.tamanio = estado.st_size
+        if self.tamanio == 0:
+            self.mapa = None
+            self.indice = IndiceLineas(array("q"), array("q"), 0, IndiceLineas.TAM_TRAMO)
+            if encoding == AUTO:
+                self.encoding = CANDIDATOS_ENCODING[0]
+            return
+        self.mapa = mmap.mmap(self._archivo.fileno(), 0, access=mmap.ACCESS_READ)
+        if encoding == AUTO:
+            self.encoding = detectar_encoding_muestra(
+                self.mapa[:TAM_MUESTRA], completa=self.tamanio <= TAM_MUESTRA
+            )
+            try:
+                _exigir_compatible_con_ascii(self.encoding)
+            except ValueError:
+                self.cerrar()
+                raise
+
+        indice = IndiceLineas.cargar(path, estado) if persistir_indice else None
+        if indice is None:
+            indice = IndiceLineas.construir(self.mapa)
+            if persistir_indice:
+                try:
+                    indice.guardar(path, estado)
+                except OSError:
+                    pass  # la carpeta puede no admitir escritura; el índice sigue en memoria
+        self.indice = indice
+
+    @property
+    def total_lineas(self) -> int:
+        return self.indice.total
+
+    def lineas(self, desde: int, cantidad: int) -> List[str]:
+        """Decodifica ``cantidad`` líneas a partir de la línea ``desde``."""
+        if self.mapa is None or desde >= self.total_lineas:
+            return []
+        resultado: List[str] = []
+        posicion = self.indice.inicio_de(self.mapa, desde)
+        for _ in range(min(cantidad, self.total_lineas - desde)):
+            fin = self.mapa.find(b"\n", posicion)
+            if fin == -1:
+                fin = self.tamanio
+            datos = self.mapa[posicion:fin]
+            if datos.endswith(b"\r"):
+                datos = datos[:-1]
+            resultado.append(datos.decode(self.encoding, errors="replace"))
+            posicion = fin + 1
+        return resultado
+
+    def cerrar(self) -> None:
+        if self.mapa is not None:
+            self.mapa.close()
+            self.mapa = None
+        self._archivo.close()
+
+
+class TareaEnSegundoPlano:
+    """Ejecuta una función en un hilo; la interfaz consulta ``terminada`` con ``after()``."""
+
+    def __init__(self, funcion: Callable[..., Any], *args: Any) -> None:
+        self.resultado: Any = None
+        self.error: Optional[BaseException] = None
+        self._hecho = threading.Event()
+        self._hilo = threading.Thread(target=self._trabajar, args=(funcion,) + args, daemon=True)
+        self._hilo.start()
+
+    def _trabajar(self, funcion: Callable[..., Any], *args: Any) -> None:
+        try:
+            self.resultado = funcion(*args)
+        except BaseException as e:
+            self.error = e
+        finally:
+            self._hecho.set()
+
+    @property
+    def terminada(self) -> bool:
+        return self._hecho.is_set()
+
+
+# ==========================
+#  BÚSQUEDA
+# ==========================
+
+Coincidencia = Tuple[int, int, int]  # (línea desde 0, columna, largo), en caracteres
+
+
+class BusquedaEnSegundoPlano:
+    """
+    Busca una expresión regular en el archivo (no en el widget) desde un hilo.
+
+    El patrón se codifica con el encoding del archivo y se aplica sobre los
+    bytes proyectados con ``mmap``, por ventanas de ``TAM_VENTANA`` bytes
+    que terminan en un salto de línea; entre ventana y ventana el hilo
+    revisa si se canceló. ``re`` no suelta el GIL mientras recorre: entre
+    una coincidencia y la siguiente la interfaz puede seguir, pero una
+    ventana sin coincidencias la frena lo que tarda en recorrerse (de
+    milisegundos a decenas de milisegundos, según el patrón). Un patrón
+    con ``\\n`` puede abarcar varias líneas dentro de una ventana, pero
+    nunca pasa de una ventana a la siguiente. Las coincidencias se agregan
+    a ``coincidencias`` a medida que aparecen; la interfaz consulta
+    cuántas hay con ``after()``.
+    """
+
+    TAM_VENTANA = 4 * 1024 * 1024
+    MAX_COINCIDENCIAS = 100_000  # cota de memoria; ``truncada`` indica que había más
+
+    def __init__(self, path: Path, patron: str, encoding: str, ignorar_mayusculas: bool = False) -> None:
+        self.path = path
+        self.encoding = resolver_encoding(path, encoding)
+        _exigir_compatible_con_ascii(self.encoding)
+        banderas = re.MULTILINE | (re.IGNORECASE if ignorar_mayusculas else 0)
+        # errores del patrón (re.error, UnicodeEncodeError) salen aquí, en el hilo principal
+        self.regex = re.compile(patron.encode(self.encoding), banderas)
+        self.coincidencias: List[Coincidencia] = []
+        self.truncada = False
+        self.error: Optional[BaseException] = None
+        self.terminado = False
+        self._cancelado = threading.Event()
+        self._hilo = threading.Thread(target=self._trabajar, daemon=True)
+
+    def iniciar(self) -> "BusquedaEnSegundoPlano":
+        self._hilo.start()
+        return self
+
+    def cancelar(self) -> None:
+        self._cancelado.set()
+
+    def _trabajar(self) -> None:
+        try:
+            with self.path.open("rb") as archivo:
+                if os.fstat(archivo.fileno()).st_size:
+                    with mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+                        self._recorrer(mapa)
+        except BaseException as e:
+            self.error = e
+        finally:
+            self.terminado = True
+
+    def _recorrer(self, mapa: "mmap.mmap") -> None:
+        tamanio = len(mapa)
+        # línea y columna se cuentan desde la coincidencia anterior, no desde el
+        # comienzo de la línea: si no, una línea muy larga costaría tiempo cuadrático
+        linea, columna, contado_hasta = 0, 0, 0
+        inicio = 0
+        while inicio < tamanio and not self._cancelado.is_set():
+            fin = mapa.find(b"\n", min(inicio + self.TAM_VENTANA, tamanio))
+            fin = tamanio if fin == -1 else fin + 1
+            for m in self.regex.finditer(mapa, inicio, fin):
+                if m.start() == m.end():
+                    continue  # un patrón vacío coincidiría en todas partes
+                ultimo_salto = mapa.rfind(b"\n", contado_hasta, m.start())
+                if ultimo_salto != -1:
+                    linea += mapa[contado_hasta:ultimo_salto + 1].count(b"\n")
+                    contado_hasta, columna = ultimo_salto + 1, 0
+                columna += len(mapa[contado_hasta:m.start()].decode(self.encoding, errors="replace"))
+                contado_hasta = m.start()
+                largo = len(m.group().decode(self.encoding, errors="replace"))
+                self.coincidencias.append((linea, columna, largo))
+                if len(self.coincidencias) >= self.MAX_COINCIDENCIAS:
+                    self.truncada = True
+                    return
+            inicio = fin
+
+
+# ==========================
+#  SEGUIMIENTO (TAIL -F)
+# ==========================
+
+MAX_LINEAS_SEGUIMIENTO = 10_000      # líneas que se conservan en modo seguimiento
+MAX_LECTURA_POR_REVISION = 1 << 20   # si llegó más, se sigue leyendo en la próxima revisión
+
+
+class Novedades(NamedTuple):
+    texto: str               # texto nuevo, con saltos de línea normalizados a "\n"
+    reiniciado: bool         # el archivo se truncó: hay que volver a mostrar ``contenido()``
+    evento: Optional[str]    # "truncado", "rotado" o None
+    pendiente: bool          # quedan bytes sin leer
+
+
+class SeguimientoArchivo:
+    """
+    Sigue un archivo que crece (como ``tail -f``) sin volver a leerlo entero.
+
+    Se recuerda la posición hasta donde se leyó y se guarda el mismo
+    decodificador incremental entre revisiones, así que un carácter o un
+    ``\\r\\n`` partido entre dos escrituras se completa en la siguiente.
+    Las líneas completas van a un ``deque`` con tamaño máximo (un buffer
+    circular): las más viejas se descartan solas y la memoria no crece
+    aunque la sesión dure horas.
+
+    El archivo queda abierto. Si el tamaño baja de la posición leída, el
+    archivo se truncó (``copytruncate``) y se vuelve a empezar desde el
+    principio. Si en la ruta aparece otro archivo (rotación por renombre),
+    primero se termina de leer el viejo por el descriptor abierto (de a
+    ``MAX_LECTURA_POR_REVISION`` bytes por revisión, hasta el final) y
+    luego se sigue con el nuevo desde el principio.
+    """
+
+    def __init__(self, path: Path, encoding: str, max_lineas: int = MAX_LINEAS_SEGUIMIENTO) -> None:
+        self.path = path
+        self.encoding = resolver_encoding(path, encoding)
+        _exigir_compatible_con_ascii(self.encoding)
+        self.lineas: Deque[str] = deque(maxlen=max_lineas)
+        self.parcial = ""  # última línea, todavía sin salto final
+        self._archivo = path.open("rb")
+        self._identidad = self._identidad_de(os.fstat(self._archivo.fileno()))
+        self._decodificador = self._nuevo_decodificador()
+        self.posicion = self._inicio_de_cola(os.fstat(self._archivo.fileno()).st_size)
+        self._archivo.seek(self.posicion)
+
+    @staticmethod
+    def _identidad_de(estado: os.stat_result) -> Tuple[int, int]:
+        return estado.st_dev, estado.st_ino
+
+    def _nuevo_decodificador(self) -> io.IncrementalNewlineDecoder:
+        return io.IncrementalNewlineDecoder(
+            codecs.getincrementaldecoder(self.encoding)(errors="replace"), translate=True
+        )
+
+    def _inicio_de_cola(self, tamanio: int) -> int:
+        """Posición donde empiezan las últimas ``maxlen`` líneas, leyendo hacia atrás."""
+        # se buscan ``maxlen`` saltos hacia atrás sin contar el salto final; si
+        # la última línea no tiene salto, es ``parcial`` y hace falta uno más
+        fin = tamanio
+        restantes = self.lineas.maxlen
+        if fin:
+            self._archivo.seek(fin - 1)
+            if self._archivo.read(1) == b"\n":
+                fin -= 1
+            else:
+                restantes += 1
+        while fin > 0:
+            inicio = max(fin - TAM_MUESTRA, 0)
+            self._archivo.seek(inicio)
+            datos = self._archivo.read(fin - inicio)
+            posicion = len(datos)
+            while restantes:
+                posicion = datos.rfind(b"\n", 0, posicion)
+                if posicion == -1:
+                    break
+                restantes -= 1
+            if not restantes:
+                return inicio + posicion + 1
+            fin = inicio
+        return 0
+
+    def contenido(self) -> str:
+        """Lo retenido hasta ahora, para redibujar la vista completa."""
+        return "".join(linea + "\n" for linea in self.lineas) + self.parcial
+
+    def _agregar(self, texto: str) -> None:
+        partes = (self.parcial + texto).split("\n")
+        self.parcial = partes.pop()
+        self.lineas.extend(partes)
+
+    def _leer(self, maximo: int) -> Tuple[str, bool]:
+        datos = self._archivo.read(maximo)
+        self.posicion += len(datos)
+        texto = self._decodificador.decode(datos)
+        self._agregar(texto)
+        return texto, len(datos) == maximo
+
+    def revisar(self) -> Optional[Novedades]:
+        """Lee lo nuevo desde la última revisión; devuelve None si no cambió nada."""
+        try:
+            estado = os.stat(self.path)
+        except FileNotFoundError:
+            return None  # en plena rotación: el archivo nuevo todavía no existe
+
+        textos: List[str] = []
+        evento = None
+        if self._identidad_de(estado) != self._identidad:
+            # rotación: lo que quedaba del archivo viejo y después el nuevo desde el inicio
+            texto, pendiente = self._leer(MAX_LECTURA_POR_REVISION)
+            if pendiente:
+                # el viejo tiene más: se sigue leyendo en las próximas revisiones hasta el final
+                return Novedades(texto, False, None, True)
+            textos.append(texto)
+            textos.append(self._decodificador.decode(b"", final=True))
+            self._agregar(textos[-1])
+            if self.parcial:
+                # la última línea del viejo no sigue en el nuevo: se cierra aquí
+                self.lineas.append(self.parcial)
+                self.parcial = ""
+                textos.append("\n")
+            self._archivo.close()
+            self._archivo = self.path.open("rb")
+            estado = os.fstat(self._archivo.fileno())
+            self._identidad = self._identidad_de(estado)
+            self._decodificador = self._nuevo_decodificador()
+            self.posicion = 0
+            evento = "rotado"
+        elif estado.st_size < self.posicion:
+            self._archivo.seek(0)
+            self._decodificador = self._nuevo_decodificador()
+            self.lineas.clear()
+            self.parcial = ""
+            self.posicion = 0
+            evento = "truncado"
+        elif estado.st_size == self.posicion:
+            return None
+
+        texto, pendiente = self._leer(MAX_LECTURA_POR_REVISION)
+        textos.append(texto)
+        return Novedades("".join(textos), evento == "truncado", evento, pendiente)
+
+    def cerrar(self) -> None:
+        self._archivo.close()
@@ -0,0 +1,20 @@
+"""
+Vendedor con verificación de edad (Actividad_4_2.py).
+"""
+
+
+class Vendedor:
+    def __init__(self, nombre, apellidos):
+        self.nombre = nombre
+        self.apellidos = apellidos
+        self.edad = None
+
+    def verificacion_edad(self, edad):
+        if edad < 18:
+            raise ValueError("El vendedor debe ser mayor de 18 años.")
+        if edad < 0 or edad > 120:
+            raise ValueError("La edad no puede ser negativa ni mayor a 120.")
+        self.edad = edad
+
+    def imprimir(self):
+        return f"Nombre: {self.nombre}\nApellidos: {self.apellidos}\nEdad: {self.edad}"
@@ -0,0 +1,81 @@
+"""
+Funciones de la agenda (crear, buscar, actualizar, eliminar, importar,
+exportar y sugerir contactos) sobre un único almacén abierto.
+
+``tipo_almacen`` elige entre el archivo de texto y SQLite; ejercicio_5.py
+lo fija según ``--almacen`` antes de la primera operación.
+"""
+
+import os
+
+from almacen_contactos import AlmacenContactos
+from almacen_sqlite import AlmacenSQLite
+
+#crea el contacto
+nombre_archivo = "contacto.txt"
+nombre_base_datos = "contacto.db"
+ALMACENES = ("texto", "sqlite")
+#el tipo de almacen se puede elegir con --almacen o con la variable CONTACTOS_ALMACEN
+tipo_almacen = os.environ.get("CONTACTOS_ALMACEN", "texto")
+_repositorio = None
+
+#el almacen se abre una sola vez; despues se trabaja con sus indices
+def obtener_repositorio():
+    global _repositorio
+    if _repositorio is None:
+        if tipo_almacen == "sqlite":
+            _repositorio = AlmacenSQLite(nombre_base_datos)
+        else:
+            _repositorio = AlmacenContactos(nombre_archivo)
+    return _repositorio
+
+#cambia el almacen usado por las funciones de contactos
+def usar_repositorio(repositorio):
+    global _repositorio
+    if _repositorio is not None and _repositorio is not repositorio:
+        _repositorio.cerrar()
+    _repositorio = repositorio
+
+def crear_contacto(nombre_nuevo, telefono):
+    try:
+        creado = obtener_repositorio().crear(nombre_nuevo, telefono)
+    except ValueError as e:
+        return str(e)
+    if not creado:
+        return "El nombre o número introducido ya existe."
+    return "Contacto creado exitosamente."
+
+#lea el contacto buscandolo en el indice por nombre
+def buscar_contacto_en_archivo(nombre_a_buscar):
+    telefono = obtener_repositorio().buscar(nombre_a_buscar)
+    if telefono is None:
+        return None
+    return f"Nombre: {nombre_a_buscar}\nTeléfono: {telefono}"
+
+#para actualizar contacto
+def actualizar_contacto(nombre_a_actualizar, nuevo_telefono):
+    return obtener_repositorio().actualizar(nombre_a_actualizar, nuevo_telefono)
+
+#para eliminar un contacto
+def eliminar_contacto(nombre_a_eliminar):
+    return obtener_repositorio().eliminar(nombre_a_eliminar)
+
+#importa muchos contactos de una vez (tuplas o lineas nombre!telefono)
+def importar_contactos(filas):
+    return obtener_repositorio().importar(filas)
+
+#exporta los contactos vigentes a otro archivo
+def exportar_contactos(ruta):
+    return obtener_repositorio().exportar(ruta)
+
+#sugerencias mientras se escribe: primero por prefijo y, si no hay, las parecidas
+def sugerir_contactos(texto, limite=10):
+    repositorio = obtener_repositorio()
+    sugerencias = repositorio.buscar_prefijo(texto, limite)
+    if not sugerencias and len(texto) >= 3:
+        sugerencias = repositorio.buscar_aproximado(texto, 1, limite)
+    return sugerencias
+
+#sugerencias por el comienzo del telefono
+def sugerir_por_telefono(prefijo, limite=10):
+    return obtener_repositorio().buscar_prefijo_telefono(prefijo, limite)
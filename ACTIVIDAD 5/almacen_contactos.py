@@ -0,0 +1,469 @@
+"""
+Almacén de contactos con índices en memoria.
+
+Los contactos se guardan en el mismo archivo de texto de siempre
+(una línea ``nombre!telefono`` por contacto). Al abrir el almacén el
+archivo se lee una sola vez y se construyen dos diccionarios, uno por
+nombre y otro por teléfono, que se mantienen sincronizados en cada
+escritura. Así crear, leer, actualizar y eliminar son búsquedas O(1)
+en lugar de recorrer el archivo completo.
+
+Las actualizaciones y eliminaciones no reescriben el archivo: se
+agregan al final como nuevos registros (el último registro de un nombre
+es el que vale y un teléfono vacío, ``nombre!``, marca que el contacto
+fue eliminado). Cuando la proporción de registros obsoletos supera
+``ratio_basura`` el archivo se compacta reescribiéndolo una sola vez
+en un archivo temporal que luego reemplaza al original con ``os.replace``
+(el archivo nunca deja de existir). Las operaciones toman un candado
+entre procesos (ver candado_archivo.py), así que varias ventanas o
+procesos pueden escribir a la vez sin perder registros.
+
+``RepositorioContactos`` es la interfaz común de los almacenes; además
+del archivo de texto existe ``AlmacenSQLite`` (ver almacen_sqlite.py).
+Todos ofrecen búsqueda por prefijo y aproximada a través de un
+``IndiceBusqueda`` (ver busqueda_contactos.py) que se construye la
+primera vez que se usa y luego se actualiza en cada escritura.
+"""
+
+import locale
+import os
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from busqueda_contactos import IndiceBusqueda
+from candado_archivo import CandadoArchivo
+
+# Fila rechazada en una importación: (número de fila, nombre, teléfono, motivo)
+FilaRechazada = Tuple[int, str, str, str]
+FilaContacto = Union[str, Tuple[str, str]]
+
+SEPARADOR = "!"
+RATIO_BASURA_POR_DEFECTO = 0.5
+# la misma codificación que usa open() por defecto, para leer los archivos de siempre
+CODIFICACION = locale.getpreferredencoding(False)
+
+# Políticas de fsync: nunca, solo al compactar (el reemplazo del archivo
+# queda en disco) o en cada escritura (ninguna operación confirmada se pierde
+# aunque se caiga el equipo, a costa de mucha más latencia).
+FSYNC_NUNCA = "nunca"
+FSYNC_AL_COMPACTAR = "compactar"
+FSYNC_SIEMPRE = "siempre"
+POLITICAS_FSYNC = (FSYNC_NUNCA, FSYNC_AL_COMPACTAR, FSYNC_SIEMPRE)
+
+
+def parsear_linea(linea: str) -> Optional[Tuple[str, str]]:
+    """Convierte una línea ``nombre!telefono`` en una tupla (o None si no aplica)."""
+    if SEPARADOR not in linea:
+        return None
+    nombre, _, telefono = linea.strip().partition(SEPARADOR)
+    return nombre, telefono
+
+
+def formatear_linea(nombre: str, telefono: str) -> str:
+    return f"{nombre}{SEPARADOR}{telefono}\n"
+
+
+# ==========================
+#  INTERFAZ DEL REPOSITORIO
+# ==========================
+
+class RepositorioContactos(ABC):
+    """
+    Operaciones que debe ofrecer cualquier almacén de contactos.
+
+    Los nombres y los teléfonos son únicos; las subclases deciden cómo
+    se guardan y cómo se indexan.
+    """
+
+    def __init__(self) -> None:
+        self._indice: Optional[IndiceBusqueda] = None
+
+    @abstractmethod
+    def crear(self, nombre: str, telefono: str) -> bool:
+        """Agrega el contacto; devuelve False si el nombre o el teléfono ya existen."""
+
+    @abstractmethod
+    def buscar(self, nombre: str) -> Optional[str]:
+        """Devuelve el teléfono del contacto o None si no existe."""
+
+    @abstractmethod
+    def buscar_por_telefono(self, telefono: str) -> Optional[str]:
+        """Devuelve el nombre asociado al teléfono o None si no existe."""
+
+    @abstractmethod
+    def actualizar(self, nombre: str, nuevo_telefono: str) -> bool:
+        """
+        Cambia el teléfono de un contacto; devuelve False si no existe.
+        Lanza ValueError si el teléfono ya pertenece a otro contacto.
+        """
+
+    @abstractmethod
+    def eliminar(self, nombre: str) -> bool:
+        """Elimina el contacto; devuelve False si no existe."""
+
+    @abstractmethod
+    def importar(self, filas: Iterable[FilaContacto]) -> Tuple[int, List[FilaRechazada]]:
+        """
+        Importa contactos recorriendo ``filas`` una sola vez.
+
+        Cada fila puede ser una tupla (nombre, telefono) o una línea
+        ``nombre!telefono``. Devuelve la cantidad de contactos importados
+        y la lista de filas rechazadas con su motivo.
+        """
+
+    @abstractmethod
+    def contactos(self) -> Iterator[Tuple[str, str]]:
+        """Recorre los contactos vigentes como (nombre, teléfono)."""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Cantidad de contactos vigentes."""
+
+    def __contains__(self, nombre: object) -> bool:
+        return isinstance(nombre, str) and self.buscar(nombre) is not None
+
+    def cerrar(self) -> None:
+        """Libera los recursos del almacén (si los tiene)."""
+
+    def exportar(self, ruta: str) -> int:
+        """Escribe los contactos vigentes en ``ruta`` y devuelve cuántos se exportaron."""
+        archivo_temporal = ruta + ".tmp"
+        cantidad = 0
+        with open(archivo_temporal, "w") as archivo:
+            for nombre, telefono in self.contactos():
+                archivo.write(formatear_linea(nombre, telefono))
+                cantidad += 1
+        os.replace(archivo_temporal, ruta)
+        return cantidad
+
+    # ---------- Búsqueda incremental ----------
+
+    def indice_busqueda(self) -> IndiceBusqueda:
+        """Índice de prefijos del almacén (se construye una sola vez)."""
+        if self._indice is None:
+            self._indice = IndiceBusqueda(self.contactos())
+        return self._indice
+
+    def buscar_prefijo(self, prefijo: str, limite: int = 20) -> List[str]:
+        """Nombres que empiezan por ``prefijo`` (sin distinguir mayúsculas)."""
+        return self.indice_busqueda().por_prefijo(prefijo, limite)
+
+    def buscar_prefijo_telefono(self, prefijo: str, limite: int = 20) -> List[str]:
+        """Nombres cuyo teléfono empieza por ``prefijo``."""
+        return self.indice_busqueda().por_prefijo_telefono(prefijo, limite)
+
+    def buscar_aproximado(self, texto: str, max_distancia: int = 1, limite: int = 20) -> List[str]:
+        """Nombres a lo sumo a ``max_distancia`` ediciones de ``texto``."""
+        return self.indice_busqueda().aproximados(texto, max_distancia, limite)
+
+    # Las subclases llaman a estos métodos después de cada escritura para
+    # mantener el índice sincronizado (si todavía no se construyó, no hacen nada).
+
+    def _indice_agregar(self, nombre: str, telefono: str) -> None:
+        if self._indice is not None:
+            self._indice.agregar(nombre, telefono)
+
+    def _indice_quitar(self, nombre: str, telefono: str) -> None:
+        if self._indice is not None:
+            self._indice.quitar(nombre, telefono)
+
+    def _indice_cambiar_telefono(self, nombre: str, anterior: str, nuevo: str) -> None:
+        if self._indice is not None:
+            self._indice.cambiar_telefono(nombre, anterior, nuevo)
+
+    # ---------- Utilidades para las subclases ----------
+
+    @staticmethod
+    def _validar(nombre: str, telefono: str) -> None:
+        if not nombre or not telefono:
+            raise ValueError("El nombre y el teléfono no pueden estar vacíos.")
+        for texto in (nombre, telefono):
+            if SEPARADOR in texto or "\n" in texto:
+                raise ValueError(f"Los datos no pueden contener '{SEPARADOR}' ni saltos de línea.")
+
+    @classmethod
+    def _filas_validas(
+        cls, filas: Iterable[FilaContacto], rechazadas: List[FilaRechazada]
+    ) -> Iterator[Tuple[int, str, str]]:
+        """Recorre ``filas`` y entrega (número, nombre, teléfono) de las filas bien formadas."""
+        for numero, fila in enumerate(filas, start=1):
+            if isinstance(fila, str):
+                registro = parsear_linea(fila)
+                if registro is None:
+                    if fila.strip():
+                        rechazadas.append((numero, fila.strip(), "", "Formato inválido."))
+                    continue
+                nombre, telefono = registro
+            else:
+                nombre, telefono = fila
+            try:
+                cls._validar(nombre, telefono)
+            except ValueError as e:
+                rechazadas.append((numero, nombre, telefono, str(e)))
+                continue
+            yield numero, nombre, telefono
+
+
+# ==========================
+#  ALMACÉN EN ARCHIVO DE TEXTO
+# ==========================
+
+class AlmacenContactos(RepositorioContactos):
+    """
+    Contactos persistidos en texto con índices hash por nombre y teléfono.
+
+    ``ratio_basura`` es la fracción de registros obsoletos tolerada antes
+    de compactar; con 0 el archivo se reescribe en cada edición.
+
+    Varios procesos pueden usar el mismo archivo a la vez: cada operación
+    toma un candado (compartido para leer, exclusivo para escribir) y,
+    antes de responder, incorpora los registros que otros procesos hayan
+    agregado desde la última vez. ``fsync`` decide cuándo se fuerza la
+    escritura al disco (ver ``POLITICAS_FSYNC``).
+    """
+
+    def __init__(
+        self,
+        ruta: str,
+        ratio_basura: float = RATIO_BASURA_POR_DEFECTO,
+        fsync: str = FSYNC_AL_COMPACTAR,
+    ) -> None:
+        if not 0.0 <= ratio_basura < 1.0:
+            raise ValueError("ratio_basura debe estar en el intervalo [0, 1).")
+        if fsync not in POLITICAS_FSYNC:
+            raise ValueError(f"fsync debe ser uno de {POLITICAS_FSYNC}.")
+        super().__init__()
+        self.ruta = ruta
+        self.ratio_basura = ratio_basura
+        self.fsync = fsync
+        self._candado = CandadoArchivo(ruta + ".lock")
+        self._por_nombre: Dict[str, str] = {}
+        self._por_telefono: Dict[str, str] = {}
+        self._registros = 0      # líneas con registro que hay en el archivo
+        self._posicion = 0       # bytes del archivo ya incorporados a los índices
+        # (generación del candado, st_dev, st_ino) del archivo leído
+        self._identidad: Optional[Tuple[int, int, int]] = None
+        with self._candado.bloquear(exclusivo=False):
+            self._sincronizar()
+
+    def cerrar(self) -> None:
+        self._candado.cerrar()
+
+    # ---------- Carga e índices ----------
+
+    def _sincronizar(self) -> None:
+        """
+        Pone los índices al día con el archivo (se llama con el candado tomado).
+
+        Si el archivo solo creció se leen únicamente los bytes nuevos; si
+        otro proceso lo compactó (cambió la generación o el inodo) o lo
+        truncó, se recarga completo.
+        """
+        try:
+            estado = os.stat(self.ruta)
+        except FileNotFoundError:
+            if self._identidad is not None or self._registros:
+                self._reiniciar()
+            return
+        identidad = self._identidad_de(estado)
+        if identidad != self._identidad or estado.st_size < self._posicion:
+            self._reiniciar()
+            self._identidad = identidad
+        if estado.st_size > self._posicion:
+            self._leer_desde(self._posicion)
+
+    def _identidad_de(self, estado: os.stat_result) -> Tuple[int, int, int]:
+        return (self._candado.generacion(), estado.st_dev, estado.st_ino)
+
+    def _reiniciar(self) -> None:
+        self._indice = None
+        self._por_nombre.clear()
+        self._por_telefono.clear()
+        self._registros = 0
+        self._posicion = 0
+        self._identidad = None
+
+    def _leer_desde(self, posicion: int) -> None:
+        with open(self.ruta, "rb") as archivo:
+            archivo.seek(posicion)
+            datos = archivo.read()
+        # solo se consumen líneas completas
+        fin = datos.rfind(b"\n") + 1
+        for linea in datos[:fin].decode(CODIFICACION).splitlines():
+            registro = parsear_linea(linea)
+            if registro is not None:
+                self._aplicar(*registro)
+                self._registros += 1
+        self._posicion = posicion + fin
+
+    def _aplicar(self, nombre: str, telefono: str) -> None:
+        """Aplica un registro del archivo: teléfono vacío significa eliminado."""
+        anterior = self._por_nombre.get(nombre)
+        if telefono:
+            self._indexar(nombre, telefono)
+            if anterior is None:
+                self._indice_agregar(nombre, telefono)
+            else:
+                self._indice_cambiar_telefono(nombre, anterior, telefono)
+        elif anterior is not None:
+            self._desindexar(nombre)
+            self._indice_quitar(nombre, anterior)
+
+    def _indexar(self, nombre: str, telefono: str) -> None:
+        anterior = self._por_nombre.get(nombre)
+        if anterior is not None:
+            self._por_telefono.pop(anterior, None)
+        self._por_nombre[nombre] = telefono
+        self._por_telefono[telefono] = nombre
+
+    def _desindexar(self, nombre: str) -> None:
+        telefono = self._por_nombre.pop(nombre)
+        self._por_telefono.pop(telefono, None)
+
+    # ---------- Persistencia ----------
+
+    def _escribir_registros(self, registros: Dict[str, str]) -> None:
+        """Agrega registros al final (con el candado exclusivo) y los aplica a los índices."""
+        datos = "".join(formatear_linea(n, t) for n, t in registros.items()).encode(CODIFICACION)
+        with open(self.ruta, "ab") as archivo:
+            archivo.write(datos)
+            if self.fsync == FSYNC_SIEMPRE:
+                archivo.flush()
+                os.fsync(archivo.fileno())
+        if self._identidad is None:
+            self._identidad = self._identidad_de(os.stat(self.ruta))
+        self._posicion += len(datos)
+        for nombre, telefono in registros.items():
+            self._aplicar(nombre, telefono)
+        self._registros += len(registros)
+
+    @property
+    def basura(self) -> int:
+        """Cantidad de registros obsoletos (sobrescritos o eliminados) en el archivo."""
+        return self._registros - len(self._por_nombre)
+
+    def _compactar_si_hace_falta(self) -> None:
+        if self._registros and self.basura / self._registros > self.ratio_basura:
+            self.compactar()
+
+    def compactar(self) -> None:
+        """Reescribe el archivo dejando solo los contactos vigentes (reemplazo atómico)."""
+        with self._candado.bloquear():
+            self._sincronizar()
+            datos = "".join(
+                formatear_linea(n, t) for n, t in self._por_nombre.items()
+            ).encode(CODIFICACION)
+            archivo_temporal = f"{self.ruta}.{os.getpid()}.tmp"
+            with open(archivo_temporal, "wb") as archivo:
+                archivo.write(datos)
+                if self.fsync != FSYNC_NUNCA:
+                    archivo.flush()
+                    os.fsync(archivo.fileno())
+            os.replace(archivo_temporal, self.ruta)
+            if self.fsync != FSYNC_NUNCA:
+                _fsync_carpeta(self.ruta)
+            self._candado.incrementar_generacion()
+            self._identidad = self._identidad_de(os.stat(self.ruta))
+            self._posicion = len(datos)
+            self._registros = len(self._por_nombre)
+
+    # ---------- Operaciones CRUD ----------
+
+    def crear(self, nombre: str, telefono: str) -> bool:
+        self._validar(nombre, telefono)
+        with self._candado.bloquear():
+            self._sincronizar()
+            if nombre in self._por_nombre or telefono in self._por_telefono:
+                return False
+            self._escribir_registros({nombre: telefono})
+        return True
+
+    def buscar(self, nombre: str) -> Optional[str]:
+        with self._candado.bloquear(exclusivo=False):
+            self._sincronizar()
+            return self._por_nombre.get(nombre)
+
+    def buscar_por_telefono(self, telefono: str) -> Optional[str]:
+        with self._candado.bloquear(exclusivo=False):
+            self._sincronizar()
+            return self._por_telefono.get(telefono)
+
+    def actualizar(self, nombre: str, nuevo_telefono: str) -> bool:
+        self._validar(nombre, nuevo_telefono)
+        with self._candado.bloquear():
+            self._sincronizar()
+            if nombre not in self._por_nombre:
+                return False
+            dueno = self._por_telefono.get(nuevo_telefono)
+            if dueno is not None and dueno != nombre:
+                raise ValueError("El número introducido ya pertenece a otro contacto.")
+            if dueno == nombre:
+                return True  # mismo teléfono: no hace falta otro registro
+            self._escribir_registros({nombre: nuevo_telefono})
+            self._compactar_si_hace_falta()
+        return True
+
+    def eliminar(self, nombre: str) -> bool:
+        with self._candado.bloquear():
+            self._sincronizar()
+            if nombre not in self._por_nombre:
+                return False
+            self._escribir_registros({nombre: ""})
+            self._compactar_si_hace_falta()
+        return True
+
+    # ---------- Importación masiva ----------
+
+    def importar(self, filas: Iterable[FilaContacto]) -> Tuple[int, List[FilaRechazada]]:
+        """
+        Los duplicados se detectan contra el archivo y dentro del mismo
+        lote con los índices en memoria, y todas las filas aceptadas se
+        escriben juntas al final.
+        """
+        with self._candado.bloquear():
+            self._sincronizar()
+            nuevas: Dict[str, str] = {}
+            telefonos_lote = set()
+            rechazadas: List[FilaRechazada] = []
+            for numero, nombre, telefono in self._filas_validas(filas, rechazadas):
+                if nombre in self._por_nombre or nombre in nuevas:
+                    rechazadas.append((numero, nombre, telefono, "El nombre ya existe."))
+                elif telefono in self._por_telefono or telefono in telefonos_lote:
+                    rechazadas.append((numero, nombre, telefono, "El número ya existe."))
+                else:
+                    nuevas[nombre] = telefono
+                    telefonos_lote.add(telefono)
+            if nuevas:
+                self._escribir_registros(nuevas)
+        return len(nuevas), rechazadas
+
+    # ---------- Consulta ----------
+
+    def indice_busqueda(self) -> IndiceBusqueda:
+        with self._candado.bloquear(exclusivo=False):
+            self._sincronizar()
+            return super().indice_busqueda()
+
+    def contactos(self) -> Iterator[Tuple[str, str]]:
+        with self._candado.bloquear(exclusivo=False):
+            self._sincronizar()
+            return iter(list(self._por_nombre.items()))
+
+    def __len__(self) -> int:
+        with self._candado.bloquear(exclusivo=False):
+            self._sincronizar()
+            return len(self._por_nombre)
+
+    def __contains__(self, nombre: object) -> bool:
+        return isinstance(nombre, str) and self.buscar(nombre) is not None
+
+
+def _fsync_carpeta(ruta: str) -> None:
+    """Fuerza al disco la entrada de directorio creada por ``os.replace`` (solo POSIX)."""
+    if os.name != "posix":
+        return
+    descriptor = os.open(os.path.dirname(os.path.abspath(ruta)), os.O_RDONLY)
+    try:
+        os.fsync(descriptor)
+    finally:
+        os.close(descriptor)
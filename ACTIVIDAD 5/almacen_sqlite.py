@@ -0,0 +1,119 @@
+"""
+Almacén de contactos sobre SQLite (módulo estándar ``sqlite3``).
+
+La tabla tiene índices únicos sobre el nombre y sobre el teléfono, de
+modo que las búsquedas y las comprobaciones de duplicados las resuelve
+el motor sin recorrer los datos. La base se abre en modo WAL para que
+las lecturas no se bloqueen mientras otro proceso escribe, y todas las
+consultas usan parámetros (``?``) para que sqlite3 reutilice las
+sentencias ya preparadas.
+"""
+
+import sqlite3
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from almacen_contactos import FilaContacto, FilaRechazada, RepositorioContactos
+
+_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS contactos (
+    id       INTEGER PRIMARY KEY,
+    nombre   TEXT NOT NULL,
+    telefono TEXT NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS ux_contactos_nombre ON contactos (nombre);
+CREATE UNIQUE INDEX IF NOT EXISTS ux_contactos_telefono ON contactos (telefono);
+"""
+
+_SQL_INSERTAR = "INSERT INTO contactos (nombre, telefono) VALUES (?, ?)"
+_SQL_TELEFONO = "SELECT telefono FROM contactos WHERE nombre = ?"
+_SQL_NOMBRE = "SELECT nombre FROM contactos WHERE telefono = ?"
+_SQL_ACTUALIZAR = "UPDATE contactos SET telefono = ? WHERE nombre = ?"
+_SQL_ELIMINAR = "DELETE FROM contactos WHERE nombre = ?"
+
+
+class AlmacenSQLite(RepositorioContactos):
+    """Contactos guardados en una base SQLite con índices únicos."""
+
+    def __init__(self, ruta: str) -> None:
+        super().__init__()
+        self.ruta = ruta
+        self._conexion = sqlite3.connect(ruta)
+        self._conexion.execute("PRAGMA journal_mode=WAL")
+        self._conexion.execute("PRAGMA synchronous=NORMAL")
+        self._conexion.executescript(_ESQUEMA)
+
+    def cerrar(self) -> None:
+        self._conexion.close()
+
+    def _consultar_uno(self, sql: str, valor: str) -> Optional[str]:
+        fila = self._conexion.execute(sql, (valor,)).fetchone()
+        return fila[0] if fila else None
+
+    # ---------- Operaciones CRUD ----------
+
+    def crear(self, nombre: str, telefono: str) -> bool:
+        self._validar(nombre, telefono)
+        try:
+            with self._conexion:
+                self._conexion.execute(_SQL_INSERTAR, (nombre, telefono))
+        except sqlite3.IntegrityError:
+            return False
+        self._indice_agregar(nombre, telefono)
+        return True
+
+    def buscar(self, nombre: str) -> Optional[str]:
+        return self._consultar_uno(_SQL_TELEFONO, nombre)
+
+    def buscar_por_telefono(self, telefono: str) -> Optional[str]:
+        return self._consultar_uno(_SQL_NOMBRE, telefono)
+
+    def actualizar(self, nombre: str, nuevo_telefono: str) -> bool:
+        self._validar(nombre, nuevo_telefono)
+        anterior = self.buscar(nombre)
+        if anterior is None:
+            return False
+        if anterior == nuevo_telefono:
+            return True
+        try:
+            with self._conexion:
+                self._conexion.execute(_SQL_ACTUALIZAR, (nuevo_telefono, nombre))
+        except sqlite3.IntegrityError:
+            raise ValueError("El número introducido ya pertenece a otro contacto.")
+        self._indice_cambiar_telefono(nombre, anterior, nuevo_telefono)
+        return True
+
+    def eliminar(self, nombre: str) -> bool:
+        telefono = self.buscar(nombre)
+        if telefono is None:
+            return False
+        with self._conexion:
+            self._conexion.execute(_SQL_ELIMINAR, (nombre,))
+        self._indice_quitar(nombre, telefono)
+        return True
+
+    # ---------- Importación masiva ----------
+
+    def importar(self, filas: Iterable[FilaContacto]) -> Tuple[int, List[FilaRechazada]]:
+        """Inserta todas las filas en una única transacción; los índices detectan duplicados."""
+        rechazadas: List[FilaRechazada] = []
+        importados: List[Tuple[str, str]] = []
+        with self._conexion:
+            for numero, nombre, telefono in self._filas_validas(filas, rechazadas):
+                try:
+                    self._conexion.execute(_SQL_INSERTAR, (nombre, telefono))
+                    importados.append((nombre, telefono))
+                except sqlite3.IntegrityError as e:
+                    motivo = "El nombre ya existe." if "nombre" in str(e) else "El número ya existe."
+                    rechazadas.append((numero, nombre, telefono, motivo))
+        # el índice se actualiza solo cuando la transacción quedó confirmada
+        for nombre, telefono in importados:
+            self._indice_agregar(nombre, telefono)
+        return len(importados), rechazadas
+
+    # ---------- Consulta ----------
+
+    def contactos(self) -> Iterator[Tuple[str, str]]:
+        return iter(self._conexion.execute("SELECT nombre, telefono FROM contactos ORDER BY id"))
+
+    def __len__(self) -> int:
+        return self._conexion.execute("SELECT COUNT(*) FROM contactos").fetchone()[0]
@@ -0,0 +1,255 @@
+"""
+Mediciones de rendimiento del almacén de contactos.
+
+Uso:
+    python benchmark_contactos.py importacion [--filas 100000] [--filas-lineal 5000]
+    python benchmark_contactos.py busqueda [--filas 100000] [--consultas 1000]
+    python benchmark_contactos.py concurrencia [--procesos 8] [--operaciones 2000] [--fsync compactar]
+    python benchmark_contactos.py binario [--filas 1000000] [--consultas 10000]
+
+``importacion`` compara la importación masiva (una sola pasada y una sola
+escritura) contra el ciclo anterior que llamaba a ``crear_contacto`` por
+cada fila releyendo todo el archivo. Como ese ciclo es O(n²), por defecto
+se mide con menos filas y se extrapola el tiempo para ``--filas``.
+
+``busqueda`` mide el tiempo por consulta de la búsqueda por prefijo y de
+la búsqueda aproximada (una edición de distancia) sobre el índice trie.
+
+``concurrencia`` lanza varios procesos que crean, actualizan y eliminan
+contactos sobre el mismo archivo al mismo tiempo, mide las operaciones
+por segundo y comprueba al final que no se perdió ninguna escritura.
+
+``binario`` compara una búsqueda por nombre recorriendo el texto (como
+la versión original), abrir el almacén indexado y buscar, y buscar en el
+formato binario proyectado en memoria.
+"""
+
+import argparse
+import multiprocessing
+import os
+import random
+import tempfile
+import time
+
+from almacen_contactos import POLITICAS_FSYNC, AlmacenContactos
+from busqueda_contactos import IndiceBusqueda
+from contactos_binarios import ContactosBinarios, convertir_texto_a_binario
+
+_SILABAS = ("ma", "ri", "a", "jo", "se", "lu", "is", "car", "los", "an",
+            "dre", "pe", "dro", "gon", "za", "lez", "ro", "dri", "guez")
+
+
+def generar_filas(cantidad: int):
+    for i in range(cantidad):
+        yield f"contacto{i:07d}", f"3{i:09d}"
+
+
+def _crear_contacto_lineal(ruta: str, nombre_nuevo: str, telefono: str) -> str:
+    """Copia de la versión original de ``crear_contacto`` (relee el archivo en cada llamada)."""
+    with open(ruta, "a+") as archivo:
+        archivo.seek(0)
+        lineas = archivo.readlines()
+        for linea in lineas:
+            if "!" in linea:
+                nombre_existente, telefono_existente = linea.strip().split("!")
+                if nombre_nuevo == nombre_existente or telefono_existente == telefono:
+                    return "El nombre o número introducido ya existe."
+        archivo.write(f"{nombre_nuevo}!{telefono}\n")
+    return "Contacto creado exitosamente."
+
+
+def medir(funcion, *args) -> float:
+    inicio = time.perf_counter()
+    funcion(*args)
+    return time.perf_counter() - inicio
+
+
+def benchmark_importacion(filas: int, filas_lineal: int) -> None:
+    with tempfile.TemporaryDirectory() as carpeta:
+        ruta_lote = os.path.join(carpeta, "lote.txt")
+        ruta_lineal = os.path.join(carpeta, "lineal.txt")
+
+        def importar_lote():
+            importados, rechazados = AlmacenContactos(ruta_lote).importar(generar_filas(filas))
+            assert importados == filas and not rechazados
+
+        def importar_lineal():
+            for nombre, telefono in generar_filas(filas_lineal):
+                _crear_contacto_lineal(ruta_lineal, nombre, telefono)
+
+        t_lote = medir(importar_lote)
+        t_lineal = medir(importar_lineal)
+
+    # El ciclo original es cuadrático: t(n) ~ t(m) * (n / m)²
+    t_estimado = t_lineal * (filas / filas_lineal) ** 2
+    print(f"Importación masiva ({filas} filas): {t_lote:.3f} s")
+    print(f"crear_contacto por fila ({filas_lineal} filas): {t_lineal:.3f} s")
+    if filas_lineal != filas:
+        print(f"crear_contacto por fila ({filas} filas, estimado): {t_estimado:.1f} s")
+    print(f"Aceleración aproximada: {t_estimado / t_lote:.0f}x")
+
+
+def generar_nombres(cantidad: int, semilla: int = 1):
+    """Nombres aleatorios pero parecidos entre sí, como en una agenda real."""
+    azar = random.Random(semilla)
+    nombres = set()
+    while len(nombres) < cantidad:
+        partes = (
+            "".join(azar.choice(_SILABAS) for _ in range(azar.randint(2, 4)))
+            for _ in range(2)
+        )
+        nombres.add(" ".join(partes).title())
+    return list(nombres)
+
+
+def benchmark_busqueda(filas: int, consultas: int) -> None:
+    nombres = generar_nombres(filas)
+    inicio = time.perf_counter()
+    indice = IndiceBusqueda((n, f"3{i:09d}") for i, n in enumerate(nombres))
+    print(f"Construcción del índice ({filas} contactos): {time.perf_counter() - inicio:.2f} s")
+
+    azar = random.Random(2)
+    muestra = azar.sample(nombres, min(consultas, len(nombres)))
+    pruebas = [
+        ("prefijo (3 letras)", lambda n: indice.por_prefijo(n[:3], 10)),
+        ("prefijo de teléfono", lambda n: indice.por_prefijo_telefono("30000", 10)),
+        ("aproximada (1 error)", lambda n: indice.aproximados(n[:-1] + "x", 1, 10)),
+    ]
+    for descripcion, consulta in pruebas:
+        inicio = time.perf_counter()
+        for nombre in muestra:
+            consulta(nombre)
+        promedio = (time.perf_counter() - inicio) / len(muestra) * 1000
+        print(f"Búsqueda {descripcion}: {promedio:.3f} ms por consulta")
+
+
+def _escritor(ruta: str, proceso: int, operaciones: int, fsync: str):
+    """Trabajo de cada proceso; devuelve los contactos que deberían quedar."""
+    almacen = AlmacenContactos(ruta, ratio_basura=0.3, fsync=fsync)
+    esperados = {}
+    hechas = 0
+    i = 0
+    while hechas < operaciones:
+        nombre = f"p{proceso}-{i}"
+        almacen.crear(nombre, f"{proceso}-{i}-0")
+        esperados[nombre] = f"{proceso}-{i}-0"
+        hechas += 1
+        if i % 3 == 0:
+            almacen.actualizar(nombre, f"{proceso}-{i}-1")
+            esperados[nombre] = f"{proceso}-{i}-1"
+            hechas += 1
+        if i % 5 == 0:
+            almacen.eliminar(nombre)
+            del esperados[nombre]
+            hechas += 1
+        i += 1
+    almacen.cerrar()
+    return hechas, esperados
+
+
+def benchmark_concurrencia(procesos: int, operaciones: int, fsync: str) -> None:
+    with tempfile.TemporaryDirectory() as carpeta:
+        ruta = os.path.join(carpeta, "contacto.txt")
+        tareas = [(ruta, p, operaciones, fsync) for p in range(procesos)]
+        inicio = time.perf_counter()
+        with multiprocessing.Pool(procesos) as pool:
+            resultados = pool.starmap(_escritor, tareas)
+        duracion = time.perf_counter() - inicio
+
+        esperados = {}
+        for _, parcial in resultados:
+            esperados.update(parcial)
+        final = dict(AlmacenContactos(ruta).contactos())
+
+    total = sum(hechas for hechas, _ in resultados)
+    perdidos = {n for n in esperados if final.get(n) != esperados[n]}
+    sobrantes = set(final) - set(esperados)
+    print(f"{procesos} procesos, {total} operaciones, fsync={fsync}: {duracion:.2f} s "
+          f"({total / duracion:.0f} operaciones/s)")
+    print(f"Contactos esperados: {len(esperados)}, en el archivo: {len(final)}")
+    print(f"Escrituras perdidas: {len(perdidos)}, registros inesperados: {len(sobrantes)}")
+
+
+def _buscar_lineal(ruta: str, nombre_a_buscar: str):
+    """Copia de la búsqueda original: recorre y separa todas las líneas."""
+    with open(ruta, "r") as archivo:
+        for linea in archivo:
+            if "!" in linea:
+                nombre, telefono = linea.strip().split("!")
+                if nombre == nombre_a_buscar:
+                    return telefono
+    return None
+
+
+def benchmark_binario(filas: int, consultas: int) -> None:
+    azar = random.Random(3)
+    with tempfile.TemporaryDirectory() as carpeta:
+        ruta_texto = os.path.join(carpeta, "contacto.txt")
+        ruta_binaria = os.path.join(carpeta, "contacto.ctb")
+        with open(ruta_texto, "w") as archivo:
+            archivo.writelines(f"{n}!{t}\n" for n, t in generar_filas(filas))
+        inicio = time.perf_counter()
+        convertir_texto_a_binario(ruta_texto, ruta_binaria)
+        print(f"Conversión a binario ({filas} contactos): {time.perf_counter() - inicio:.2f} s")
+
+        nombres = [f"contacto{azar.randrange(filas):07d}" for _ in range(consultas)]
+
+        lineales = nombres[:20]
+        inicio = time.perf_counter()
+        for nombre in lineales:
+            _buscar_lineal(ruta_texto, nombre)
+        t_lineal = (time.perf_counter() - inicio) / len(lineales)
+
+        inicio = time.perf_counter()
+        almacen = AlmacenContactos(ruta_texto)
+        t_carga = time.perf_counter() - inicio
+        almacen.cerrar()
+
+        inicio = time.perf_counter()
+        with ContactosBinarios(ruta_binaria) as binarios:
+            t_apertura = time.perf_counter() - inicio
+            inicio = time.perf_counter()
+            for nombre in nombres:
+                assert binarios.buscar(nombre) is not None
+            t_binaria = (time.perf_counter() - inicio) / len(nombres)
+
+    print(f"Búsqueda recorriendo el texto: {t_lineal * 1000:.1f} ms por consulta")
+    print(f"Carga del almacén indexado (texto): {t_carga:.2f} s")
+    print(f"Apertura del binario con mmap: {t_apertura * 1000:.2f} ms")
+    print(f"Búsqueda binaria sobre mmap: {t_binaria * 1e6:.1f} µs por consulta")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    sub = parser.add_subparsers(dest="prueba", required=True)
+
+    p_imp = sub.add_parser("importacion", help="importación masiva vs. crear_contacto por fila")
+    p_imp.add_argument("--filas", type=int, default=100_000)
+    p_imp.add_argument("--filas-lineal", type=int, default=5_000)
+
+    p_bus = sub.add_parser("busqueda", help="búsqueda por prefijo y aproximada en el trie")
+    p_bus.add_argument("--filas", type=int, default=100_000)
+    p_bus.add_argument("--consultas", type=int, default=1_000)
+
+    p_con = sub.add_parser("concurrencia", help="varios procesos escribiendo el mismo archivo")
+    p_con.add_argument("--procesos", type=int, default=8)
+    p_con.add_argument("--operaciones", type=int, default=2_000, help="operaciones por proceso")
+    p_con.add_argument("--fsync", choices=POLITICAS_FSYNC, default=POLITICAS_FSYNC[1])
+
+    p_bin = sub.add_parser("binario", help="búsqueda en texto vs. formato binario con mmap")
+    p_bin.add_argument("--filas", type=int, default=1_000_000)
+    p_bin.add_argument("--consultas", type=int, default=10_000)
+
+    args = parser.parse_args()
+    if args.prueba == "importacion":
+        benchmark_importacion(args.filas, args.filas_lineal)
+    elif args.prueba == "busqueda":
+        benchmark_busqueda(args.filas, args.consultas)
+    elif args.prueba == "concurrencia":
+        benchmark_concurrencia(args.procesos, args.operaciones, args.fsync)
+    elif args.prueba == "binario":
+        benchmark_binario(args.filas, args.consultas)
+
+
+if __name__ == "__main__":
+    main()
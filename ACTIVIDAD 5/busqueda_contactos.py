@@ -0,0 +1,217 @@
+"""
+Búsqueda incremental de contactos con árboles de prefijos (tries).
+
+``IndiceBusqueda`` mantiene un trie sobre los nombres y otro sobre los
+teléfonos. Con ellos la interfaz puede sugerir contactos mientras se
+escribe (búsqueda por prefijo) y tolerar errores de tipeo (búsqueda
+aproximada con distancia de edición acotada) sin releer el archivo en
+cada tecla. Los nombres se comparan sin distinguir mayúsculas.
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+def normalizar(texto: str) -> str:
+    return texto.casefold()
+
+
+class _Nodo:
+    __slots__ = ("etiqueta", "hijos", "valores")
+
+    def __init__(self, etiqueta: str = "") -> None:
+        self.etiqueta = etiqueta                         # texto de la arista que llega al nodo
+        self.hijos: Optional[Dict[str, "_Nodo"]] = None  # por primer carácter de la etiqueta
+        self.valores: Tuple[str, ...] = ()               # contactos cuya clave termina aquí
+
+
+def _prefijo_comun(a: str, b: str) -> int:
+    n = min(len(a), len(b))
+    i = 0
+    while i < n and a[i] == b[i]:
+        i += 1
+    return i
+
+
+class Trie:
+    """
+    Árbol de prefijos compacto (radix) que asocia claves con nombres de contacto.
+
+    Las cadenas de nodos con un solo hijo se fusionan en una arista con
+    varias letras, lo que reduce mucho la cantidad de nodos (y de memoria)
+    cuando las claves son casi todas distintas, como los nombres.
+    """
+
+    def __init__(self) -> None:
+        self._raiz = _Nodo()
+        self._tamanio = 0
+
+    def __len__(self) -> int:
+        return self._tamanio
+
+    def insertar(self, clave: str, valor: str) -> None:
+        nodo = self._raiz
+        i = 0
+        while i < len(clave):
+            if nodo.hijos is None:
+                nodo.hijos = {}
+            hijo = nodo.hijos.get(clave[i])
+            if hijo is None:
+                hoja = nodo.hijos[clave[i]] = _Nodo(clave[i:])
+                nodo, i = hoja, len(clave)
+                break
+            comun = _prefijo_comun(hijo.etiqueta, clave[i:])
+            if comun < len(hijo.etiqueta):
+                # la clave se separa a mitad de la arista: se parte en dos
+                intermedio = _Nodo(hijo.etiqueta[:comun])
+                hijo.etiqueta = hijo.etiqueta[comun:]
+                intermedio.hijos = {hijo.etiqueta[0]: hijo}
+                nodo.hijos[clave[i]] = intermedio
+                hijo = intermedio
+            nodo = hijo
+            i += comun
+        if valor not in nodo.valores:
+            nodo.valores += (valor,)
+            self._tamanio += 1
+
+    def eliminar(self, clave: str, valor: str) -> bool:
+        """Quita ``valor`` de ``clave`` y vuelve a compactar las ramas afectadas."""
+        padre: Optional[_Nodo] = None
+        nodo = self._raiz
+        i = 0
+        while i < len(clave):
+            hijo = nodo.hijos.get(clave[i]) if nodo.hijos else None
+            if hijo is None or not clave.startswith(hijo.etiqueta, i):
+                return False
+            padre, nodo = nodo, hijo
+            i += len(hijo.etiqueta)
+        if valor not in nodo.valores:
+            return False
+        nodo.valores = tuple(v for v in nodo.valores if v != valor)
+        self._tamanio -= 1
+
+        if padre is None or nodo.valores:
+            return True
+        if not nodo.hijos:
+            del padre.hijos[nodo.etiqueta[0]]
+            if not padre.hijos:
+                padre.hijos = None
+            nodo = padre
+        if nodo is not self._raiz and not nodo.valores and nodo.hijos and len(nodo.hijos) == 1:
+            (hijo,) = nodo.hijos.values()
+            nodo.etiqueta += hijo.etiqueta
+            nodo.hijos = hijo.hijos
+            nodo.valores = hijo.valores
+        return True
+
+    def con_prefijo(self, prefijo: str, limite: int = 20) -> List[str]:
+        """Valores cuyas claves empiezan por ``prefijo``, en orden alfabético."""
+        nodo = self._raiz
+        i = 0
+        while i < len(prefijo):
+            hijo = nodo.hijos.get(prefijo[i]) if nodo.hijos else None
+            if hijo is None:
+                return []
+            resto = prefijo[i:]
+            if not (resto.startswith(hijo.etiqueta) or hijo.etiqueta.startswith(resto)):
+                return []
+            nodo = hijo
+            i += len(hijo.etiqueta)
+
+        resultado: List[str] = []
+        pila = [nodo]
+        while pila and len(resultado) < limite:
+            actual = pila.pop()
+            resultado.extend(sorted(actual.valores))
+            if actual.hijos:
+                # se apilan al revés para visitar los hijos en orden alfabético
+                pila.extend(actual.hijos[c] for c in sorted(actual.hijos, reverse=True))
+        return resultado[:limite]
+
+    def aproximados(
+        self, clave: str, max_distancia: int = 1, limite: int = 20
+    ) -> List[Tuple[int, str]]:
+        """
+        Valores cuya clave está a distancia de Levenshtein <= ``max_distancia``.
+
+        Recorre el trie calculando una fila de la matriz de distancias por
+        letra y descarta las ramas cuya distancia mínima ya supera el
+        máximo, así que solo se visita una fracción pequeña del árbol.
+        De cada fila solo se calcula la franja diagonal de ancho
+        ``2 * max_distancia + 1``; fuera de ella la distancia ya es mayor.
+        """
+        largo = len(clave)
+        fuera = max_distancia + 1  # cualquier valor mayor al máximo sirve
+        resultado: List[Tuple[int, str]] = []
+        if self._raiz.valores and largo <= max_distancia:
+            resultado.extend((largo, v) for v in self._raiz.valores)
+        primera = [min(j, fuera) for j in range(largo + 1)]
+        pila = [(self._raiz, primera, 0)]
+        while pila:
+            nodo, fila, profundidad = pila.pop()
+            if not nodo.hijos:
+                continue
+            for hijo in nodo.hijos.values():
+                fila_hijo, fila_prof = fila, profundidad
+                for letra in hijo.etiqueta:
+                    anterior = fila_hijo
+                    fila_prof += 1
+                    fila_hijo = [fuera] * (largo + 1)
+                    desde = max(1, fila_prof - max_distancia)
+                    hasta = min(largo, fila_prof + max_distancia)
+                    if desde == 1:
+                        fila_hijo[0] = min(fila_prof, fuera)
+                    minimo = fila_hijo[0]
+                    for j in range(desde, hasta + 1):
+                        valor = min(
+                            fila_hijo[j - 1] + 1,
+                            anterior[j] + 1,
+                            anterior[j - 1] + (clave[j - 1] != letra),
+                        )
+                        fila_hijo[j] = valor
+                        if valor < minimo:
+                            minimo = valor
+                    if minimo > max_distancia:
+                        break
+                else:
+                    if hijo.valores and fila_hijo[largo] <= max_distancia:
+                        resultado.extend((fila_hijo[largo], v) for v in hijo.valores)
+                    pila.append((hijo, fila_hijo, fila_prof))
+        resultado.sort()
+        return resultado[:limite]
+
+
+class IndiceBusqueda:
+    """Tries de nombres y teléfonos sincronizados con un almacén de contactos."""
+
+    def __init__(self, contactos: Iterable[Tuple[str, str]] = ()) -> None:
+        self._nombres = Trie()
+        self._telefonos = Trie()
+        for nombre, telefono in contactos:
+            self.agregar(nombre, telefono)
+
+    def __len__(self) -> int:
+        return len(self._nombres)
+
+    def agregar(self, nombre: str, telefono: str) -> None:
+        self._nombres.insertar(normalizar(nombre), nombre)
+        self._telefonos.insertar(telefono, nombre)
+
+    def quitar(self, nombre: str, telefono: str) -> None:
+        self._nombres.eliminar(normalizar(nombre), nombre)
+        self._telefonos.eliminar(telefono, nombre)
+
+    def cambiar_telefono(self, nombre: str, anterior: str, nuevo: str) -> None:
+        self._telefonos.eliminar(anterior, nombre)
+        self._telefonos.insertar(nuevo, nombre)
+
+    def por_prefijo(self, prefijo: str, limite: int = 20) -> List[str]:
+        """Nombres de contactos cuyo nombre empieza por ``prefijo``."""
+        return self._nombres.con_prefijo(normalizar(prefijo), limite)
+
+    def por_prefijo_telefono(self, prefijo: str, limite: int = 20) -> List[str]:
+        """Nombres de contactos cuyo teléfono empieza por ``prefijo``."""
+        return self._telefonos.con_prefijo(prefijo, limite)
+
+    def aproximados(self, texto: str, max_distancia: int = 1, limite: int = 20) -> List[str]:
+        """Nombres parecidos a ``texto`` (tolerando ``max_distancia`` errores), del más cercano al más lejano."""
+        return [v for _, v in self._nombres.aproximados(normalizar(texto), max_distancia, limite)]
@@ -0,0 +1,113 @@
+"""
+Candados entre procesos sobre un archivo auxiliar (``<archivo>.lock``).
+
+En sistemas POSIX se usa ``fcntl.flock`` con candados compartidos (para
+leer) y exclusivos (para escribir). En Windows se usa ``msvcrt.locking``,
+que solo ofrece candados exclusivos. El candado se toma sobre un archivo
+aparte y no sobre los datos porque los datos se reemplazan con
+``os.replace`` al compactar, y un candado sobre el archivo viejo dejaría
+de proteger al nuevo.
+
+El archivo del candado guarda además un contador de generación que
+sube cada vez que los datos se reemplazan. Así un proceso detecta que
+otro compactó aunque el sistema haya reutilizado el mismo número de
+inodo para el archivo nuevo.
+"""
+
+import os
+import struct
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+_GENERACION = struct.Struct("<Q")
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+
+
+class CandadoArchivo:
+    """Candado reentrante (dentro del mismo objeto) entre procesos."""
+
+    def __init__(self, ruta: str) -> None:
+        self.ruta = ruta
+        self._descriptor: Optional[int] = None
+        self._nivel = 0          # cuántas veces está tomado por este objeto
+        self._exclusivo = False
+
+    def _abrir(self) -> int:
+        if self._descriptor is None:
+            self._descriptor = os.open(self.ruta, os.O_RDWR | os.O_CREAT, 0o644)
+        return self._descriptor
+
+    def _tomar(self, exclusivo: bool) -> None:
+        descriptor = self._abrir()
+        if fcntl is not None:
+            fcntl.flock(descriptor, fcntl.LOCK_EX if exclusivo else fcntl.LOCK_SH)
+        elif msvcrt is not None:
+            os.lseek(descriptor, 0, os.SEEK_SET)
+            while True:
+                try:
+                    msvcrt.locking(descriptor, msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:  # LK_LOCK se rinde después de 10 intentos
+                    continue
+
+    def _soltar(self) -> None:
+        if fcntl is not None:
+            fcntl.flock(self._descriptor, fcntl.LOCK_UN)
+        elif msvcrt is not None:
+            os.lseek(self._descriptor, 0, os.SEEK_SET)
+            msvcrt.locking(self._descriptor, msvcrt.LK_UNLCK, 1)
+
+    @contextmanager
+    def bloquear(self, exclusivo: bool = True) -> Iterator[None]:
+        """
+        Toma el candado mientras dura el bloque ``with``.
+
+        Si el objeto ya tiene el candado el bloque se ejecuta sin volver a
+        pedirlo; no se permite pasar de compartido a exclusivo anidando.
+        """
+        if self._nivel:
+            if exclusivo and not self._exclusivo:
+                raise RuntimeError("No se puede pasar de candado compartido a exclusivo.")
+            self._nivel += 1
+            try:
+                yield
+            finally:
+                self._nivel -= 1
+            return
+
+        self._tomar(exclusivo)
+        self._nivel, self._exclusivo = 1, exclusivo
+        try:
+            yield
+        finally:
+            self._nivel = 0
+            self._soltar()
+
+    def generacion(self) -> int:
+        """Contador de reemplazos guardado en el archivo del candado (llamar con el candado tomado)."""
+        descriptor = self._abrir()
+        os.lseek(descriptor, 0, os.SEEK_SET)
+        datos = os.read(descriptor, _GENERACION.size)
+        return _GENERACION.unpack(datos)[0] if len(datos) == _GENERACION.size else 0
+
+    def incrementar_generacion(self) -> int:
+        """Sube el contador de reemplazos (llamar con el candado exclusivo tomado)."""
+        nueva = self.generacion() + 1
+        descriptor = self._abrir()
+        os.lseek(descriptor, 0, os.SEEK_SET)
+        os.write(descriptor, _GENERACION.pack(nueva))
+        return nueva
+
+    def cerrar(self) -> None:
+        if self._descriptor is not None:
+            os.close(self._descriptor)
+            self._descriptor = None
@@ -0,0 +1,182 @@
+"""
+Formato binario de registros fijos para consultas de solo lectura.
+
+El archivo tiene una cabecera pequeña seguida de los contactos ordenados
+por nombre, cada uno en un registro de tamaño fijo (nombre y teléfono en
+UTF-8 rellenados con bytes nulos). Para buscar se proyecta el archivo en
+memoria con ``mmap`` y se hace búsqueda binaria sobre los registros, de
+modo que no se interpreta ninguna línea de texto y la memoria usada no
+depende del tamaño del archivo.
+
+Uso desde la línea de comandos:
+    python contactos_binarios.py a-binario contacto.txt contacto.ctb
+    python contactos_binarios.py a-texto contacto.ctb contacto.txt
+"""
+
+import argparse
+import mmap
+import os
+import struct
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from almacen_contactos import AlmacenContactos, formatear_linea
+
+MAGIA = b"CTB1"
+VERSION = 1
+# magia, versión, ancho del nombre, ancho del teléfono, cantidad de registros
+CABECERA = struct.Struct("<4sHHHQ")
+
+
+class ContactosBinarios:
+    """Lector de un archivo de contactos binario proyectado en memoria."""
+
+    def __init__(self, ruta: str) -> None:
+        self.ruta = ruta
+        self._archivo = open(ruta, "rb")
+        try:
+            self._mapa = mmap.mmap(self._archivo.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # archivo vacío
+            self._archivo.close()
+            raise ValueError(f"{ruta} no es un archivo de contactos binario.")
+
+        if len(self._mapa) < CABECERA.size:
+            self.cerrar()
+            raise ValueError(f"{ruta} no es un archivo de contactos binario.")
+        magia, version, self.ancho_nombre, self.ancho_telefono, self._cantidad = \
+            CABECERA.unpack_from(self._mapa, 0)
+        if magia != MAGIA or version != VERSION:
+            self.cerrar()
+            raise ValueError(f"{ruta} no es un archivo de contactos binario (versión {VERSION}).")
+        self._ancho_registro = self.ancho_nombre + self.ancho_telefono
+        if len(self._mapa) != CABECERA.size + self._cantidad * self._ancho_registro:
+            self.cerrar()
+            raise ValueError(f"{ruta} está incompleto o dañado.")
+
+    def cerrar(self) -> None:
+        if getattr(self, "_mapa", None) is not None:
+            self._mapa.close()
+            self._mapa = None
+        self._archivo.close()
+
+    def __enter__(self) -> "ContactosBinarios":
+        return self
+
+    def __exit__(self, *_excepcion) -> None:
+        self.cerrar()
+
+    def __len__(self) -> int:
+        return self._cantidad
+
+    # ---------- Acceso a registros ----------
+
+    def _nombre_bytes(self, posicion: int) -> bytes:
+        inicio = CABECERA.size + posicion * self._ancho_registro
+        return self._mapa[inicio:inicio + self.ancho_nombre]
+
+    def _registro(self, posicion: int) -> Tuple[str, str]:
+        inicio = CABECERA.size + posicion * self._ancho_registro
+        datos = self._mapa[inicio:inicio + self._ancho_registro]
+        nombre = datos[:self.ancho_nombre].rstrip(b"\0").decode("utf-8")
+        telefono = datos[self.ancho_nombre:].rstrip(b"\0").decode("utf-8")
+        return nombre, telefono
+
+    def _primera_posicion(self, clave: bytes) -> int:
+        """Primer registro cuyo nombre (relleno) es >= ``clave`` (búsqueda binaria)."""
+        bajo, alto = 0, self._cantidad
+        while bajo < alto:
+            medio = (bajo + alto) // 2
+            if self._nombre_bytes(medio) < clave:
+                bajo = medio + 1
+            else:
+                alto = medio
+        return bajo
+
+    # ---------- Consultas ----------
+
+    def buscar(self, nombre: str) -> Optional[str]:
+        """Devuelve el teléfono del contacto o None si no existe (O(log n))."""
+        clave = nombre.encode("utf-8")
+        if len(clave) > self.ancho_nombre:
+            return None
+        clave = clave.ljust(self.ancho_nombre, b"\0")
+        posicion = self._primera_posicion(clave)
+        if posicion < self._cantidad and self._nombre_bytes(posicion) == clave:
+            return self._registro(posicion)[1]
+        return None
+
+    def buscar_prefijo(self, prefijo: str, limite: int = 20) -> List[Tuple[str, str]]:
+        """Contactos cuyo nombre empieza por ``prefijo`` (distingue mayúsculas)."""
+        clave = prefijo.encode("utf-8")
+        resultado: List[Tuple[str, str]] = []
+        posicion = self._primera_posicion(clave)
+        while posicion < self._cantidad and len(resultado) < limite:
+            if not self._nombre_bytes(posicion).startswith(clave):
+                break
+            resultado.append(self._registro(posicion))
+            posicion += 1
+        return resultado
+
+    def __iter__(self) -> Iterator[Tuple[str, str]]:
+        for posicion in range(self._cantidad):
+            yield self._registro(posicion)
+
+
+# ==========================
+#  CONVERSIÓN ENTRE FORMATOS
+# ==========================
+
+def escribir_binario(contactos: Iterable[Tuple[str, str]], destino: str) -> int:
+    """Escribe ``contactos`` en formato binario ordenado y devuelve cuántos se escribieron."""
+    registros = sorted((n.encode("utf-8"), t.encode("utf-8")) for n, t in contactos)
+    ancho_nombre = max((len(n) for n, _ in registros), default=1)
+    ancho_telefono = max((len(t) for _, t in registros), default=1)
+    if ancho_nombre > 0xFFFF or ancho_telefono > 0xFFFF:
+        raise ValueError("Hay nombres o teléfonos demasiado largos para el formato binario.")
+
+    archivo_temporal = destino + ".tmp"
+    with open(archivo_temporal, "wb") as archivo:
+        archivo.write(CABECERA.pack(MAGIA, VERSION, ancho_nombre, ancho_telefono, len(registros)))
+        archivo.write(b"".join(
+            n.ljust(ancho_nombre, b"\0") + t.ljust(ancho_telefono, b"\0")
+            for n, t in registros
+        ))
+    os.replace(archivo_temporal, destino)
+    return len(registros)
+
+
+def convertir_texto_a_binario(origen: str, destino: str) -> int:
+    """Convierte un archivo ``nombre!telefono`` (con su registro de cambios) a binario."""
+    almacen = AlmacenContactos(origen)
+    try:
+        return escribir_binario(almacen.contactos(), destino)
+    finally:
+        almacen.cerrar()
+
+
+def convertir_binario_a_texto(origen: str, destino: str) -> int:
+    """Convierte un archivo binario al formato de texto ``nombre!telefono``."""
+    with ContactosBinarios(origen) as contactos:
+        archivo_temporal = destino + ".tmp"
+        with open(archivo_temporal, "w") as archivo:
+            for nombre, telefono in contactos:
+                archivo.write(formatear_linea(nombre, telefono))
+        os.replace(archivo_temporal, destino)
+        return len(contactos)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Conversión entre contacto.txt y el formato binario.")
+    parser.add_argument("direccion", choices=("a-binario", "a-texto"))
+    parser.add_argument("origen")
+    parser.add_argument("destino")
+    args = parser.parse_args()
+
+    if args.direccion == "a-binario":
+        cantidad = convertir_texto_a_binario(args.origen, args.destino)
+    else:
+        cantidad = convertir_binario_a_texto(args.origen, args.destino)
+    print(f"Se convirtieron {cantidad} contactos a {args.destino}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,82 +1,20 @@
+import argparse
 import tkinter as tk
-from tkinter import messagebox
-import os
-
-#crea el contacto
-nombre_archivo = "contacto.txt"
-
-def crear_contacto(nombre_nuevo, telefono):
-    with open(nombre_archivo, "a+") as archivo:
-        archivo.seek(0)
-        lineas = archivo.readlines()
-        for linea in lineas:
-            if "!" in linea:
-                nombre_existente, telefono_existente = linea.strip().split("!")
-                if nombre_nuevo == nombre_existente or telefono_existente == telefono:
-                    return "El nombre o número introducido ya existe."
-        archivo.write(f"{nombre_nuevo}!{telefono}\n")
-    return "Contacto creado exitosamente."
-
-#lea el contacto donde abre el archivo y lee su contenido
-def buscar_contacto_en_archivo(nombre_a_buscar):
-    try:
-        with open(nombre_archivo, "r") as archivo:
-            for linea in archivo:
-                if "!" in linea:
-                    nombre_en_archivo, telefono_en_archivo = linea.strip().split("!")
-                    if nombre_en_archivo == nombre_a_buscar:
-                        return f"Nombre: {nombre_en_archivo}\nTeléfono: {telefono_en_archivo}"
-    except FileNotFoundError:
-        return None
-    return None
-
-#para actualizar contacto
-def actualizar_contacto(nombre_a_actualizar, nuevo_telefono):
-    archivo_temporal = nombre_archivo + ".tmp"
-    contacto_encontrado = False
-    try:
-        with open(nombre_archivo, "r") as archivo_original, open(archivo_temporal, "w") as archivo_temp:
-            for linea in archivo_original:
-                if "!" in linea:
-                    nombre_en_archivo, _ = linea.strip().split("!")
-                    if nombre_en_archivo == nombre_a_actualizar:
-                        archivo_temp.write(f"{nombre_a_actualizar}!{nuevo_telefono}\n")
-                        contacto_encontrado = True
-                    else:
-                        archivo_temp.write(linea)
-    except FileNotFoundError:
-        return False
-    
-    if contacto_encontrado:
-        os.remove(nombre_archivo)
-        os.rename(archivo_temporal, nombre_archivo)
-    else:
-        os.remove(archivo_temporal)
-    return contacto_encontrado
-
-#para eliminar un contacto
-def eliminar_contacto(nombre_a_eliminar):
-    archivo_temporal = nombre_archivo + ".tmp"
-    contacto_encontrado = False
-    try:
-        #abrir el arcihvo original pra leer y el temporal para escribir
-        with open(nombre_archivo, "r") as archivo_original, open(archivo_temporal, "w") as archivo_temp:
-            for linea in archivo_original:
-                if "!" in linea:
-                    nombre_en_archivo, _ = linea.strip().split("!")
-                    if nombre_en_archivo != nombre_a_eliminar:
-                        archivo_temp.write(linea)
-                    else:
-                        contacto_encontrado = True
-    except FileNotFoundError:
-        return False
-    
-    if contacto_encontrado:
-        os.remove(nombre_archivo) #borrar el arcivo viejo
-        os.rename(archivo_temporal, nombre_archivo)
-    else:
-        os.remove(archivo_temporal)
-    return contacto_encontrado
+from tkinter import messagebox, filedialog
+
+import agenda_contactos
+from agenda_contactos import (
+    ALMACENES,
+    actualizar_contacto,
+    buscar_contacto_en_archivo,
+    crear_contacto,
+    eliminar_contacto,
+    exportar_contactos,
+    importar_contactos,
+    obtener_repositorio,
+    sugerir_contactos,
+    sugerir_por_telefono,
+)
 
 #clase de la ventana principal
 
@@ -86,7 +24,7 @@ class VentanaPrincipal(tk.Tk):
 
         #Configuracion de la ventana
         self.title("Contactos")
-        self.geometry("360x160")
+        self.geometry("360x340")
         self.resizable(False, False)
         
         self.crear_widgets()
@@ -129,6 +67,26 @@ class VentanaPrincipal(tk.Tk):
         boton_limpiar = tk.Button(frame_boton, text="Limpiar", command=self.accion_limpiar_campos)
         boton_limpiar.pack(side="left", padx=5)
 
+        frame_archivo = tk.Frame(self)
+        frame_archivo.grid(row=3, column=0, columnspan=2)
+
+        #botones para importar y exportar en bloque
+        boton_importar = tk.Button(frame_archivo, text="Importar...", command=self.accion_importar_contactos)
+        boton_importar.pack(side="left", padx=5)
+
+        boton_exportar = tk.Button(frame_archivo, text="Exportar...", command=self.accion_exportar_contactos)
+        boton_exportar.pack(side="left", padx=5)
+
+        #lista de sugerencias que se actualiza al escribir
+        label_sugerencias = tk.Label(self, text="Sugerencias:")
+        label_sugerencias.grid(row=4, column=0, padx=10, pady=(10, 0), sticky="nw")
+        self.lista_sugerencias = tk.Listbox(self, width=35, height=7)
+        self.lista_sugerencias.grid(row=4, column=1, padx=10, pady=(10, 0))
+        self.lista_sugerencias.bind("<<ListboxSelect>>", self.accion_elegir_sugerencia)
+
+        self.entry_nombre.bind("<KeyRelease>", self.accion_sugerir_por_nombre)
+        self.entry_telefono.bind("<KeyRelease>", self.accion_sugerir_por_telefono)
+
     def accion_crear_contacto(self):
         nombre = self.entry_nombre.get()
         telefono = self.entry_telefono.get()
@@ -164,7 +122,11 @@ class VentanaPrincipal(tk.Tk):
             messagebox.showerror("Campos vacíos", "Para actulizar, ingrese el nombre del contacto y el nuevo teléfono.")
             return
         
-        fue_actualizado = actualizar_contacto(nombre, nuevo_telefono)
+        try:
+            fue_actualizado = actualizar_contacto(nombre, nuevo_telefono)
+        except ValueError as e:
+            messagebox.showerror("Datos inválidos", str(e))
+            return
 
         if fue_actualizado:
             messagebox.showinfo("Éxito", "Contacto actualizado exitosamente.")
@@ -190,10 +152,75 @@ class VentanaPrincipal(tk.Tk):
             else:
                 messagebox.showinfo("No encontrado", "El contacto no fue encontrado para eliminar.")
 
+    def accion_importar_contactos(self):
+        ruta = filedialog.askopenfilename(
+            title="Seleccione el archivo de contactos (nombre!telefono)",
+            filetypes=[("Texto", "*.txt"), ("Todos", "*.*")],
+        )
+        if not ruta:
+            return
+
+        try:
+            with open(ruta, "r") as archivo:
+                importados, rechazados = importar_contactos(archivo)
+        except OSError as e:
+            messagebox.showerror("Error de lectura", str(e))
+            return
+
+        mensaje = f"Contactos importados: {importados}\nFilas rechazadas: {len(rechazados)}"
+        #solo se muestran las primeras filas rechazadas
+        for numero, nombre, telefono, motivo in rechazados[:10]:
+            mensaje += f"\n  Fila {numero} ({nombre}!{telefono}): {motivo}"
+        if len(rechazados) > 10:
+            mensaje += "\n  ..."
+        messagebox.showinfo("Importación terminada", mensaje)
+
+    def accion_exportar_contactos(self):
+        ruta = filedialog.asksaveasfilename(
+            title="Guardar contactos como",
+            defaultextension=".txt",
+            filetypes=[("Texto", "*.txt"), ("Todos", "*.*")],
+        )
+        if not ruta:
+            return
+
+        try:
+            cantidad = exportar_contactos(ruta)
+        except OSError as e:
+            messagebox.showerror("Error al guardar", str(e))
+            return
+        messagebox.showinfo("Exportación terminada", f"Se exportaron {cantidad} contactos a:\n{ruta}")
+
+    def mostrar_sugerencias(self, nombres):
+        self.lista_sugerencias.delete(0, tk.END)
+        for nombre in nombres:
+            self.lista_sugerencias.insert(tk.END, nombre)
+
+    def accion_sugerir_por_nombre(self, _evento=None):
+        texto = self.entry_nombre.get()
+        self.mostrar_sugerencias(sugerir_contactos(texto) if texto else [])
+
+    def accion_sugerir_por_telefono(self, _evento=None):
+        texto = self.entry_telefono.get()
+        self.mostrar_sugerencias(sugerir_por_telefono(texto) if texto else [])
+
+    #al elegir una sugerencia se llenan los dos campos
+    def accion_elegir_sugerencia(self, _evento=None):
+        seleccion = self.lista_sugerencias.curselection()
+        if not seleccion:
+            return
+        nombre = self.lista_sugerencias.get(seleccion[0])
+        telefono = obtener_repositorio().buscar(nombre) or ""
+        self.entry_nombre.delete(0, tk.END)
+        self.entry_nombre.insert(0, nombre)
+        self.entry_telefono.delete(0, tk.END)
+        self.entry_telefono.insert(0, telefono)
+
     #limpiar los campos
     def accion_limpiar_campos(self):
         self.entry_nombre.delete(0, tk.END)
         self.entry_telefono.delete(0, tk.END)
+        self.lista_sugerencias.delete(0, tk.END)
 
 
 
@@ -201,8 +228,14 @@ class VentanaPrincipal(tk.Tk):
 class Principal:
     @staticmethod
     def main():
+        parser = argparse.ArgumentParser(description="Agenda de contactos")
+        parser.add_argument("--almacen", choices=ALMACENES, default=agenda_contactos.tipo_almacen,
+                            help="donde se guardan los contactos (por defecto: %(default)s)")
+        agenda_contactos.tipo_almacen = parser.parse_args().almacen
+
         app = VentanaPrincipal()
         app.mainloop()
+        obtener_repositorio().cerrar()
 
 if __name__ == "__main__":
     Principal.main()
@@ -5,71 +5,148 @@ Aplicación de nómina con interfaz gráfica (Tkinter).
     * Agregar empleado
     * Calcular nómina
     * Guardar archivo
+    * Exportar CSV / JSON Lines
+    * Guardar / abrir empleados (archivo binario .nom)
     * Salir
 
 - Usa diálogos de mensaje, advertencia, confirmación y selección de carpeta.
 """
 
 import os
-from enum import Enum
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 
+from calculo_nomina import ordenar_empleados
+from modelo_nomina import (
+    DIAS_MAXIMOS, DIAS_MINIMOS, ColeccionEmpleados, Empleado, TipoCargo, TipoGenero,
+)
+from persistencia_nomina import EXTENSION, cargar_empleados, guardar_empleados
+from reportes_nomina import EXTENSIONES, escribir_reporte
+
 
 # ==========================
-#  MODELO
+#  TABLA VIRTUAL
 # ==========================
 
-class TipoCargo(Enum):
-    DIRECTIVO = "Directivo"
-    ESTRATEGICO = "Estratégico"
-    OPERATIVO = "Operativo"
-
-
-class TipoGenero(Enum):
-    MASCULINO = "Masculino"
-    FEMENINO = "Femenino"
-
-
-class Empleado:
-    """Modelo de un empleado de la empresa."""
-
-    def __init__(
-        self,
-        nombre: str,
-        apellidos: str,
-        cargo: TipoCargo,
-        genero: TipoGenero,
-        salario_dia: float,
-        dias_trabajados: int,
-        otros_ingresos: float,
-        pagos_salud: float,
-        aporte_pensiones: float,
-    ):
-        self.nombre = nombre
-        self.apellidos = apellidos
-        self.cargo = cargo
-        self.genero = genero
-        self.salario_dia = salario_dia
-        self.dias_trabajados = dias_trabajados
-        self.otros_ingresos = otros_ingresos
-        self.pagos_salud = pagos_salud
-        self.aporte_pensiones = aporte_pensiones
-
-    @property
-    def salario_mensual(self) -> float:
-        """
-        Salario mensual = (días trabajados * sueldo por día)
-                          + otros ingresos
-                          - pagos por salud
-                          - aporte pensiones
-        """
-        return (
-            self.dias_trabajados * self.salario_dia
-            + self.otros_ingresos
-            - self.pagos_salud
-            - self.aporte_pensiones
-        )
+class TablaNominaVirtual(tk.Frame):
+    """
+    Treeview que solo crea filas para lo que se ve en pantalla.
+
+    El widget tiene tantos elementos como filas visibles y al desplazarse
+    se les cambian los valores; la barra vertical representa la posición
+    dentro de toda la nómina. Al hacer clic en un encabezado se ordenan
+    los datos (``ordenar_empleados``), no los elementos del widget: el
+    orden de cada columna se calcula una vez y un segundo clic solo lo
+    recorre al revés.
+    """
+
+    COLUMNAS = (
+        ("nombre", "Nombre"), ("apellidos", "Apellidos"), ("cargo", "Cargo"),
+        ("genero", "Género"), ("salario_dia", "Salario día"), ("dias_trabajados", "Días"),
+        ("otros_ingresos", "Otros ingresos"), ("pagos_salud", "Salud"),
+        ("aporte_pensiones", "Pensiones"), ("salario_mensual", "Salario mensual"),
+    )
+
+    def __init__(self, master, empleados: ColeccionEmpleados):
+        super().__init__(master)
+        self.empleados = empleados
+        self.primera = 0
+        self._ordenes = {}             # campo -> posiciones en orden ascendente
+        self._orden = None             # orden en uso (None = orden de ingreso)
+        self._campo_orden = None
+        self._descendente = False
+
+        columnas = [campo for campo, _ in self.COLUMNAS]
+        self.tree = ttk.Treeview(self, columns=columnas, show="headings", selectmode="none")
+        for campo, texto in self.COLUMNAS:
+            self.tree.heading(campo, text=texto, command=lambda c=campo: self.ordenar_por(c))
+            self.tree.column(campo, width=90, anchor="center")
+        self.barra = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self._desplazar)
+        self.barra.pack(side=tk.RIGHT, fill=tk.Y)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        self._alto_fila = int(ttk.Style().lookup("Treeview", "rowheight") or 20)
+        self.tree.bind("<Configure>", lambda _e: self._dibujar())
+        self.tree.bind("<MouseWheel>", lambda e: self._mover(-3 if e.delta > 0 else 3))
+        self.tree.bind("<Button-4>", lambda _e: self._mover(-3))  # X11
+        self.tree.bind("<Button-5>", lambda _e: self._mover(3))
+        self.tree.bind("<Prior>", lambda _e: self._mover(-self.visibles()))
+        self.tree.bind("<Next>", lambda _e: self._mover(self.visibles()))
+        self.tree.bind("<Up>", lambda _e: self._mover(-1))
+        self.tree.bind("<Down>", lambda _e: self._mover(1))
+
+    # ---------- Orden ----------
+
+    def ordenar_por(self, campo: str):
+        if campo == self._campo_orden:
+            self._descendente = not self._descendente
+        else:
+            if campo not in self._ordenes:
+                self._ordenes[campo] = ordenar_empleados(self.empleados, campo)
+            self._campo_orden, self._descendente = campo, False
+        self._orden = self._ordenes[campo]
+        for c, texto in self.COLUMNAS:
+            flecha = (" ▼" if self._descendente else " ▲") if c == campo else ""
+            self.tree.heading(c, text=texto + flecha)
+        self.ir_a(0)
+
+    def _posicion(self, fila: int) -> int:
+        """Posición en la colección del empleado que se muestra en la fila ``fila``."""
+        if self._orden is None:
+            return fila
+        if self._descendente:
+            fila = len(self.empleados) - 1 - fila
+        return int(self._orden[fila])
+
+    # ---------- Desplazamiento ----------
+
+    def visibles(self) -> int:
+        return max(self.tree.winfo_height() // self._alto_fila - 1, 1)  # menos el encabezado
+
+    def ir_a(self, fila: int):
+        maximo = max(len(self.empleados) - self.visibles(), 0)
+        self.primera = min(max(fila, 0), maximo)
+        self._dibujar()
+        return "break"
+
+    def _mover(self, filas: int):
+        return self.ir_a(self.primera + filas)
+
+    def _desplazar(self, accion, cantidad, unidad=None):
+        if accion == tk.MOVETO:
+            self.ir_a(int(float(cantidad) * len(self.empleados)))
+        elif unidad == tk.PAGES:
+            self._mover(int(cantidad) * self.visibles())
+        else:
+            self._mover(int(cantidad))
+
+    def _dibujar(self):
+        total = len(self.empleados)
+        cantidad = min(self.visibles(), total - self.primera)
+        elementos = self.tree.get_children()
+        # se reutilizan los elementos existentes; solo se crean o borran los que sobran
+        if len(elementos) > cantidad:
+            self.tree.delete(*elementos[cantidad:])
+        for i in range(len(elementos), cantidad):
+            self.tree.insert("", tk.END, iid=f"fila{i}")
+        for i in range(cantidad):
+            emp = self.empleados[self._posicion(self.primera + i)]
+            self.tree.item(f"fila{i}", values=(
+                emp.nombre,
+                emp.apellidos,
+                emp.cargo.value,
+                emp.genero.value,
+                f"{emp.salario_dia:.2f}",
+                emp.dias_trabajados,
+                f"{emp.otros_ingresos:.2f}",
+                f"{emp.pagos_salud:.2f}",
+                f"{emp.aporte_pensiones:.2f}",
+                f"{emp.salario_mensual:.2f}",
+            ))
+        if total:
+            self.barra.set(self.primera / total, min((self.primera + cantidad) / total, 1.0))
+        else:
+            self.barra.set(0.0, 1.0)
 
 
 class NominaApp:
@@ -79,7 +156,7 @@ class NominaApp:
         self.root.title("Nómina de empleados")
         self.root.geometry("700x400")
 
-        self.empleados: list[Empleado] = []
+        self.empleados = ColeccionEmpleados()
 
         self._crear_menu()
         self._crear_estado()
@@ -99,6 +176,19 @@ class NominaApp:
         menu_principal.add_command(
             label="Guardar archivo", command=self.guardar_archivo_nomina
         )
+        menu_principal.add_command(
+            label="Exportar CSV", command=lambda: self.guardar_archivo_nomina("csv")
+        )
+        menu_principal.add_command(
+            label="Exportar JSON Lines", command=lambda: self.guardar_archivo_nomina("jsonl")
+        )
+        menu_principal.add_separator()
+        menu_principal.add_command(
+            label="Guardar empleados…", command=self.guardar_empleados
+        )
+        menu_principal.add_command(
+            label="Abrir empleados…", command=self.abrir_empleados
+        )
         menu_principal.add_separator()
         menu_principal.add_command(label="Salir", command=self.root.quit)
 
@@ -117,6 +207,12 @@ class NominaApp:
         )
         barra_estado.pack(side=tk.BOTTOM, fill=tk.X)
 
+    def _actualizar_estado(self):
+        self.estado_var.set(
+            f"Empleados registrados: {len(self.empleados)} | "
+            f"Total nómina: {self.empleados.total_nomina:.2f}"
+        )
+
     # ---------- Ventana: Agregar empleado ----------
 
     def ventana_agregar_empleado(self):
@@ -174,8 +270,10 @@ class NominaApp:
 
                 salario_dia = float(entry_salario.get())
                 dias_trabajados = int(entry_dias.get())
-                if dias_trabajados < 1 or dias_trabajados > 31:
-                    raise ValueError("Los días trabajados deben estar entre 1 y 31.")
+                if not DIAS_MINIMOS <= dias_trabajados <= DIAS_MAXIMOS:
+                    raise ValueError(
+                        f"Los días trabajados deben estar entre {DIAS_MINIMOS} y {DIAS_MAXIMOS}."
+                    )
 
                 otros_ingresos = float(entry_otros.get() or 0.0)
                 pagos_salud = float(entry_salud.get() or 0.0)
@@ -202,10 +300,8 @@ class NominaApp:
                     pagos_salud,
                     aporte_pensiones,
                 )
-                self.empleados.append(empleado)
-                self.estado_var.set(
-                    f"Empleados registrados: {len(self.empleados)}"
-                )
+                self.empleados.agregar(empleado)
+                self._actualizar_estado()
 
                 messagebox.showinfo(
                     "Empleado agregado",
@@ -237,55 +333,33 @@ class NominaApp:
         ventana.geometry("900x400")
         ventana.grab_set()
 
-        columnas = (
-            "nombre", "apellidos", "cargo", "genero",
-            "salario_dia", "dias", "otros", "salud",
-            "pension", "salario_mensual",
-        )
-
-        tree = ttk.Treeview(ventana, columns=columnas, show="headings")
-        encabezados = [
-            "Nombre", "Apellidos", "Cargo", "Género",
-            "Salario día", "Días", "Otros ingresos",
-            "Salud", "Pensiones", "Salario mensual",
-        ]
-        for col, texto in zip(columnas, encabezados):
-            tree.heading(col, text=texto)
-            tree.column(col, width=90, anchor="center")
-
-        tree.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-
-        total_nomina = 0.0
-        for emp in self.empleados:
-            salario_m = emp.salario_mensual
-            total_nomina += salario_m
-            tree.insert(
-                "",
-                tk.END,
-                values=(
-                    emp.nombre,
-                    emp.apellidos,
-                    emp.cargo.value,
-                    emp.genero.value,
-                    f"{emp.salario_dia:.2f}",
-                    emp.dias_trabajados,
-                    f"{emp.otros_ingresos:.2f}",
-                    f"{emp.pagos_salud:.2f}",
-                    f"{emp.aporte_pensiones:.2f}",
-                    f"{salario_m:.2f}",
-                ),
-            )
+        tabla = TablaNominaVirtual(ventana, self.empleados)
+        tabla.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
+        # los totales se mantienen al agregar empleados; no hace falta recorrerlos
+        resumen = self.empleados.totales()
         etiqueta_total = tk.Label(
             ventana,
-            text=f"Total nómina de la empresa: {total_nomina:.2f}",
+            text=f"Total nómina de la empresa: {resumen.total:.2f}",
             font=("Arial", 11, "bold"),
         )
         etiqueta_total.pack(pady=5)
 
+        subtotales_cargo = " | ".join(
+            f"{c.value}: {resumen.por_cargo[c]:.2f} ({resumen.empleados_por_cargo[c]})"
+            for c in TipoCargo
+        )
+        subtotales_genero = " | ".join(
+            f"{g.value}: {resumen.por_genero[g]:.2f} ({resumen.empleados_por_genero[g]})"
+            for g in TipoGenero
+        )
+        tk.Label(ventana, text=f"Por cargo: {subtotales_cargo}").pack()
+        tk.Label(ventana, text=f"Por género: {subtotales_genero}").pack(pady=(0, 5))
+
     # ---------- Guardar archivo ----------
 
-    def guardar_archivo_nomina(self):
+    def guardar_archivo_nomina(self, formato: str = "texto"):
+        nombre_archivo = "Nomina" + EXTENSIONES[formato]
         if not self.empleados:
             messagebox.showwarning(
                 "Sin empleados", "No hay datos para guardar en el archivo."
@@ -294,39 +368,23 @@ class NominaApp:
 
         confirmar = messagebox.askyesno(
             "Confirmación",
-            "Se generará el archivo 'Nomina.txt' con la información actual.\n"
+            f"Se generará el archivo '{nombre_archivo}' con la información actual.\n"
             "¿Desea continuar?",
         )
         if not confirmar:
             return
 
         carpeta = filedialog.askdirectory(
-            title="Seleccione la carpeta donde se guardará Nomina.txt"
+            title=f"Seleccione la carpeta donde se guardará {nombre_archivo}"
         )
         if not carpeta:
             messagebox.showinfo("Cancelado", "No se seleccionó ninguna carpeta.")
             return
 
-        ruta_archivo = os.path.join(carpeta, "Nomina.txt")
+        ruta_archivo = os.path.join(carpeta, nombre_archivo)
 
         try:
-            total_nomina = 0.0
-            with open(ruta_archivo, "w", encoding="utf-8") as f:
-                f.write("NÓMINA DE EMPLEADOS\n")
-                f.write("=" * 60 + "\n")
-                for emp in self.empleados:
-                    salario_m = emp.salario_mensual
-                    total_nomina += salario_m
-                    linea = (
-                        f"{emp.nombre} {emp.apellidos} | "
-                        f"Cargo: {emp.cargo.value} | "
-                        f"Género: {emp.genero.value} | "
-                        f"Salario mensual: {salario_m:.2f}\n"
-                    )
-                    f.write(linea)
-
-                f.write("=" * 60 + "\n")
-                f.write(f"TOTAL NÓMINA: {total_nomina:.2f}\n")
+            escribir_reporte(self.empleados, ruta_archivo, formato)
 
             messagebox.showinfo(
                 "Archivo guardado",
@@ -338,6 +396,58 @@ class NominaApp:
                 f"No fue posible escribir el archivo:\n{e}",
             )
 
+    # ---------- Guardar / abrir empleados ----------
+
+    def guardar_empleados(self):
+        if not self.empleados:
+            messagebox.showwarning("Sin empleados", "No hay empleados para guardar.")
+            return
+
+        ruta_archivo = filedialog.asksaveasfilename(
+            title="Guardar empleados",
+            defaultextension=EXTENSION,
+            filetypes=[("Empleados", f"*{EXTENSION}"), ("Todos los archivos", "*.*")],
+        )
+        if not ruta_archivo:
+            return
+
+        try:
+            guardar_empleados(self.empleados, ruta_archivo)
+            messagebox.showinfo(
+                "Archivo guardado",
+                f"Se guardaron {len(self.empleados)} empleados en:\n{ruta_archivo}",
+            )
+        except OSError as e:
+            messagebox.showerror(
+                "Error al guardar",
+                f"No fue posible escribir el archivo:\n{e}",
+            )
+
+    def abrir_empleados(self):
+        ruta_archivo = filedialog.askopenfilename(
+            title="Abrir empleados",
+            filetypes=[("Empleados", f"*{EXTENSION}"), ("Todos los archivos", "*.*")],
+        )
+        if not ruta_archivo:
+            return
+
+        if self.empleados and not messagebox.askyesno(
+            "Confirmación",
+            f"Se reemplazarán los {len(self.empleados)} empleados actuales.\n"
+            "¿Desea continuar?",
+        ):
+            return
+
+        try:
+            self.empleados = cargar_empleados(ruta_archivo)
+        except (OSError, ValueError) as e:
+            messagebox.showerror(
+                "Error al abrir",
+                f"No fue posible leer el archivo:\n{e}",
+            )
+            return
+        self._actualizar_estado()
+
     # ---------- Bucle principal ----------
 
     def run(self):
@@ -12,81 +12,25 @@ Menú:
     * Salir
 
 Fechas en formato: AAAA-MM-DD (ejemplo: 2025-11-27)
+
+El estado del hotel se guarda en la carpeta ``hotel_datos`` (ver
+diario_hotel.py) y se recupera al volver a abrir la aplicación. Cada
+salida se agrega además al historial de estadías (historial_hotel.py),
+del que analitica_hotel.py calcula ocupación, ADR y RevPAR.
 """
 
 import tkinter as tk
 from tkinter import ttk, messagebox
 from datetime import datetime, date
-from dataclasses import dataclass
-from typing import Optional, List
-
-
-# ==========================
-#  MODELO
-# ==========================
-
-@dataclass
-class Huesped:
-    nombre: str
-    apellidos: str
-    documento: str
-
-
-class Habitacion:
-    def __init__(self, numero: int, precio_dia: float):
-        self.numero: int = numero
-        self.precio_dia: float = precio_dia
-        self.disponible: bool = True
-        self.huesped: Optional[Huesped] = None
-        self.fecha_ingreso: Optional[date] = None
-
-    def ocupar(self, huesped: Huesped, fecha_ingreso: date) -> None:
-        if not self.disponible:
-            raise ValueError("La habitación ya está ocupada.")
-        self.huesped = huesped
-        self.fecha_ingreso = fecha_ingreso
-        self.disponible = False
-
-    def liberar(self, fecha_salida: date) -> float:
-        """
-        Libera la habitación y devuelve el valor total a pagar.
-        """
-        if self.disponible or self.fecha_ingreso is None or self.huesped is None:
-            raise ValueError("La habitación no está ocupada.")
-
-        if fecha_salida <= self.fecha_ingreso:
-            raise ValueError("La fecha de salida debe ser posterior a la de ingreso.")
-
-        dias = (fecha_salida - self.fecha_ingreso).days
-        total = dias * self.precio_dia
-
-        # Resetear estado
-        self.disponible = True
-        self.huesped = None
-        self.fecha_ingreso = None
-
-        return total
-
-    def estado_str(self) -> str:
-        return "Disponible" if self.disponible else "No disponible"
-
+import os
 
-class Hotel:
-    def __init__(self) -> None:
-        self.habitaciones: List[Habitacion] = []
-        self._crear_habitaciones()
-
-    def _crear_habitaciones(self) -> None:
-        # Habitaciones 1-5: 120000; 6-10: 160000
-        for n in range(1, 11):
-            precio = 120000 if n <= 5 else 160000
-            self.habitaciones.append(Habitacion(n, precio))
+from diario_hotel import DiarioHotel
+from historial_hotel import HistorialEstadias
+from modelo_hotel import CambioHabitacion, Habitacion, Hotel, Huesped
 
-    def buscar_habitacion(self, numero: int) -> Optional[Habitacion]:
-        for h in self.habitaciones:
-            if h.numero == numero:
-                return h
-        return None
+CARPETA_DATOS = "hotel_datos"
+ARCHIVO_HISTORIAL = "estadias.bin"
+INTERVALO_SINCRONIZACION_MS = 1000
 
 
 # ==========================
@@ -98,6 +42,11 @@ class HotelApp:
 
     def __init__(self) -> None:
         self.hotel = Hotel()
+        # antes de recuperar el diario: las salidas que repite y faltan en el historial se agregan
+        os.makedirs(CARPETA_DATOS, exist_ok=True)
+        self.historial = HistorialEstadias(os.path.join(CARPETA_DATOS, ARCHIVO_HISTORIAL))
+        self.historial.registrar_salidas_de(self.hotel)
+        self.diario = DiarioHotel(CARPETA_DATOS, self.hotel)
 
         self.root = tk.Tk()
         self.root.title("Gestión de Hotel")
@@ -105,6 +54,7 @@ class HotelApp:
 
         self._crear_menu()
         self._crear_estado()
+        self.root.after(INTERVALO_SINCRONIZACION_MS, self._sincronizar_diario)
 
     # ---------- UI base ----------
 
@@ -138,11 +88,35 @@ class HotelApp:
         barra_estado.pack(side=tk.BOTTOM, fill=tk.X)
 
     def _actualizar_estado(self) -> None:
-        ocupadas = sum(1 for h in self.hotel.habitaciones if not h.disponible)
-        self.estado_var.set(f"Habitaciones ocupadas: {ocupadas} / 10")
+        self.estado_var.set(
+            f"Habitaciones ocupadas: {self.hotel.cantidad_ocupadas} / {len(self.hotel)}"
+        )
+
+    def _sincronizar_diario(self) -> None:
+        # los eventos de un lote sin completar también llegan al disco
+        try:
+            self.diario.sincronizar()
+        except OSError as e:
+            self.estado_var.set(f"Error al guardar el diario: {e}")
+        self.root.after(INTERVALO_SINCRONIZACION_MS, self._sincronizar_diario)
 
     # ---------- Utilidades ----------
 
+    def _valores_fila(self, h: Habitacion) -> tuple:
+        """Valores de la fila de ``h`` en la tabla de habitaciones."""
+        nombre_huesped = ""
+        fecha_ingreso = ""
+        if not h.disponible and h.huesped is not None and h.fecha_ingreso:
+            nombre_huesped = f"{h.huesped.nombre} {h.huesped.apellidos}"
+            fecha_ingreso = h.fecha_ingreso.strftime(self.FORMATO_FECHA)
+        return (
+            h.numero,
+            f"{h.precio_dia:.0f}",
+            h.estado_str(),
+            nombre_huesped,
+            fecha_ingreso,
+        )
+
     @staticmethod
     def _parsear_fecha(texto: str) -> date:
         try:
@@ -174,28 +148,22 @@ class HotelApp:
             tree.column(col, width=120, anchor="center")
         tree.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
-        def poblar_tree():
-            tree.delete(*tree.get_children())
-            for h in self.hotel.habitaciones:
-                nombre_huesped = ""
-                fecha_ingreso = ""
-                if not h.disponible and h.huesped is not None and h.fecha_ingreso:
-                    nombre_huesped = f"{h.huesped.nombre} {h.huesped.apellidos}"
-                    fecha_ingreso = h.fecha_ingreso.strftime(self.FORMATO_FECHA)
-
-                tree.insert(
-                    "",
-                    tk.END,
-                    values=(
-                        h.numero,
-                        f"{h.precio_dia:.0f}",
-                        h.estado_str(),
-                        nombre_huesped,
-                        fecha_ingreso,
-                    ),
-                )
+        # una fila por habitación, con el número como iid; después solo se
+        # actualizan las filas de las habitaciones que cambian
+        for h in self.hotel.habitaciones:
+            tree.insert("", tk.END, iid=str(h.numero), values=self._valores_fila(h))
 
-        poblar_tree()
+        def al_cambiar(habitacion: Habitacion, cambio: CambioHabitacion) -> None:
+            tree.item(str(habitacion.numero), values=self._valores_fila(habitacion))
+
+        self.hotel.suscribir(al_cambiar)
+
+        def al_destruir(event):
+            # <Destroy> también llega por cada widget hijo de la ventana
+            if event.widget is ventana:
+                self.hotel.desuscribir(al_cambiar)
+
+        ventana.bind("<Destroy>", al_destruir)
 
         # Botón para ocupar habitación seleccionada
         def ocupar_habitacion():
@@ -208,8 +176,7 @@ class HotelApp:
                 )
                 return
 
-            item = tree.item(seleccionado[0])
-            numero = int(item["values"][0])
+            numero = int(seleccionado[0])
 
             habitacion = self.hotel.buscar_habitacion(numero)
             if habitacion is None:
@@ -226,7 +193,7 @@ class HotelApp:
                 )
                 return
 
-            self._ventana_registro_ingreso(habitacion, poblar_tree, ventana)
+            self._ventana_registro_ingreso(habitacion, ventana)
 
         btn_frame = tk.Frame(ventana)
         btn_frame.pack(fill=tk.X, padx=10, pady=5)
@@ -242,7 +209,6 @@ class HotelApp:
     def _ventana_registro_ingreso(
         self,
         habitacion: Habitacion,
-        callback_refrescar,
         ventana_padre,
     ) -> None:
         win = tk.Toplevel(ventana_padre)
@@ -294,11 +260,17 @@ class HotelApp:
                     parent=win,
                 )
                 self._actualizar_estado()
-                callback_refrescar()
                 win.destroy()
 
             except ValueError as e:
                 messagebox.showerror("Datos inválidos", str(e), parent=win)
+            except OSError as e:
+                # el diario no pudo guardar el ingreso, así que no se registró
+                messagebox.showerror(
+                    "Error al guardar",
+                    f"No se pudo guardar el ingreso; la habitación sigue libre.\n{e}",
+                    parent=win,
+                )
 
         tk.Button(win, text="Registrar ingreso", command=registrar).grid(
             row=5, column=0, pady=10
@@ -398,6 +370,15 @@ class HotelApp:
                 ventana.destroy()
             except ValueError as e:
                 messagebox.showerror("Error en datos", str(e), parent=ventana)
+            except OSError as e:
+                if hab.disponible:
+                    # el diario ya la guardó; solo falló el historial de estadías
+                    mensaje = f"La salida se registró, pero no se pudo guardar en el historial.\n{e}"
+                    ventana.destroy()
+                else:
+                    mensaje = f"No se pudo guardar la salida; la habitación sigue ocupada.\n{e}"
+                self._actualizar_estado()
+                messagebox.showerror("Error al guardar", mensaje, parent=self.root)
 
         btn_buscar = tk.Button(ventana, text="Buscar habitación", command=buscar_habitacion)
         btn_buscar.grid(row=3, column=0, pady=8)
@@ -410,7 +391,11 @@ class HotelApp:
     # ---------- Bucle principal ----------
 
     def run(self) -> None:
-        self.root.mainloop()
+        try:
+            self.root.mainloop()
+        finally:
+            self.diario.cerrar()
+            self.historial.cerrar()
 
 
 if __name__ == "__main__":
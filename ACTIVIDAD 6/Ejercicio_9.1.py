@@ -18,33 +18,10 @@ Al oprimir el botón "Agregar":
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-from dataclasses import dataclass
 from datetime import datetime
 from typing import List
 
-
-# ==========================
-#  MODELO
-# ==========================
-
-@dataclass
-class Contacto:
-    nombres: str
-    apellidos: str
-    fecha_nacimiento: datetime.date
-    direccion: str
-    telefono: str
-    correo: str
-
-    def resumen(self) -> str:
-        """Cadena que se mostrará en la lista gráfica."""
-        fecha_str = self.fecha_nacimiento.strftime("%Y-%m-%d")
-        return (
-            f"{self.nombres} {self.apellidos} | "
-            f"Fecha nac.: {fecha_str} | "
-            f"Tel: {self.telefono} | "
-            f"Correo: {self.correo}"
-        )
+from modelo_contacto import Contacto
 
 
 # ==========================
@@ -0,0 +1,188 @@
+"""
+Ocupación, ADR y RevPAR a partir del historial de estadías.
+
+Para un período ``[desde, hasta)`` se calculan, en total, por habitación,
+por tarifa (el precio por día de la habitación: 120000 o 160000 en el
+hotel del enunciado) y por mes:
+
+    * ocupación = noches ocupadas / noches disponibles
+    * ADR (tarifa diaria promedio) = ingresos / noches ocupadas
+    * RevPAR (ingreso por habitación disponible) = ingresos / noches disponibles
+
+Solo cuentan las noches de cada estadía que caen dentro del período,
+cobradas al precio por día con que se registró la estadía; una estadía
+que cruza un cambio de mes se reparte entre los dos meses.
+
+Con NumPy todo se calcula sobre las columnas completas del historial:
+``bincount`` por habitación y, para los meses, un arreglo por día con las
+entradas y salidas (+1 y -1) acumulado con ``cumsum``. NumPy es opcional:
+sin él se hace el mismo cálculo con un ciclo, estadía por estadía.
+"""
+
+from bisect import bisect_right
+from dataclasses import dataclass
+from datetime import date
+from typing import List, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from historial_hotel import HistorialEstadias
+from modelo_hotel import Hotel
+
+# (etiqueta "AAAA-MM", primer día, día siguiente al último) como ordinales
+Mes = Tuple[str, int, int]
+
+
+@dataclass
+class Indicadores:
+    etiquetas: list  # número de habitación, precio por día o "AAAA-MM"
+    noches_disponibles: List[int]
+    noches_ocupadas: List[int]
+    ingresos: List[float]
+
+    @property
+    def ocupacion(self) -> List[float]:
+        return [o / d if d else 0.0 for o, d in zip(self.noches_ocupadas, self.noches_disponibles)]
+
+    @property
+    def adr(self) -> List[float]:
+        return [i / o if o else 0.0 for i, o in zip(self.ingresos, self.noches_ocupadas)]
+
+    @property
+    def revpar(self) -> List[float]:
+        return [i / d if d else 0.0 for i, d in zip(self.ingresos, self.noches_disponibles)]
+
+
+@dataclass
+class AnalisisHotel:
+    desde: date
+    hasta: date
+    total: Indicadores
+    por_habitacion: Indicadores
+    por_tarifa: Indicadores
+    por_mes: Indicadores
+
+
+def _meses(desde: date, hasta: date) -> List[Mes]:
+    meses = []
+    actual = desde
+    while actual < hasta:
+        siguiente = date(actual.year + actual.month // 12, actual.month % 12 + 1, 1)
+        fin = min(siguiente, hasta)
+        meses.append((f"{actual.year:04d}-{actual.month:02d}", actual.toordinal(), fin.toordinal()))
+        actual = fin
+    return meses
+
+
+# ==========================
+#  CÁLCULO
+# ==========================
+
+def _por_habitacion_y_mes_con_ciclo(
+    historial: HistorialEstadias, numeros: Sequence[int], inicio: int, fin: int, meses: List[Mes]
+) -> Tuple[List[int], List[float], List[int], List[float]]:
+    """Cálculo estadía por estadía (se usa si no hay NumPy)."""
+    posicion = {n: i for i, n in enumerate(numeros)}
+    comienzos = [m[1] for m in meses]
+    ocupadas_hab, ingresos_hab = [0] * len(numeros), [0.0] * len(numeros)
+    ocupadas_mes, ingresos_mes = [0] * len(meses), [0.0] * len(meses)
+    for habitacion, ingreso, salida, precio in zip(
+        historial.habitacion, historial.ingreso, historial.salida, historial.precio_dia
+    ):
+        i = posicion.get(habitacion)
+        a, b = max(ingreso, inicio), min(salida, fin)
+        if i is None or b <= a:
+            continue
+        ocupadas_hab[i] += b - a
+        ingresos_hab[i] += (b - a) * precio
+        m = bisect_right(comienzos, a) - 1
+        while m < len(meses) and meses[m][1] < b:
+            noches = min(b, meses[m][2]) - max(a, meses[m][1])
+            ocupadas_mes[m] += noches
+            ingresos_mes[m] += noches * precio
+            m += 1
+    return ocupadas_hab, ingresos_hab, ocupadas_mes, ingresos_mes
+
+
+def _por_habitacion_y_mes_vectorizado(
+    historial: HistorialEstadias, numeros: Sequence[int], inicio: int, fin: int, meses: List[Mes]
+) -> Tuple[List[int], List[float], List[int], List[float]]:
+    columnas = historial.columnas()
+    # np.array copia; una vista sobre el array impediría que el historial crezca
+    habitacion = np.array(columnas["habitacion"], dtype=np.int64)
+    ingreso = np.clip(np.array(columnas["ingreso"], dtype=np.int64), inicio, fin) - inicio
+    salida = np.clip(np.array(columnas["salida"], dtype=np.int64), inicio, fin) - inicio
+    precio = np.array(columnas["precio_dia"], dtype=np.float64)
+
+    # posición de cada estadía en ``numeros`` con una tabla indexada por número de
+    # habitación (mucho más rápida que searchsorted); las de habitaciones que ya
+    # no existen quedan en -1 y no cuentan
+    numeros_arr = np.asarray(numeros, dtype=np.int64)
+    menor = int(numeros_arr.min()) if len(numeros_arr) else 0
+    tabla = np.full(int(numeros_arr.max()) - menor + 2 if len(numeros_arr) else 1, -1, dtype=np.int64)
+    tabla[numeros_arr - menor] = np.arange(len(numeros_arr))
+    pos = tabla[np.clip(habitacion - menor, -1, len(tabla) - 1)]  # -1 y el último apuntan a -1
+    validas = (pos >= 0) & (salida > ingreso)
+    indice = pos[validas]
+    ingreso, salida, precio = ingreso[validas], salida[validas], precio[validas]
+    noches = salida - ingreso
+
+    ocupadas_hab = np.bincount(indice, weights=noches, minlength=len(numeros))
+    ingresos_hab = np.bincount(indice, weights=noches * precio, minlength=len(numeros))
+
+    # habitaciones ocupadas e ingresos de cada día del período
+    dias = fin - inicio
+    ocupadas_dia = np.cumsum(
+        np.bincount(ingreso, minlength=dias + 1) - np.bincount(salida, minlength=dias + 1)
+    )[:dias]
+    ingresos_dia = np.cumsum(
+        np.bincount(ingreso, weights=precio, minlength=dias + 1)
+        - np.bincount(salida, weights=precio, minlength=dias + 1)
+    )[:dias]
+    mes_de_dia = np.repeat(np.arange(len(meses)), [m[2] - m[1] for m in meses])
+    ocupadas_mes = np.bincount(mes_de_dia, weights=ocupadas_dia, minlength=len(meses))
+    ingresos_mes = np.bincount(mes_de_dia, weights=ingresos_dia, minlength=len(meses))
+
+    return (
+        ocupadas_hab.astype(np.int64).tolist(), ingresos_hab.tolist(),
+        ocupadas_mes.astype(np.int64).tolist(), ingresos_mes.tolist(),
+    )
+
+
+def analizar(historial: HistorialEstadias, hotel: Hotel, desde: date, hasta: date) -> AnalisisHotel:
+    """Indicadores de las habitaciones de ``hotel`` entre ``desde`` y ``hasta`` (sin incluir)."""
+    if hasta <= desde:
+        raise ValueError("La fecha final debe ser posterior a la inicial.")
+    numeros = [h.numero for h in hotel.habitaciones]
+    inicio, fin = desde.toordinal(), hasta.toordinal()
+    dias = fin - inicio
+    meses = _meses(desde, hasta)
+
+    calcular = _por_habitacion_y_mes_con_ciclo if np is None else _por_habitacion_y_mes_vectorizado
+    ocupadas_hab, ingresos_hab, ocupadas_mes, ingresos_mes = calcular(
+        historial, numeros, inicio, fin, meses
+    )
+
+    tarifas = sorted({h.precio_dia for h in hotel.habitaciones})
+    posicion_tarifa = {t: i for i, t in enumerate(tarifas)}
+    habitaciones_tarifa = [0] * len(tarifas)
+    ocupadas_tarifa, ingresos_tarifa = [0] * len(tarifas), [0.0] * len(tarifas)
+    for h, ocupadas, ingresos in zip(hotel.habitaciones, ocupadas_hab, ingresos_hab):
+        t = posicion_tarifa[h.precio_dia]
+        habitaciones_tarifa[t] += 1
+        ocupadas_tarifa[t] += ocupadas
+        ingresos_tarifa[t] += ingresos
+
+    return AnalisisHotel(
+        desde=desde,
+        hasta=hasta,
+        total=Indicadores(["Total"], [len(numeros) * dias], [sum(ocupadas_hab)], [sum(ingresos_hab)]),
+        por_habitacion=Indicadores(numeros, [dias] * len(numeros), ocupadas_hab, ingresos_hab),
+        por_tarifa=Indicadores(tarifas, [n * dias for n in habitaciones_tarifa],
+                               ocupadas_tarifa, ingresos_tarifa),
+        por_mes=Indicadores([m[0] for m in meses], [len(numeros) * (m[2] - m[1]) for m in meses],
+                            ocupadas_mes, ingresos_mes),
+    )
@@ -0,0 +1,19 @@
+"""
+Ayudas para que lo escrito en disco sobreviva a un corte de luz.
+
+Después de ``os.replace`` no basta con haber hecho ``fsync`` del archivo:
+el nombre nuevo es una entrada de la carpeta, que también hay que forzar.
+"""
+
+import os
+
+
+def fsync_carpeta(ruta: str) -> None:
+    """Fuerza al disco la entrada de directorio creada por ``os.replace`` (solo POSIX)."""
+    if os.name != "posix":
+        return
+    descriptor = os.open(os.path.dirname(os.path.abspath(ruta)), os.O_RDONLY)
+    try:
+        os.fsync(descriptor)
+    finally:
+        os.close(descriptor)
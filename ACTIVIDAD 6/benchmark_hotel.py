@@ -0,0 +1,214 @@
+"""
+Mediciones de rendimiento del hotel.
+
+Uso:
+    python benchmark_hotel.py reservas [--habitaciones 5000] [--reservas 1000000] [--consultas 1000]
+    python benchmark_hotel.py diario [--habitaciones 5000] [--eventos 205000]
+    python benchmark_hotel.py analitica [--habitaciones 5000] [--estadias 2000000]
+
+``reservas`` carga ``--reservas`` reservas sin cruces (en orden aleatorio)
+repartidas entre ``--habitaciones`` habitaciones y mide cuánto tarda
+``MotorReservas.habitaciones_libres`` para rangos de fechas al azar,
+frente a recorrer la lista completa de reservas en cada consulta. Las
+dos formas se comparan entre sí para comprobar que den lo mismo.
+
+``diario`` registra ``--eventos`` ingresos y salidas con ``DiarioHotel``
+con distintos tamaños de lote de ``fsync``, y mide cuánto tarda en
+recuperarse el hotel con instantáneas periódicas frente a repetir el
+diario completo (comprobando que el estado recuperado sea el mismo).
+
+``analitica`` llena un ``HistorialEstadias`` con ``--estadias`` estadías y
+compara ``analitica_hotel.analizar`` con NumPy frente al mismo cálculo
+estadía por estadía, comprobando que los indicadores coincidan.
+"""
+
+import argparse
+import math
+import os
+import random
+import tempfile
+import time
+from datetime import date, timedelta
+
+import analitica_hotel
+from diario_hotel import EVENTOS_POR_INSTANTANEA, DiarioHotel
+from historial_hotel import HistorialEstadias
+from modelo_hotel import Habitacion, Hotel, Huesped
+from reservas_hotel import MotorReservas
+
+_INICIO = date(2025, 1, 1)
+
+
+def generar_hotel(habitaciones: int) -> Hotel:
+    return Hotel(Habitacion(n, 120000 if n <= habitaciones // 2 else 160000)
+                 for n in range(1, habitaciones + 1))
+
+
+def generar_reservas(habitaciones: int, cantidad: int, semilla: int = 1):
+    """(habitación, ingreso, salida) sin cruces: estadías de 1 a 5 noches con huecos de 0 a 3 días."""
+    azar = random.Random(semilla)
+    por_habitacion = -(-cantidad // habitaciones)
+    reservas = []
+    for numero in range(1, habitaciones + 1):
+        dia = _INICIO
+        for _ in range(por_habitacion):
+            dia += timedelta(days=azar.randint(0, 3))
+            salida = dia + timedelta(days=azar.randint(1, 5))
+            reservas.append((numero, dia, salida))
+            dia = salida
+    del reservas[cantidad:]
+    azar.shuffle(reservas)
+    return reservas
+
+
+def _libres_recorriendo(hotel: Hotel, reservas, ingreso: date, salida: date):
+    ocupadas = {n for n, i, s in reservas if i < salida and s > ingreso}
+    return [h.numero for h in hotel.habitaciones if h.numero not in ocupadas]
+
+
+def benchmark_reservas(habitaciones: int, cantidad: int, consultas: int) -> None:
+    hotel = generar_hotel(habitaciones)
+    reservas = generar_reservas(habitaciones, cantidad)
+    ultima = max(s for _, _, s in reservas)
+    motor = MotorReservas(hotel)
+
+    inicio = time.perf_counter()
+    for numero, ingreso, salida in reservas:
+        motor.reservar(numero, ingreso, salida)
+    t_carga = time.perf_counter() - inicio
+    print(f"{habitaciones} habitaciones, {len(motor)} reservas hasta {ultima}")
+    print(f"Carga de las reservas:          {t_carga:8.2f} s ({len(motor) / t_carga:,.0f} reservas/s)")
+
+    azar = random.Random(2)
+    rangos = []
+    for _ in range(consultas):
+        ingreso = _INICIO + timedelta(days=azar.randint(0, (ultima - _INICIO).days))
+        rangos.append((ingreso, ingreso + timedelta(days=azar.randint(1, 14))))
+
+    inicio = time.perf_counter()
+    resultados = [motor.habitaciones_libres(i, s) for i, s in rangos]
+    t_motor = (time.perf_counter() - inicio) / consultas
+    print(f"habitaciones_libres (bisect):   {t_motor * 1000:8.2f} ms por consulta")
+
+    muestra = min(consultas, 5)
+    inicio = time.perf_counter()
+    for (ingreso, salida), esperado in zip(rangos[:muestra], resultados):
+        assert _libres_recorriendo(hotel, reservas, ingreso, salida) == esperado
+    t_lineal = (time.perf_counter() - inicio) / muestra
+    print(f"Recorriendo todas las reservas: {t_lineal * 1000:8.2f} ms por consulta "
+          f"({t_lineal / t_motor:.0f}x, resultados idénticos)")
+
+
+def _simular_eventos(hotel: Hotel, cantidad: int, semilla: int = 3) -> None:
+    """Ingresos y salidas al azar: una salida si la habitación está ocupada, un ingreso si no."""
+    azar = random.Random(semilla)
+    huesped = Huesped("Ana", "García", "123")
+    dia = _INICIO
+    for i in range(cantidad):
+        habitacion = hotel.buscar_habitacion(azar.randint(1, len(hotel)))
+        if habitacion.disponible:
+            habitacion.ocupar(huesped, dia)
+        else:
+            habitacion.liberar(habitacion.fecha_ingreso + timedelta(days=azar.randint(1, 5)))
+        if i % 1000 == 0:
+            dia += timedelta(days=1)
+
+
+def _estado(hotel: Hotel):
+    return [(h.numero, h.huesped, h.fecha_ingreso) for h in hotel.habitaciones]
+
+
+def benchmark_diario(habitaciones: int, eventos: int) -> None:
+    print(f"{habitaciones} habitaciones")
+    for lote, cantidad in ((1, min(eventos, 2000)), (64, eventos), (1024, eventos)):
+        with tempfile.TemporaryDirectory() as carpeta:
+            hotel = generar_hotel(habitaciones)
+            diario = DiarioHotel(carpeta, hotel, lote_fsync=lote)
+            inicio = time.perf_counter()
+            _simular_eventos(hotel, cantidad)
+            diario.cerrar()
+            duracion = time.perf_counter() - inicio
+            print(f"Registro con fsync cada {lote:>4} eventos: {cantidad / duracion:>10,.0f} eventos/s "
+                  f"({cantidad} eventos)")
+
+    for por_instantanea, descripcion in (
+        (EVENTOS_POR_INSTANTANEA, f"instantánea cada {EVENTOS_POR_INSTANTANEA} eventos"),
+        (eventos + 1, "sin instantáneas"),
+    ):
+        with tempfile.TemporaryDirectory() as carpeta:
+            hotel = generar_hotel(habitaciones)
+            diario = DiarioHotel(carpeta, hotel, lote_fsync=1024, eventos_por_instantanea=por_instantanea)
+            _simular_eventos(hotel, eventos)
+            diario.cerrar()
+            megas = sum(os.path.getsize(os.path.join(carpeta, a)) for a in os.listdir(carpeta)) / 2**20
+
+            inicio = time.perf_counter()
+            recuperado = generar_hotel(habitaciones)
+            diario = DiarioHotel(carpeta, recuperado, eventos_por_instantanea=por_instantanea)
+            duracion = time.perf_counter() - inicio
+            assert _estado(recuperado) == _estado(hotel), "el estado recuperado difiere"
+            print(f"Recuperación, {descripcion:<31} {duracion * 1000:8.1f} ms "
+                  f"({diario.eventos_repetidos} eventos repetidos, {megas:.1f} MB en disco)")
+            diario.cerrar()
+
+
+def benchmark_analitica(habitaciones: int, estadias: int) -> None:
+    hotel = generar_hotel(habitaciones)
+    historial = HistorialEstadias()
+    for numero, ingreso, salida in generar_reservas(habitaciones, estadias):
+        precio = hotel.buscar_habitacion(numero).precio_dia
+        historial.agregar(numero, ingreso, salida, precio, (salida - ingreso).days * precio)
+    desde = _INICIO
+    hasta = date.fromordinal(max(historial.salida))
+    print(f"{habitaciones} habitaciones, {len(historial)} estadías de {desde} a {hasta}")
+
+    inicio = time.perf_counter()
+    vectorizado = analitica_hotel.analizar(historial, hotel, desde, hasta)
+    t_numpy = time.perf_counter() - inicio
+
+    numpy, analitica_hotel.np = analitica_hotel.np, None
+    try:
+        inicio = time.perf_counter()
+        con_ciclo = analitica_hotel.analizar(historial, hotel, desde, hasta)
+        t_ciclo = time.perf_counter() - inicio
+    finally:
+        analitica_hotel.np = numpy
+
+    for grupo in ("total", "por_habitacion", "por_tarifa", "por_mes"):
+        a, b = getattr(vectorizado, grupo), getattr(con_ciclo, grupo)
+        assert a.noches_ocupadas == b.noches_ocupadas, grupo
+        assert all(math.isclose(x, y) for x, y in zip(a.ingresos, b.ingresos)), grupo
+    print(f"Estadía por estadía: {t_ciclo * 1000:8.1f} ms")
+    print(f"Con NumPy:           {t_numpy * 1000:8.1f} ms ({t_ciclo / t_numpy:.0f}x, mismos indicadores)")
+    total = vectorizado.total
+    print(f"Ocupación {total.ocupacion[0]:.1%}, ADR {total.adr[0]:,.0f}, RevPAR {total.revpar[0]:,.0f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    sub = parser.add_subparsers(dest="prueba", required=True)
+
+    p_res = sub.add_parser("reservas", help="disponibilidad por rango de fechas con bisect")
+    p_res.add_argument("--habitaciones", type=int, default=5000)
+    p_res.add_argument("--reservas", type=int, default=1_000_000)
+    p_res.add_argument("--consultas", type=int, default=1000)
+
+    p_dia = sub.add_parser("diario", help="registro de eventos con fsync por lotes y recuperación")
+    p_dia.add_argument("--habitaciones", type=int, default=5000)
+    p_dia.add_argument("--eventos", type=int, default=205_000)
+
+    p_ana = sub.add_parser("analitica", help="ocupación, ADR y RevPAR con NumPy vs. ciclo")
+    p_ana.add_argument("--habitaciones", type=int, default=5000)
+    p_ana.add_argument("--estadias", type=int, default=2_000_000)
+
+    args = parser.parse_args()
+    if args.prueba == "reservas":
+        benchmark_reservas(args.habitaciones, args.reservas, args.consultas)
+    elif args.prueba == "diario":
+        benchmark_diario(args.habitaciones, args.eventos)
+    elif args.prueba == "analitica":
+        benchmark_analitica(args.habitaciones, args.estadias)
+
+
+if __name__ == "__main__":
+    main()
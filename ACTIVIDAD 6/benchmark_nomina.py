@@ -0,0 +1,215 @@
+"""
+Mediciones de rendimiento de la nómina.
+
+Uso:
+    python benchmark_nomina.py memoria [--empleados 1000000]
+    python benchmark_nomina.py calculo [--empleados 200000]
+    python benchmark_nomina.py reporte [--empleados 1000000] [--procesos 4]
+    python benchmark_nomina.py persistencia [--empleados 1000000]
+
+``memoria`` compara la memoria de una lista de objetos ``Empleado`` (como
+guardaba ``NominaApp``) con ``ColeccionEmpleados``. Los nombres se crean
+como objetos nuevos, igual que al leerlos de un formulario o un archivo,
+así que en la lista no se comparten aunque se repitan.
+
+``calculo`` compara el ciclo original sobre ``salario_mensual`` con el
+cálculo vectorizado de ``calculo_nomina`` y comprueba que den lo mismo.
+
+``reporte`` compara la escritura original de ``Nomina.txt`` (un
+``f.write`` por empleado) con ``reportes_nomina.escribir_reporte`` en
+cada formato, en un solo proceso y con un pool de procesos.
+
+``persistencia`` compara guardar y volver a cargar todos los empleados
+con ``persistencia_nomina`` (binario por columnas) frente a exportarlos a
+CSV y leerlos de nuevo fila por fila, y comprueba que la carga binaria
+devuelva exactamente los mismos datos y totales.
+"""
+
+import argparse
+import gc
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+
+from calculo_nomina import _resumir_con_ciclo, resumir_nomina
+from modelo_nomina import CARGOS, GENEROS, ColeccionEmpleados, Empleado
+from persistencia_nomina import cargar_empleados, guardar_empleados, leer_csv
+from reportes_nomina import FORMATOS, escribir_reporte
+
+_NOMBRES = ("Ana", "Luis", "María", "José", "Carlos", "Lucía", "Pedro", "Sofía",
+            "Andrés", "Valentina", "Jorge", "Camila", "Diego", "Paula", "Juan")
+_APELLIDOS = ("García", "Rodríguez", "Martínez", "López", "González", "Pérez",
+              "Sánchez", "Ramírez", "Torres", "Díaz", "Vargas", "Castro")
+
+
+def generar_empleados(cantidad: int, semilla: int = 1):
+    azar = random.Random(semilla)
+    for _ in range(cantidad):
+        yield Empleado(
+            "".join(azar.choice(_NOMBRES)),  # str nuevo, como si viniera de un archivo
+            " ".join((azar.choice(_APELLIDOS), azar.choice(_APELLIDOS))),
+            azar.choice(CARGOS),
+            azar.choice(GENEROS),
+            round(azar.uniform(40_000, 400_000), 2),
+            azar.randint(1, 31),
+            round(azar.uniform(0, 500_000), 2),
+            round(azar.uniform(0, 200_000), 2),
+            round(azar.uniform(0, 200_000), 2),
+        )
+
+
+def memoria_de(construir):
+    """Devuelve el objeto creado por ``construir`` y los bytes que quedan ocupados."""
+    gc.collect()
+    tracemalloc.start()
+    objeto = construir()
+    gc.collect()
+    retenidos = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return objeto, retenidos
+
+
+def benchmark_memoria(cantidad: int) -> None:
+    lista, m_lista = memoria_de(lambda: list(generar_empleados(cantidad)))
+    del lista
+    coleccion, m_coleccion = memoria_de(
+        lambda: ColeccionEmpleados(generar_empleados(cantidad))
+    )
+    print(f"{cantidad} empleados")
+    print(f"Lista de Empleado:  {m_lista / 2**20:8.1f} MB ({m_lista / cantidad:.0f} bytes c/u)")
+    print(f"ColeccionEmpleados: {m_coleccion / 2**20:8.1f} MB ({m_coleccion / cantidad:.0f} bytes c/u)")
+    print(f"Reducción: {m_lista / m_coleccion:.1f}x")
+    assert len(coleccion) == cantidad
+
+
+def benchmark_calculo(cantidad: int) -> None:
+    lista = list(generar_empleados(cantidad))
+    coleccion = ColeccionEmpleados(lista)
+
+    inicio = time.perf_counter()
+    esperado = _resumir_con_ciclo(lista)
+    t_ciclo = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    desde_lista = resumir_nomina(lista)
+    t_lista = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    desde_coleccion = resumir_nomina(coleccion)
+    t_coleccion = time.perf_counter() - inicio
+
+    assert desde_lista == esperado and desde_coleccion == esperado
+    print(f"{cantidad} empleados (resultados idénticos)")
+    print(f"Ciclo sobre salario_mensual:          {t_ciclo * 1000:8.1f} ms")
+    print(f"Vectorizado desde lista de Empleado:  {t_lista * 1000:8.1f} ms")
+    print(f"Vectorizado desde ColeccionEmpleados: {t_coleccion * 1000:8.1f} ms")
+
+
+def _escribir_por_fila(empleados, ruta: str) -> None:
+    """Copia de la escritura original de guardar_archivo_nomina."""
+    total_nomina = 0.0
+    with open(ruta, "w", encoding="utf-8") as f:
+        f.write("NÓMINA DE EMPLEADOS\n")
+        f.write("=" * 60 + "\n")
+        for emp in empleados:
+            salario_m = emp.salario_mensual
+            total_nomina += salario_m
+            linea = (
+                f"{emp.nombre} {emp.apellidos} | "
+                f"Cargo: {emp.cargo.value} | "
+                f"Género: {emp.genero.value} | "
+                f"Salario mensual: {salario_m:.2f}\n"
+            )
+            f.write(linea)
+        f.write("=" * 60 + "\n")
+        f.write(f"TOTAL NÓMINA: {total_nomina:.2f}\n")
+
+
+def benchmark_reporte(cantidad: int, procesos: int) -> None:
+    lista = list(generar_empleados(cantidad))
+    coleccion = ColeccionEmpleados(lista)
+    with tempfile.TemporaryDirectory() as carpeta:
+        def medir(descripcion, escribir, ruta):
+            inicio = time.perf_counter()
+            escribir(ruta)
+            duracion = time.perf_counter() - inicio
+            megas = os.path.getsize(ruta) / 2**20
+            print(f"{descripcion:<34} {duracion:6.2f} s {cantidad / duracion:>11,.0f} filas/s "
+                  f"{megas / duracion:7.1f} MB/s")
+
+        original = os.path.join(carpeta, "original.txt")
+        medir("texto, f.write por fila (original)", lambda r: _escribir_por_fila(lista, r), original)
+        for formato in FORMATOS:
+            ruta = os.path.join(carpeta, f"lotes.{formato}")
+            medir(f"{formato}, por lotes",
+                  lambda r: escribir_reporte(coleccion, r, formato), ruta)
+            medir(f"{formato}, por lotes con {procesos} procesos",
+                  lambda r: escribir_reporte(coleccion, r, formato, procesos=procesos), ruta)
+            if formato == "texto":
+                # las filas, igual que el original; el pie usa la suma exacta
+                # de totales() en vez de la suma fila por fila del original
+                with open(original, encoding="utf-8") as a, open(ruta, encoding="utf-8") as b:
+                    filas_original, filas_lotes = a.read().splitlines(), b.read().splitlines()
+                assert filas_original[:-1] == filas_lotes[:-1], "el reporte por lotes difiere del original"
+                assert filas_lotes[-1] == f"TOTAL NÓMINA: {coleccion.totales().total:.2f}"
+
+
+def benchmark_persistencia(cantidad: int) -> None:
+    coleccion = ColeccionEmpleados(generar_empleados(cantidad))
+    with tempfile.TemporaryDirectory() as carpeta:
+        def medir(descripcion, operacion, ruta):
+            gc.collect()
+            inicio = time.perf_counter()
+            resultado = operacion()
+            duracion = time.perf_counter() - inicio
+            megas = os.path.getsize(ruta) / 2**20
+            print(f"{descripcion:<22} {duracion:6.2f} s ({megas:6.1f} MB en disco)")
+            return resultado
+
+        binario = os.path.join(carpeta, "empleados.nom")
+        texto = os.path.join(carpeta, "empleados.csv")
+        print(f"{cantidad} empleados")
+        medir("guardar binario", lambda: guardar_empleados(coleccion, binario), binario)
+        cargada = medir("cargar binario", lambda: cargar_empleados(binario), binario)
+        medir("exportar CSV", lambda: escribir_reporte(coleccion, texto, "csv"), texto)
+        desde_csv = medir("leer CSV fila por fila", lambda: leer_csv(texto), texto)
+
+    assert cargada.totales() == coleccion.totales()
+    assert cargada.nombres == coleccion.nombres and cargada.apellidos == coleccion.apellidos
+    columnas = coleccion.columnas_numericas()
+    assert cargada.columnas_numericas() == columnas == desde_csv.columnas_numericas()
+    print("Datos y totales idénticos al original.")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    sub = parser.add_subparsers(dest="prueba", required=True)
+
+    p_mem = sub.add_parser("memoria", help="lista de Empleado vs. ColeccionEmpleados")
+    p_mem.add_argument("--empleados", type=int, default=1_000_000)
+
+    p_cal = sub.add_parser("calculo", help="ciclo de salario_mensual vs. cálculo vectorizado")
+    p_cal.add_argument("--empleados", type=int, default=200_000)
+
+    p_rep = sub.add_parser("reporte", help="escritura de Nomina.txt por fila vs. por lotes")
+    p_rep.add_argument("--empleados", type=int, default=1_000_000)
+    p_rep.add_argument("--procesos", type=int, default=os.cpu_count() or 2)
+
+    p_per = sub.add_parser("persistencia", help="archivo binario por columnas vs. CSV")
+    p_per.add_argument("--empleados", type=int, default=1_000_000)
+
+    args = parser.parse_args()
+    if args.prueba == "memoria":
+        benchmark_memoria(args.empleados)
+    elif args.prueba == "calculo":
+        benchmark_calculo(args.empleados)
+    elif args.prueba == "reporte":
+        benchmark_reporte(args.empleados, args.procesos)
+    elif args.prueba == "persistencia":
+        benchmark_persistencia(args.empleados)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+"""
+Cálculo de la nómina por columnas.
+
+En lugar de pedir ``salario_mensual`` a cada ``Empleado`` dentro de un
+ciclo de Python, los datos se guardan en un arreglo de NumPy por campo y
+todos los salarios, el total y los subtotales por cargo y por género se
+calculan con operaciones sobre arreglos completos.
+
+Los resultados son idénticos (bit a bit) a los del ciclo original: cada
+salario se calcula con las mismas operaciones en el mismo orden que la
+propiedad, y las sumas se acumulan secuencialmente (``cumsum`` y
+``bincount`` suman en orden) en lugar de con la suma por pares de
+``np.sum``, que redondea distinto.
+
+``ordenar_empleados`` calcula el orden de la nómina por cualquier campo
+sobre las columnas (con ``argsort`` cuando hay NumPy), para que las
+tablas ordenen los datos y no los elementos del widget.
+
+NumPy es opcional: si no está instalado, ``resumir_nomina`` hace el
+mismo cálculo con un ciclo de Python y el orden se calcula con ``sorted``.
+"""
+
+from array import array
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Sequence
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from modelo_nomina import CARGOS, GENEROS, ColeccionEmpleados, Empleado, TipoCargo, TipoGenero
+
+
+@dataclass
+class ResumenNomina:
+    salarios: List[float]  # salario mensual de cada empleado, en el mismo orden
+    total: float
+    por_cargo: Dict[TipoCargo, float]
+    por_genero: Dict[TipoGenero, float]
+    empleados_por_cargo: Dict[TipoCargo, int]
+    empleados_por_genero: Dict[TipoGenero, int]
+
+
+class NominaColumnar:
+    """Empleados guardados como un arreglo de NumPy por campo."""
+
+    def __init__(
+        self,
+        salario_dia: Sequence[float],
+        dias_trabajados: Sequence[int],
+        otros_ingresos: Sequence[float],
+        pagos_salud: Sequence[float],
+        aporte_pensiones: Sequence[float],
+        cargo: Sequence[int],
+        genero: Sequence[int],
+    ):
+        if np is None:
+            raise RuntimeError("NominaColumnar necesita NumPy (pip install numpy).")
+        self.salario_dia = np.asarray(salario_dia, dtype=np.float64)
+        self.dias_trabajados = np.asarray(dias_trabajados, dtype=np.int64)
+        self.otros_ingresos = np.asarray(otros_ingresos, dtype=np.float64)
+        self.pagos_salud = np.asarray(pagos_salud, dtype=np.float64)
+        self.aporte_pensiones = np.asarray(aporte_pensiones, dtype=np.float64)
+        self.cargo = np.asarray(cargo, dtype=np.int8)    # posición en CARGOS
+        self.genero = np.asarray(genero, dtype=np.int8)  # posición en GENEROS
+
+    @classmethod
+    def desde_empleados(cls, empleados: Sequence[Empleado]) -> "NominaColumnar":
+        cantidad = len(empleados)
+        codigo_cargo = {c: i for i, c in enumerate(CARGOS)}
+        codigo_genero = {g: i for i, g in enumerate(GENEROS)}
+
+        def columna(campo, dtype):
+            return np.fromiter((getattr(e, campo) for e in empleados), dtype=dtype, count=cantidad)
+
+        return cls(
+            columna("salario_dia", np.float64),
+            columna("dias_trabajados", np.int64),
+            columna("otros_ingresos", np.float64),
+            columna("pagos_salud", np.float64),
+            columna("aporte_pensiones", np.float64),
+            np.fromiter((codigo_cargo[e.cargo] for e in empleados), dtype=np.int8, count=cantidad),
+            np.fromiter((codigo_genero[e.genero] for e in empleados), dtype=np.int8, count=cantidad),
+        )
+
+    @classmethod
+    def desde_coleccion(cls, coleccion: ColeccionEmpleados) -> "NominaColumnar":
+        """Copia las columnas de la colección (por el protocolo de buffer, sin recorrerlas)."""
+        columnas = coleccion.columnas_numericas()
+        # np.array copia; una vista sobre el array impediría que la colección crezca
+        return cls(**{campo: np.array(valores) for campo, valores in columnas.items()})
+
+    def __len__(self) -> int:
+        return len(self.salario_dia)
+
+    def salarios_mensuales(self) -> "np.ndarray":
+        # mismo orden de operaciones que Empleado.salario_mensual
+        return (
+            self.dias_trabajados * self.salario_dia
+            + self.otros_ingresos
+            - self.pagos_salud
+            - self.aporte_pensiones
+        )
+
+    def resumen(self) -> ResumenNomina:
+        salarios = self.salarios_mensuales()
+        total = float(np.cumsum(salarios)[-1]) if len(salarios) else 0.0
+        suma_cargo = np.bincount(self.cargo, weights=salarios, minlength=len(CARGOS))
+        suma_genero = np.bincount(self.genero, weights=salarios, minlength=len(GENEROS))
+        cuenta_cargo = np.bincount(self.cargo, minlength=len(CARGOS))
+        cuenta_genero = np.bincount(self.genero, minlength=len(GENEROS))
+        return ResumenNomina(
+            salarios=salarios.tolist(),
+            total=total,
+            por_cargo={c: float(suma_cargo[i]) for i, c in enumerate(CARGOS)},
+            por_genero={g: float(suma_genero[i]) for i, g in enumerate(GENEROS)},
+            empleados_por_cargo={c: int(cuenta_cargo[i]) for i, c in enumerate(CARGOS)},
+            empleados_por_genero={g: int(cuenta_genero[i]) for i, g in enumerate(GENEROS)},
+        )
+
+
+def _resumir_con_ciclo(empleados: Iterable[Empleado]) -> ResumenNomina:
+    """Cálculo original, empleado por empleado (se usa si no hay NumPy)."""
+    resumen = ResumenNomina(
+        salarios=[],
+        total=0.0,
+        por_cargo=dict.fromkeys(CARGOS, 0.0),
+        por_genero=dict.fromkeys(GENEROS, 0.0),
+        empleados_por_cargo=dict.fromkeys(CARGOS, 0),
+        empleados_por_genero=dict.fromkeys(GENEROS, 0),
+    )
+    for emp in empleados:
+        salario_m = emp.salario_mensual
+        resumen.salarios.append(salario_m)
+        resumen.total += salario_m
+        resumen.por_cargo[emp.cargo] += salario_m
+        resumen.por_genero[emp.genero] += salario_m
+        resumen.empleados_por_cargo[emp.cargo] += 1
+        resumen.empleados_por_genero[emp.genero] += 1
+    return resumen
+
+
+def resumir_nomina(empleados: Sequence[Empleado]) -> ResumenNomina:
+    """Salarios, total y subtotales de la nómina; vectorizado si NumPy está disponible."""
+    if np is None:
+        return _resumir_con_ciclo(empleados)
+    if isinstance(empleados, ColeccionEmpleados):
+        return NominaColumnar.desde_coleccion(empleados).resumen()
+    return NominaColumnar.desde_empleados(empleados).resumen()
+
+
+# ==========================
+#  ORDEN POR COLUMNA
+# ==========================
+
+CAMPOS_ORDENABLES = (
+    "nombre", "apellidos", "cargo", "genero", *ColeccionEmpleados.CAMPOS_NUMERICOS,
+    "salario_mensual",
+)
+
+
+def _claves_orden(coleccion: ColeccionEmpleados, campo: str) -> Sequence:
+    """Una clave comparable por empleado (en el orden de la colección)."""
+    if campo in ("nombre", "apellidos"):
+        valores = coleccion.nombres if campo == "nombre" else coleccion.apellidos
+        plegados: Dict[str, str] = {}  # los nombres se repiten: casefold una vez por valor
+        return [plegados.get(v) or plegados.setdefault(v, v.casefold()) for v in valores]
+    if campo in ("cargo", "genero"):
+        # por el texto que se muestra, no por el orden de definición del enum
+        miembros = CARGOS if campo == "cargo" else GENEROS
+        por_texto = sorted(range(len(miembros)), key=lambda i: miembros[i].value)
+        tabla = bytearray(256)
+        for rango, codigo in enumerate(por_texto):
+            tabla[codigo] = rango
+        codigos = coleccion.cargo if campo == "cargo" else coleccion.genero
+        # los códigos son bytes: translate cambia cada código por su rango en C
+        return array("b", codigos.tobytes().translate(tabla))
+    if campo == "salario_mensual":
+        if np is not None:
+            return NominaColumnar.desde_coleccion(coleccion).salarios_mensuales()
+        return [fila.salario_mensual for fila in coleccion]
+    if campo in ColeccionEmpleados.CAMPOS_NUMERICOS:
+        return getattr(coleccion, campo)
+    raise ValueError(f"No se puede ordenar por {campo}.")
+
+
+def ordenar_empleados(coleccion: ColeccionEmpleados, campo: str) -> Sequence[int]:
+    """
+    Posiciones de los empleados ordenadas por ``campo`` (ascendente y estable).
+
+    Para el orden descendente basta con recorrer el resultado al revés.
+    """
+    claves = _claves_orden(coleccion, campo)
+    if np is not None and not isinstance(claves, list):
+        return np.argsort(np.asarray(claves), kind="stable")
+    # textos: sorted compara str más rápido de lo que NumPy tarda en convertirlos
+    return sorted(range(len(coleccion)), key=claves.__getitem__)
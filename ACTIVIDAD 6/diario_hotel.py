@@ -0,0 +1,200 @@
+"""
+Estado del hotel en disco: diario de ingresos y salidas con instantáneas.
+
+``DiarioHotel`` se suscribe al ``Hotel`` con ``suscribir_antes`` y
+agrega cada ``ocupar`` y ``liberar`` al final del diario
+(``hotel.diario``), una línea JSON por evento con un número de
+secuencia, antes de que el cambio se aplique: si escribir falla, el
+``OSError`` sale de ``ocupar``/``liberar``, lo escrito a medias se
+descarta y la habitación queda como estaba. Cada ``eventos_por_instantanea``
+eventos (antes de escribir el siguiente) guarda una instantánea (``hotel.instantanea``) con las
+habitaciones ocupadas y la última secuencia que incluye, y vacía el
+diario. Al abrir se carga la instantánea y se repiten solo los eventos
+posteriores, así que la recuperación nunca tiene que leer más de
+``eventos_por_instantanea`` eventos, sin importar cuánto tiempo lleve
+funcionando el hotel.
+
+Cada evento se escribe en el archivo en cuanto ocurre (sobrevive a que se
+cierre el programa), pero ``fsync`` se hace por lotes: cada ``lote_fsync``
+eventos o cuando pasan ``intervalo_fsync`` segundos desde el anterior.
+Si se corta la luz se pueden perder a lo sumo los eventos de un lote;
+con ``lote_fsync=1`` no se pierde ninguno, a costa de mucha más latencia.
+La instantánea se escribe en un archivo temporal y reemplaza a la
+anterior con ``os.replace``.
+"""
+
+import json
+import os
+import time
+from datetime import date
+from typing import Any, Dict, List
+
+from archivos_durables import fsync_carpeta
+from modelo_hotel import LIBERAR, OCUPAR, CambioHabitacion, Habitacion, Hotel, Huesped
+
+ARCHIVO_DIARIO = "hotel.diario"
+ARCHIVO_INSTANTANEA = "hotel.instantanea"
+LOTE_FSYNC = 64
+INTERVALO_FSYNC = 1.0  # segundos
+EVENTOS_POR_INSTANTANEA = 10_000
+
+
+def _huesped_a_lista(huesped: Huesped) -> List[str]:
+    return [huesped.nombre, huesped.apellidos, huesped.documento]
+
+
+class DiarioHotel:
+    """Mantiene en disco el estado de ``hotel`` y lo recupera al abrirse."""
+
+    def __init__(
+        self,
+        carpeta: str,
+        hotel: Hotel,
+        lote_fsync: int = LOTE_FSYNC,
+        intervalo_fsync: float = INTERVALO_FSYNC,
+        eventos_por_instantanea: int = EVENTOS_POR_INSTANTANEA,
+    ) -> None:
+        """``hotel`` debe tener todas sus habitaciones libres; se le aplica el estado guardado."""
+        if lote_fsync < 1 or eventos_por_instantanea < 1:
+            raise ValueError("lote_fsync y eventos_por_instantanea deben ser al menos 1.")
+        if hotel.ocupadas:
+            raise ValueError("El hotel a recuperar debe tener todas las habitaciones libres.")
+        self.hotel = hotel
+        self.lote_fsync = lote_fsync
+        self.intervalo_fsync = intervalo_fsync
+        self.eventos_por_instantanea = eventos_por_instantanea
+        os.makedirs(carpeta, exist_ok=True)
+        self.ruta_diario = os.path.join(carpeta, ARCHIVO_DIARIO)
+        self.ruta_instantanea = os.path.join(carpeta, ARCHIVO_INSTANTANEA)
+
+        self.secuencia = 0           # último evento aplicado
+        self.eventos_repetidos = 0   # eventos del diario aplicados al recuperar
+        self._desde_instantanea = 0  # eventos escritos desde la última instantánea
+        self._sin_fsync = 0
+        self._ultimo_fsync = time.monotonic()
+
+        self._recuperar()
+        # sin buffer: cada evento es una escritura directa que se puede deshacer si falla
+        self._archivo = open(self.ruta_diario, "ab", buffering=0)
+        hotel.suscribir_antes(self._registrar)
+
+    # ---------- Recuperación ----------
+
+    def _recuperar(self) -> None:
+        if os.path.exists(self.ruta_instantanea):
+            with open(self.ruta_instantanea, encoding="utf-8") as f:
+                instantanea = json.load(f)
+            self.secuencia = instantanea["secuencia"]
+            for numero, fecha_ingreso, huesped in instantanea["ocupadas"]:
+                self._habitacion(numero).ocupar(Huesped(*huesped), date.fromisoformat(fecha_ingreso))
+
+        if not os.path.exists(self.ruta_diario):
+            return
+        valido = 0  # hasta dónde el diario está completo
+        with open(self.ruta_diario, "rb") as f:
+            for linea in f:
+                try:
+                    evento = json.loads(linea)
+                except ValueError:
+                    break  # última línea a medio escribir (el programa se cerró de golpe)
+                if not linea.endswith(b"\n"):
+                    break
+                valido += len(linea)
+                if evento["s"] <= self.secuencia:
+                    continue  # ya estaba en la instantánea
+                self._aplicar(evento)
+                self.secuencia = evento["s"]
+                self.eventos_repetidos += 1
+        if valido != os.path.getsize(self.ruta_diario):
+            with open(self.ruta_diario, "r+b") as f:
+                f.truncate(valido)
+        self._desde_instantanea = self.eventos_repetidos
+
+    def _habitacion(self, numero: int) -> Habitacion:
+        habitacion = self.hotel.buscar_habitacion(numero)
+        if habitacion is None:
+            raise ValueError(f"El diario menciona la habitación {numero}, que no existe en el hotel.")
+        return habitacion
+
+    def _aplicar(self, evento: Dict[str, Any]) -> None:
+        habitacion = self._habitacion(evento["habitacion"])
+        fecha = date.fromisoformat(evento["fecha"])
+        if evento["tipo"] == OCUPAR:
+            habitacion.ocupar(Huesped(*evento["huesped"]), fecha)
+        elif evento["tipo"] == LIBERAR:
+            habitacion.liberar(fecha)
+        else:
+            raise ValueError(f"Evento desconocido en el diario: {evento['tipo']}")
+
+    # ---------- Registro ----------
+
+    def _registrar(self, habitacion: Habitacion, cambio: CambioHabitacion) -> None:
+        """Escribe ``cambio`` antes de que se aplique (el hotel todavía no lo tiene)."""
+        if self._desde_instantanea >= self.eventos_por_instantanea:
+            self.instantanea()
+
+        secuencia = self.secuencia + 1
+        evento: Dict[str, Any] = {"s": secuencia, "tipo": cambio.tipo, "habitacion": cambio.numero}
+        if cambio.tipo == OCUPAR:
+            evento["fecha"] = cambio.fecha_ingreso.isoformat()
+            evento["huesped"] = _huesped_a_lista(cambio.huesped)
+        else:
+            evento["fecha"] = cambio.fecha_salida.isoformat()
+        datos = json.dumps(evento, ensure_ascii=False).encode("utf-8") + b"\n"
+        posicion = self._archivo.seek(0, os.SEEK_END)
+        try:
+            escritos = 0
+            while escritos < len(datos):
+                escritos += self._archivo.write(datos[escritos:])
+            self._sin_fsync += 1
+            if (self._sin_fsync >= self.lote_fsync
+                    or time.monotonic() - self._ultimo_fsync >= self.intervalo_fsync):
+                self.sincronizar()
+        except OSError:
+            # el cambio no se va a aplicar: que el evento tampoco quede en el diario
+            self._descartar_desde(posicion)
+            raise
+        self.secuencia = secuencia
+        self._desde_instantanea += 1
+
+    def _descartar_desde(self, posicion: int) -> None:
+        try:
+            self._archivo.truncate(posicion)
+        except OSError:
+            pass  # al recuperar, una línea a medio escribir se descarta igual
+
+    def sincronizar(self) -> None:
+        """Fuerza al disco los eventos escritos desde el último ``fsync``."""
+        if self._sin_fsync:
+            os.fsync(self._archivo.fileno())
+            self._sin_fsync = 0
+        self._ultimo_fsync = time.monotonic()
+
+    def instantanea(self) -> None:
+        """Guarda el estado actual y vacía el diario."""
+        ocupadas = []
+        for numero in sorted(self.hotel.ocupadas):
+            h = self.hotel.buscar_habitacion(numero)
+            ocupadas.append([numero, h.fecha_ingreso.isoformat(), _huesped_a_lista(h.huesped)])
+        datos = json.dumps({"secuencia": self.secuencia, "ocupadas": ocupadas}, ensure_ascii=False)
+
+        archivo_temporal = self.ruta_instantanea + ".tmp"
+        with open(archivo_temporal, "w", encoding="utf-8") as f:
+            f.write(datos)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(archivo_temporal, self.ruta_instantanea)
+        fsync_carpeta(self.ruta_instantanea)
+
+        # si se corta aquí, los eventos viejos del diario se saltan por su secuencia
+        self._archivo.truncate(0)
+        os.fsync(self._archivo.fileno())
+        self._sin_fsync = 0
+        self._ultimo_fsync = time.monotonic()
+        self._desde_instantanea = 0
+
+    def cerrar(self) -> None:
+        if not self._archivo.closed:
+            self.hotel.desuscribir_antes(self._registrar)
+            self.sincronizar()
+            self._archivo.close()
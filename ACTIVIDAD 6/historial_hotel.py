@@ -0,0 +1,171 @@
+"""
+Historial de estadías terminadas, guardado por columnas.
+
+``Habitacion.liberar`` calcula el valor de una estadía y la olvida;
+``HistorialEstadias`` se suscribe al ``Hotel`` y guarda cada salida en un
+``array`` por campo (habitación, ingreso, salida, precio por día y
+total), que es lo que necesita ``analitica_hotel`` para calcular los
+indicadores de millones de estadías sin recorrerlas una por una.
+
+Con ``ruta`` cada estadía se agrega además al final de un archivo de
+registros fijos (``REGISTRO``), con ``fsync`` por registro, y el
+historial se vuelve a leer al abrirlo. Las fechas se guardan como
+ordinales (``date.toordinal``).
+
+El diario del hotel (diario_hotel.py) escribe la salida antes de
+aplicarla y el historial la guarda después, así que si el programa se
+cae entre las dos escrituras la estadía falta en el historial. Por eso
+el historial se suscribe al hotel antes de que el diario lo recupere:
+las salidas que el diario repite y que ya están entre las últimas
+``recientes`` estadías se ignoran, y las que faltan se agregan.
+"""
+
+import os
+import struct
+from array import array
+from collections import deque
+from datetime import date
+from typing import Deque, Dict, Iterator, NamedTuple, Optional, Set, Tuple
+
+from diario_hotel import EVENTOS_POR_INSTANTANEA
+from modelo_hotel import LIBERAR, CambioHabitacion, Habitacion, Hotel
+
+# habitación, ingreso, salida, precio por día, total (little-endian)
+REGISTRO = struct.Struct("<iiidd")
+
+# (habitación, ingreso, salida) como ordinales
+ClaveEstadia = Tuple[int, int, int]
+
+
+class Estadia(NamedTuple):
+    habitacion: int
+    ingreso: date
+    salida: date
+    precio_dia: float
+    total: float
+
+
+class HistorialEstadias:
+    """Estadías terminadas, un ``array`` por campo."""
+
+    def __init__(
+        self,
+        ruta: Optional[str] = None,
+        fsync: bool = True,
+        recientes: int = EVENTOS_POR_INSTANTANEA,
+    ) -> None:
+        """``recientes`` debe cubrir las salidas que el diario puede repetir al recuperar."""
+        self.habitacion = array("i")
+        self.ingreso = array("i")
+        self.salida = array("i")
+        self.precio_dia = array("d")
+        self.total = array("d")
+        self.ruta = ruta
+        self.fsync = fsync
+        self._archivo = None
+        if ruta is not None:
+            self._leer(ruta)
+            self._archivo = open(ruta, "ab", buffering=0)
+        # claves de las últimas estadías, para no duplicar las salidas repetidas del diario
+        self._recientes: Deque[ClaveEstadia] = deque(maxlen=recientes)
+        self._claves_recientes: Set[ClaveEstadia] = set()
+        for i in range(max(len(self) - recientes, 0), len(self)):
+            self._recordar((self.habitacion[i], self.ingreso[i], self.salida[i]))
+
+    def _leer(self, ruta: str) -> None:
+        if not os.path.exists(ruta):
+            return
+        with open(ruta, "rb") as f:
+            datos = f.read()
+        completos = len(datos) - len(datos) % REGISTRO.size  # sin un registro a medio escribir
+        for registro in REGISTRO.iter_unpack(datos[:completos]):
+            self._agregar_columnas(*registro)
+        if completos != len(datos):
+            with open(ruta, "r+b") as f:
+                f.truncate(completos)
+
+    def _agregar_columnas(self, habitacion: int, ingreso: int, salida: int,
+                          precio_dia: float, total: float) -> None:
+        self.habitacion.append(habitacion)
+        self.ingreso.append(ingreso)
+        self.salida.append(salida)
+        self.precio_dia.append(precio_dia)
+        self.total.append(total)
+
+    # ---------- Registro ----------
+
+    def agregar(self, habitacion: int, ingreso: date, salida: date,
+                precio_dia: float, total: float) -> None:
+        if salida <= ingreso:
+            raise ValueError("La fecha de salida debe ser posterior a la de ingreso.")
+        registro = (habitacion, ingreso.toordinal(), salida.toordinal(), precio_dia, total)
+        if self._archivo is not None:
+            datos = REGISTRO.pack(*registro)
+            posicion = self._archivo.seek(0, os.SEEK_END)
+            try:
+                escritos = 0
+                while escritos < len(datos):
+                    escritos += self._archivo.write(datos[escritos:])
+                if self.fsync:
+                    os.fsync(self._archivo.fileno())
+            except OSError:
+                try:
+                    self._archivo.truncate(posicion)  # sin un registro a medias
+                except OSError:
+                    pass  # al abrir, un registro incompleto al final se descarta igual
+                raise
+        self._agregar_columnas(*registro)
+
+    def _recordar(self, clave: ClaveEstadia) -> None:
+        if len(self._recientes) == self._recientes.maxlen:
+            self._claves_recientes.discard(self._recientes[0])
+        self._recientes.append(clave)
+        self._claves_recientes.add(clave)
+
+    def _al_cambiar(self, habitacion: Habitacion, cambio: CambioHabitacion) -> None:
+        if cambio.tipo != LIBERAR:
+            return
+        clave = (cambio.numero, cambio.fecha_ingreso.toordinal(), cambio.fecha_salida.toordinal())
+        if clave in self._claves_recientes:
+            return  # salida repetida por el diario al recuperar, ya guardada
+        self.agregar(cambio.numero, cambio.fecha_ingreso, cambio.fecha_salida,
+                     habitacion.precio_dia, cambio.total)
+        self._recordar(clave)
+
+    def registrar_salidas_de(self, hotel: Hotel) -> None:
+        """
+        Agrega al historial cada salida que ocurra en ``hotel`` desde ahora.
+
+        Con un diario, llamarlo antes de crear el ``DiarioHotel``: así se
+        agregan las salidas del diario que no llegaron al historial.
+        """
+        hotel.suscribir(self._al_cambiar)
+
+    def cerrar(self) -> None:
+        if self._archivo is not None:
+            self._archivo.close()
+            self._archivo = None
+
+    # ---------- Consulta ----------
+
+    def __len__(self) -> int:
+        return len(self.habitacion)
+
+    def __getitem__(self, indice: int) -> Estadia:
+        return Estadia(
+            self.habitacion[indice],
+            date.fromordinal(self.ingreso[indice]),
+            date.fromordinal(self.salida[indice]),
+            self.precio_dia[indice],
+            self.total[indice],
+        )
+
+    def __iter__(self) -> Iterator[Estadia]:
+        return (self[i] for i in range(len(self)))
+
+    def columnas(self) -> Dict[str, array]:
+        """Las columnas tal cual (sin copiar), para pasarlas a NumPy."""
+        return {
+            "habitacion": self.habitacion, "ingreso": self.ingreso, "salida": self.salida,
+            "precio_dia": self.precio_dia, "total": self.total,
+        }
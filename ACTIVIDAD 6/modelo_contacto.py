@@ -0,0 +1,27 @@
+"""
+Contacto de la agenda de Ejercicio_9.1.py y su resumen de una línea
+para la lista.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass
+class Contacto:
+    nombres: str
+    apellidos: str
+    fecha_nacimiento: datetime.date
+    direccion: str
+    telefono: str
+    correo: str
+
+    def resumen(self) -> str:
+        """Cadena que se mostrará en la lista gráfica."""
+        fecha_str = self.fecha_nacimiento.strftime("%Y-%m-%d")
+        return (
+            f"{self.nombres} {self.apellidos} | "
+            f"Fecha nac.: {fecha_str} | "
+            f"Tel: {self.telefono} | "
+            f"Correo: {self.correo}"
+        )
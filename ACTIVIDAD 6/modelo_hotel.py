@@ -0,0 +1,191 @@
+"""
+Huéspedes, habitaciones y el hotel de Ejercicio_8.5.py.
+
+Habitaciones 1 a 5: 120000 por día; 6 a 10: 160000 por día.
+
+Cada ``Habitacion`` avisa a sus suscriptores cuando se ocupa o se libera
+(con un ``CambioHabitacion``). ``Hotel`` se suscribe a todas sus
+habitaciones y así mantiene al día un diccionario por número y los
+conjuntos de habitaciones libres y ocupadas: buscar una habitación o
+contar las ocupadas no recorre el hotel, aunque tenga miles de
+habitaciones. Quien necesite enterarse de los cambios de cualquier
+habitación (la interfaz, el historial) se suscribe al ``Hotel``.
+
+Con ``suscribir_antes`` el aviso llega antes de aplicar el cambio, ya
+validado: si el suscriptor lanza una excepción la habitación queda como
+estaba. Así el diario escribe cada cambio en disco antes de hacerlo en
+memoria, y un error de escritura no los deja distintos.
+"""
+
+from dataclasses import dataclass
+from datetime import date
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Set
+
+
+@dataclass
+class Huesped:
+    nombre: str
+    apellidos: str
+    documento: str
+
+
+OCUPAR = "ocupar"
+LIBERAR = "liberar"
+
+
+class CambioHabitacion(NamedTuple):
+    tipo: str  # OCUPAR o LIBERAR
+    numero: int
+    huesped: Huesped
+    fecha_ingreso: date
+    fecha_salida: Optional[date] = None  # solo al liberar
+    total: float = 0.0                   # valor pagado, solo al liberar
+
+
+Suscriptor = Callable[["Habitacion", CambioHabitacion], None]
+
+
+class Habitacion:
+    def __init__(self, numero: int, precio_dia: float):
+        self.numero: int = numero
+        self.precio_dia: float = precio_dia
+        self.disponible: bool = True
+        self.huesped: Optional[Huesped] = None
+        self.fecha_ingreso: Optional[date] = None
+        self._suscriptores: List[Suscriptor] = []
+        self._suscriptores_antes: List[Suscriptor] = []
+
+    def suscribir(self, funcion: Suscriptor) -> None:
+        """``funcion(habitacion, cambio)`` se llama después de cada ``ocupar`` o ``liberar``."""
+        self._suscriptores.append(funcion)
+
+    def suscribir_antes(self, funcion: Suscriptor) -> None:
+        """``funcion(habitacion, cambio)`` se llama antes de aplicar el cambio; si falla, no se aplica."""
+        self._suscriptores_antes.append(funcion)
+
+    def _avisar_antes(self, cambio: CambioHabitacion) -> None:
+        for funcion in self._suscriptores_antes:
+            funcion(self, cambio)
+
+    def _notificar(self, cambio: CambioHabitacion) -> None:
+        for funcion in self._suscriptores:
+            funcion(self, cambio)
+
+    def ocupar(self, huesped: Huesped, fecha_ingreso: date) -> None:
+        if not self.disponible:
+            raise ValueError("La habitación ya está ocupada.")
+        cambio = CambioHabitacion(OCUPAR, self.numero, huesped, fecha_ingreso)
+        self._avisar_antes(cambio)
+        self.huesped = huesped
+        self.fecha_ingreso = fecha_ingreso
+        self.disponible = False
+        self._notificar(cambio)
+
+    def liberar(self, fecha_salida: date) -> float:
+        """
+        Libera la habitación y devuelve el valor total a pagar.
+        """
+        if self.disponible or self.fecha_ingreso is None or self.huesped is None:
+            raise ValueError("La habitación no está ocupada.")
+
+        if fecha_salida <= self.fecha_ingreso:
+            raise ValueError("La fecha de salida debe ser posterior a la de ingreso.")
+
+        dias = (fecha_salida - self.fecha_ingreso).days
+        total = dias * self.precio_dia
+
+        cambio = CambioHabitacion(
+            LIBERAR, self.numero, self.huesped, self.fecha_ingreso, fecha_salida, total
+        )
+        self._avisar_antes(cambio)
+
+        # Resetear estado
+        self.disponible = True
+        self.huesped = None
+        self.fecha_ingreso = None
+        self._notificar(cambio)
+
+        return total
+
+    def estado_str(self) -> str:
+        return "Disponible" if self.disponible else "No disponible"
+
+
+class Hotel:
+    def __init__(self, habitaciones: Optional[Iterable[Habitacion]] = None) -> None:
+        """Sin ``habitaciones`` se crean las 10 del enunciado."""
+        self.habitaciones: List[Habitacion] = []
+        self._por_numero: Dict[int, Habitacion] = {}
+        # números de habitación; se mantienen con los avisos de cada habitación
+        self.libres: Set[int] = set()
+        self.ocupadas: Set[int] = set()
+        self._suscriptores: List[Suscriptor] = []
+        self._suscriptores_antes: List[Suscriptor] = []
+        if habitaciones is None:
+            self._crear_habitaciones()
+        else:
+            for h in habitaciones:
+                self.agregar_habitacion(h)
+
+    def _crear_habitaciones(self) -> None:
+        # Habitaciones 1-5: 120000; 6-10: 160000
+        for n in range(1, 11):
+            precio = 120000 if n <= 5 else 160000
+            self.agregar_habitacion(Habitacion(n, precio))
+
+    def agregar_habitacion(self, habitacion: Habitacion) -> None:
+        if habitacion.numero in self._por_numero:
+            raise ValueError(f"Ya existe la habitación {habitacion.numero}.")
+        self.habitaciones.append(habitacion)
+        self._por_numero[habitacion.numero] = habitacion
+        habitacion.suscribir(self._al_cambiar)
+        habitacion.suscribir_antes(self._antes_de_cambiar)
+        self._al_cambiar(habitacion)
+
+    def suscribir(self, funcion: Suscriptor) -> None:
+        """``funcion(habitacion, cambio)`` se llama cuando cambia cualquier habitación."""
+        self._suscriptores.append(funcion)
+
+    def desuscribir(self, funcion: Suscriptor) -> None:
+        self._suscriptores.remove(funcion)
+
+    def suscribir_antes(self, funcion: Suscriptor) -> None:
+        """Como ``Habitacion.suscribir_antes``, para cualquier habitación del hotel."""
+        self._suscriptores_antes.append(funcion)
+
+    def desuscribir_antes(self, funcion: Suscriptor) -> None:
+        self._suscriptores_antes.remove(funcion)
+
+    def _antes_de_cambiar(self, habitacion: Habitacion, cambio: CambioHabitacion) -> None:
+        for funcion in self._suscriptores_antes:
+            funcion(habitacion, cambio)
+
+    def _al_cambiar(self, habitacion: Habitacion, cambio: Optional[CambioHabitacion] = None) -> None:
+        if habitacion.disponible:
+            self.ocupadas.discard(habitacion.numero)
+            self.libres.add(habitacion.numero)
+        else:
+            self.libres.discard(habitacion.numero)
+            self.ocupadas.add(habitacion.numero)
+        if cambio is not None:
+            for funcion in self._suscriptores:
+                funcion(habitacion, cambio)
+
+    def buscar_habitacion(self, numero: int) -> Optional[Habitacion]:
+        return self._por_numero.get(numero)
+
+    # ---------- Ocupación ----------
+
+    def __len__(self) -> int:
+        return len(self.habitaciones)
+
+    @property
+    def cantidad_ocupadas(self) -> int:
+        return len(self.ocupadas)
+
+    @property
+    def cantidad_libres(self) -> int:
+        return len(self.libres)
+
+    def porcentaje_ocupacion(self) -> float:
+        return 100.0 * len(self.ocupadas) / len(self.habitaciones) if self.habitaciones else 0.0
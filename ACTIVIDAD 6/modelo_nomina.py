@@ -0,0 +1,373 @@
+"""
+Cargos, géneros y empleados de la nómina.
+
+``ColeccionEmpleados`` guarda muchos empleados por columnas (un ``array``
+por campo) en lugar de un objeto por empleado, y mantiene los totales de
+la nómina al día a medida que se agregan, editan o quitan empleados.
+"""
+
+import math
+import sys
+from array import array
+from dataclasses import dataclass
+from enum import Enum
+from itertools import compress
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+
+class TipoCargo(Enum):
+    DIRECTIVO = "Directivo"
+    ESTRATEGICO = "Estratégico"
+    OPERATIVO = "Operativo"
+
+
+class TipoGenero(Enum):
+    MASCULINO = "Masculino"
+    FEMENINO = "Femenino"
+
+
+class Empleado:
+    """Modelo de un empleado de la empresa."""
+
+    def __init__(
+        self,
+        nombre: str,
+        apellidos: str,
+        cargo: TipoCargo,
+        genero: TipoGenero,
+        salario_dia: float,
+        dias_trabajados: int,
+        otros_ingresos: float,
+        pagos_salud: float,
+        aporte_pensiones: float,
+    ):
+        self.nombre = nombre
+        self.apellidos = apellidos
+        self.cargo = cargo
+        self.genero = genero
+        self.salario_dia = salario_dia
+        self.dias_trabajados = dias_trabajados
+        self.otros_ingresos = otros_ingresos
+        self.pagos_salud = pagos_salud
+        self.aporte_pensiones = aporte_pensiones
+
+    @property
+    def salario_mensual(self) -> float:
+        """
+        Salario mensual = (días trabajados * sueldo por día)
+                          + otros ingresos
+                          - pagos por salud
+                          - aporte pensiones
+        """
+        return (
+            self.dias_trabajados * self.salario_dia
+            + self.otros_ingresos
+            - self.pagos_salud
+            - self.aporte_pensiones
+        )
+
+
+# Códigos enteros de cada enum (su posición), usados por los cálculos por columnas
+CARGOS = tuple(TipoCargo)
+GENEROS = tuple(TipoGenero)
+_CODIGO_CARGO = {c: i for i, c in enumerate(CARGOS)}
+_CODIGO_GENERO = {g: i for i, g in enumerate(GENEROS)}
+
+DIAS_MINIMOS = 1
+DIAS_MAXIMOS = 31
+
+
+# ==========================
+#  TOTALES INCREMENTALES
+# ==========================
+
+# Todo float finito es un múltiplo entero de 2**-1074 (el menor float positivo),
+# así que las sumas se llevan como enteros de Python en esa unidad: sumar y
+# restar es exacto y los totales no acumulan error por muchas ediciones.
+_EXPONENTE_MINIMO = 1074
+
+
+def _a_unidades(valor: float) -> int:
+    numerador, denominador = valor.as_integer_ratio()  # denominador = 2**k
+    return numerador << (_EXPONENTE_MINIMO - denominador.bit_length() + 1)
+
+
+def _desde_unidades(unidades: int) -> float:
+    return unidades / (1 << _EXPONENTE_MINIMO)  # división entera redondeada una sola vez
+
+
+@dataclass
+class TotalesNomina:
+    total: float
+    por_cargo: Dict[TipoCargo, float]
+    por_genero: Dict[TipoGenero, float]
+    empleados_por_cargo: Dict[TipoCargo, int]
+    empleados_por_genero: Dict[TipoGenero, int]
+
+
+# ==========================
+#  COLECCIÓN POR COLUMNAS
+# ==========================
+
+class ColeccionEmpleados:
+    """
+    Empleados guardados como columnas (estructura de arreglos).
+
+    Cada campo numérico es un ``array`` de valores nativos (8 bytes por
+    salario, 2 por los días), cargo y género son códigos de 1 byte (la
+    posición en ``CARGOS``/``GENEROS``) y los nombres y apellidos se
+    internan, así que los que se repiten comparten el mismo ``str``. Un
+    ``Empleado`` común ocupa cientos de bytes con su ``__dict__``; aquí
+    cada empleado cuesta unos 60.
+
+    Al indexar o recorrer la colección se obtienen ``FilaEmpleado``, vistas
+    con los mismos atributos que ``Empleado`` que leen de las columnas.
+
+    Además lleva la suma de salarios y la cantidad de empleados por cargo
+    y por género; cada alta, edición o baja los ajusta en O(1), así que
+    ``totales()`` no recorre a los empleados. Las sumas son exactas (ver
+    ``_a_unidades``): el total es la suma exacta de los salarios redondeada
+    una vez, como ``math.fsum``.
+    """
+
+    CAMPOS_NUMERICOS = ("salario_dia", "dias_trabajados", "otros_ingresos",
+                        "pagos_salud", "aporte_pensiones")
+
+    def __init__(self, empleados: Iterable[Empleado] = ()):
+        self.nombres: List[str] = []
+        self.apellidos: List[str] = []
+        self.cargo = array("b")
+        self.genero = array("b")
+        self.salario_dia = array("d")
+        self.dias_trabajados = array("h")
+        self.otros_ingresos = array("d")
+        self.pagos_salud = array("d")
+        self.aporte_pensiones = array("d")
+        self._suma_cargo = [0] * len(CARGOS)      # en unidades de 2**-1074
+        self._suma_genero = [0] * len(GENEROS)
+        self._cuenta_cargo = [0] * len(CARGOS)
+        self._cuenta_genero = [0] * len(GENEROS)
+        for empleado in empleados:
+            self.agregar(empleado)
+
+    # ---------- Totales ----------
+
+    def _acumular(self, cargo: int, genero: int, salario: float, signo: int) -> None:
+        unidades = signo * _a_unidades(salario)
+        self._suma_cargo[cargo] += unidades
+        self._suma_genero[genero] += unidades
+        self._cuenta_cargo[cargo] += signo
+        self._cuenta_genero[genero] += signo
+
+    def _acumular_fila(self, indice: int, signo: int) -> None:
+        self._acumular(self.cargo[indice], self.genero[indice],
+                       FilaEmpleado(self, indice).salario_mensual, signo)
+
+    @property
+    def total_nomina(self) -> float:
+        return _desde_unidades(sum(self._suma_cargo))
+
+    def totales(self) -> TotalesNomina:
+        """Total y subtotales por cargo y género, sin recorrer a los empleados."""
+        return TotalesNomina(
+            total=self.total_nomina,
+            por_cargo={c: _desde_unidades(self._suma_cargo[i]) for i, c in enumerate(CARGOS)},
+            por_genero={g: _desde_unidades(self._suma_genero[i]) for i, g in enumerate(GENEROS)},
+            empleados_por_cargo=dict(zip(CARGOS, self._cuenta_cargo)),
+            empleados_por_genero=dict(zip(GENEROS, self._cuenta_genero)),
+        )
+
+    # ---------- Modificación ----------
+
+    @staticmethod
+    def _fila(empleado: Empleado) -> tuple:
+        """Valores de las columnas para ``empleado``, comprobados antes de tocar ninguna."""
+        if not math.isfinite(empleado.salario_mensual):
+            raise ValueError("El salario mensual debe ser un número finito.")
+        dias = empleado.dias_trabajados
+        if not isinstance(dias, int) or not DIAS_MINIMOS <= dias <= DIAS_MAXIMOS:
+            raise ValueError(
+                f"Los días trabajados deben estar entre {DIAS_MINIMOS} y {DIAS_MAXIMOS}."
+            )
+        if empleado.cargo not in _CODIGO_CARGO or empleado.genero not in _CODIGO_GENERO:
+            raise ValueError("Cargo o género desconocido.")
+        return (
+            sys.intern(empleado.nombre),
+            sys.intern(empleado.apellidos),
+            _CODIGO_CARGO[empleado.cargo],
+            _CODIGO_GENERO[empleado.genero],
+            float(empleado.salario_dia),
+            dias,
+            float(empleado.otros_ingresos),
+            float(empleado.pagos_salud),
+            float(empleado.aporte_pensiones),
+        )
+
+    def agregar(self, empleado: Empleado) -> int:
+        """Agrega el empleado al final y devuelve su posición."""
+        fila = self._fila(empleado)
+        for columna, valor in zip(self._columnas(), fila):
+            columna.append(valor)
+        indice = len(self.nombres) - 1
+        self._acumular_fila(indice, +1)
+        return indice
+
+    def actualizar(self, indice: int, empleado: Empleado) -> None:
+        fila = self._fila(empleado)
+        self._acumular_fila(indice, -1)
+        for columna, valor in zip(self._columnas(), fila):
+            columna[indice] = valor
+        self._acumular_fila(indice, +1)
+
+    def eliminar(self, indice: int) -> None:
+        """Quita un empleado; las posiciones siguientes se corren una hacia atrás."""
+        self._acumular_fila(indice, -1)
+        for columna in self._columnas():
+            del columna[indice]
+
+    def _columnas(self) -> list:
+        return [self.nombres, self.apellidos, self.cargo, self.genero] + \
+            [getattr(self, campo) for campo in self.CAMPOS_NUMERICOS]
+
+    # ---------- Consulta ----------
+
+    def __len__(self) -> int:
+        return len(self.nombres)
+
+    def __getitem__(self, indice: int) -> "FilaEmpleado":
+        if indice < 0:
+            indice += len(self)
+        if not 0 <= indice < len(self):
+            raise IndexError("índice de empleado fuera de rango")
+        return FilaEmpleado(self, indice)
+
+    def __iter__(self) -> Iterator["FilaEmpleado"]:
+        for indice in range(len(self)):
+            yield FilaEmpleado(self, indice)
+
+    def empleado(self, indice: int) -> Empleado:
+        """Copia independiente de un empleado, como objeto ``Empleado``."""
+        fila = self[indice]
+        return Empleado(
+            fila.nombre, fila.apellidos, fila.cargo, fila.genero, fila.salario_dia,
+            fila.dias_trabajados, fila.otros_ingresos, fila.pagos_salud, fila.aporte_pensiones,
+        )
+
+    def columnas_numericas(self) -> Dict[str, array]:
+        """Columnas para los cálculos vectorizados (``cargo``/``genero`` como códigos)."""
+        columnas = {campo: getattr(self, campo) for campo in self.CAMPOS_NUMERICOS}
+        columnas["cargo"] = self.cargo
+        columnas["genero"] = self.genero
+        return columnas
+
+    # ---------- Carga por columnas ----------
+
+    def sumas_exactas(self) -> Tuple[List[int], List[int]]:
+        """Sumas por cargo y por género en unidades de 2**-1074, para guardarlas tal cual."""
+        return list(self._suma_cargo), list(self._suma_genero)
+
+    @classmethod
+    def desde_columnas(
+        cls,
+        nombres: Sequence[str],
+        apellidos: Sequence[str],
+        columnas: Dict[str, array],
+        sumas: Optional[Tuple[List[int], List[int]]] = None,
+    ) -> "ColeccionEmpleados":
+        """
+        Arma la colección directamente con sus columnas (sin pasar por ``agregar``).
+
+        ``columnas`` tiene la forma de ``columnas_numericas()``; los ``array``
+        que ya son del tipo correcto se usan sin copiar. Si se dan
+        las ``sumas`` guardadas con ``sumas_exactas()`` se usan tal cual,
+        después de comprobar que coinciden con las columnas (ValueError si
+        no); si no, los totales se recalculan fila por fila.
+        """
+        coleccion = cls()
+        cantidad = len(nombres)
+        if len(apellidos) != cantidad or any(len(c) != cantidad for c in columnas.values()):
+            raise ValueError("Las columnas no tienen la misma cantidad de empleados.")
+        for nombre, codigos in (("cargo", CARGOS), ("genero", GENEROS)):
+            if cantidad and not 0 <= min(columnas[nombre]) <= max(columnas[nombre]) < len(codigos):
+                raise ValueError(f"Hay códigos de {nombre} desconocidos.")
+        dias = columnas["dias_trabajados"]
+        if cantidad and not DIAS_MINIMOS <= min(dias) <= max(dias) <= DIAS_MAXIMOS:
+            raise ValueError(
+                f"Hay días trabajados fuera del rango {DIAS_MINIMOS} a {DIAS_MAXIMOS}."
+            )
+
+        coleccion.nombres = [sys.intern(n) for n in nombres]
+        coleccion.apellidos = [sys.intern(a) for a in apellidos]
+        for campo, tipo in (("cargo", "b"), ("genero", "b"), ("salario_dia", "d"),
+                            ("dias_trabajados", "h"), ("otros_ingresos", "d"),
+                            ("pagos_salud", "d"), ("aporte_pensiones", "d")):
+            valores = columnas[campo]
+            if not (isinstance(valores, array) and valores.typecode == tipo):
+                valores = array(tipo, valores)
+            setattr(coleccion, campo, valores)
+
+        if sumas is None:
+            for indice in range(cantidad):
+                coleccion._acumular_fila(indice, +1)
+            return coleccion
+        coleccion._suma_cargo, coleccion._suma_genero = list(sumas[0]), list(sumas[1])
+        cargos, generos = coleccion.cargo.tobytes(), coleccion.genero.tobytes()
+        coleccion._cuenta_cargo = [cargos.count(bytes([i])) for i in range(len(CARGOS))]
+        coleccion._cuenta_genero = [generos.count(bytes([i])) for i in range(len(GENEROS))]
+        coleccion._comprobar_sumas(cargos, generos)
+        return coleccion
+
+    def _comprobar_sumas(self, cargos: bytes, generos: bytes) -> None:
+        """
+        Compara las sumas recibidas con los salarios de las columnas.
+
+        Cada suma, redondeada, tiene que ser igual a ``math.fsum`` de los
+        salarios de su grupo: los dos son la suma exacta redondeada una vez,
+        así que solo coinciden si la suma guardada corresponde a las
+        columnas. Es mucho más rápido que recalcularlas con ``_a_unidades``.
+        """
+        if sum(self._suma_cargo) != sum(self._suma_genero):
+            raise ValueError("Las sumas por cargo y por género no coinciden.")
+        salarios = [
+            dias * salario + otros - salud - pensiones  # la fórmula de Empleado.salario_mensual
+            for salario, dias, otros, salud, pensiones in zip(
+                self.salario_dia, self.dias_trabajados, self.otros_ingresos,
+                self.pagos_salud, self.aporte_pensiones)
+        ]
+        for codigos, sumas in ((cargos, self._suma_cargo), (generos, self._suma_genero)):
+            for i, suma in enumerate(sumas):
+                del_grupo = codigos.translate(bytes(c == i for c in range(256)))  # 1 donde el código es i
+                if math.fsum(compress(salarios, del_grupo)) != _desde_unidades(suma):
+                    raise ValueError("Las sumas guardadas no corresponden a los salarios.")
+
+
+def _leer_columna(campo: str) -> property:
+    return property(lambda fila: getattr(fila._coleccion, campo)[fila._indice])
+
+
+class FilaEmpleado:
+    """
+    Vista de solo lectura de un empleado dentro de ``ColeccionEmpleados``.
+
+    No copia datos: lee de las columnas cada vez. Deja de ser válida si se
+    elimina un empleado anterior a ella en la colección.
+    """
+
+    __slots__ = ("_coleccion", "_indice")
+
+    def __init__(self, coleccion: ColeccionEmpleados, indice: int):
+        self._coleccion = coleccion
+        self._indice = indice
+
+    nombre = property(lambda fila: fila._coleccion.nombres[fila._indice])
+    apellidos = property(lambda fila: fila._coleccion.apellidos[fila._indice])
+    cargo = property(lambda fila: CARGOS[fila._coleccion.cargo[fila._indice]])
+    genero = property(lambda fila: GENEROS[fila._coleccion.genero[fila._indice]])
+    salario_dia = _leer_columna("salario_dia")
+    dias_trabajados = _leer_columna("dias_trabajados")
+    otros_ingresos = _leer_columna("otros_ingresos")
+    pagos_salud = _leer_columna("pagos_salud")
+    aporte_pensiones = _leer_columna("aporte_pensiones")
+
+    # la misma fórmula que Empleado, para que los resultados no puedan diferir
+    salario_mensual = Empleado.salario_mensual
@@ -0,0 +1,153 @@
+"""
+Cálculo de nóminas por lotes desde la línea de comandos.
+
+Cada archivo de entrada es la nómina de un período (por ejemplo, un mes
+de una empresa): un archivo de empleados ``.nom``, o un CSV o JSON Lines
+con las columnas que escribe ``reportes_nomina``. Para cada uno se
+calcula el salario mensual de todos los empleados y se escribe su
+reporte en la carpeta de salida, con la misma estructura de carpetas de
+la entrada:
+
+    python nomina_lotes.py empresas/ --salida reportes/
+        empresas/acme/2024-01.csv  ->  reportes/acme/2024-01.txt
+        empresas/acme/2024-02.csv  ->  reportes/acme/2024-02.txt
+
+Uso:
+    python nomina_lotes.py ENTRADA [ENTRADA ...] --salida CARPETA
+                           [--formato texto|csv|jsonl] [--procesos N]
+
+Las entradas pueden ser archivos o carpetas (se recorren completas). Los
+archivos se reparten entre ``--procesos`` procesos, uno por archivo a la
+vez. Este módulo no importa Tkinter, así que arranca rápido en las
+máquinas que corren los lotes.
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import List, NamedTuple, Optional, Tuple
+
+from persistencia_nomina import EXTENSIONES_ENTRADA, leer_empleados
+from reportes_nomina import EXTENSIONES, FORMATOS, escribir_reporte
+
+
+class ResultadoPeriodo(NamedTuple):
+    entrada: str
+    salida: str
+    empleados: int
+    total: float
+    error: Optional[str]  # None si el período se procesó bien
+
+
+# ==========================
+#  PERÍODOS
+# ==========================
+
+def buscar_periodos(entradas: List[str], carpeta_salida: str, formato: str) -> List[Tuple[str, str]]:
+    """
+    Pares (archivo de entrada, reporte de salida) de todas las ``entradas``.
+
+    Los archivos dentro de una carpeta conservan su ruta relativa a ella;
+    un archivo dado directamente va a la raíz de ``carpeta_salida``.
+    """
+    periodos: List[Tuple[str, str]] = []
+    for entrada in entradas:
+        if os.path.isdir(entrada):
+            for raiz, carpetas, archivos in os.walk(entrada):
+                carpetas.sort()
+                for archivo in sorted(archivos):
+                    if os.path.splitext(archivo)[1].lower() in EXTENSIONES_ENTRADA:
+                        ruta = os.path.join(raiz, archivo)
+                        periodos.append((ruta, os.path.relpath(ruta, entrada)))
+        elif os.path.isfile(entrada):
+            periodos.append((entrada, os.path.basename(entrada)))
+        else:
+            raise ValueError(f"No existe la entrada: {entrada}")
+
+    pares: List[Tuple[str, str]] = []
+    destinos = {}
+    for ruta, relativa in periodos:
+        salida = os.path.join(carpeta_salida, os.path.splitext(relativa)[0] + EXTENSIONES[formato])
+        if os.path.abspath(salida) == os.path.abspath(ruta):
+            raise ValueError(f"El reporte de {ruta} sobrescribiría la entrada; use otra carpeta de salida.")
+        if salida in destinos:
+            raise ValueError(f"{destinos[salida]} y {ruta} escribirían el mismo reporte ({salida}).")
+        destinos[salida] = ruta
+        pares.append((ruta, salida))
+    return pares
+
+
+def procesar_periodo(entrada: str, salida: str, formato: str) -> ResultadoPeriodo:
+    """Lee un período, calcula su nómina y escribe el reporte (corre en los procesos del pool)."""
+    try:
+        empleados = leer_empleados(entrada)
+        os.makedirs(os.path.dirname(salida) or ".", exist_ok=True)
+        resumen = escribir_reporte(empleados, salida, formato)
+    except (OSError, ValueError) as e:
+        return ResultadoPeriodo(entrada, salida, 0, 0.0, str(e))
+    return ResultadoPeriodo(entrada, salida, len(empleados), resumen.total, None)
+
+
+def procesar_periodos(
+    pares: List[Tuple[str, str]], formato: str, procesos: int
+) -> List[ResultadoPeriodo]:
+    """Procesa todos los períodos y devuelve los resultados en el orden de ``pares``."""
+    if procesos <= 1 or len(pares) <= 1:
+        resultados = []
+        for entrada, salida in pares:
+            resultados.append(procesar_periodo(entrada, salida, formato))
+            _informar(resultados[-1])
+        return resultados
+
+    resultados_por_entrada = {}
+    with ProcessPoolExecutor(min(procesos, len(pares))) as pool:
+        futuros = [pool.submit(procesar_periodo, entrada, salida, formato) for entrada, salida in pares]
+        for futuro in as_completed(futuros):
+            resultado = futuro.result()
+            resultados_por_entrada[resultado.entrada] = resultado
+            _informar(resultado)
+    return [resultados_por_entrada[entrada] for entrada, _ in pares]
+
+
+def _informar(resultado: ResultadoPeriodo) -> None:
+    if resultado.error:
+        print(f"ERROR: {resultado.error}", file=sys.stderr)
+    else:
+        print(f"{resultado.salida}: {resultado.empleados} empleados, "
+              f"total nómina {resultado.total:.2f}")
+
+
+# ==========================
+#  LÍNEA DE COMANDOS
+# ==========================
+
+def main(argumentos: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("entradas", nargs="+", metavar="ENTRADA",
+                        help=f"archivos ({', '.join(EXTENSIONES_ENTRADA)}) o carpetas")
+    parser.add_argument("--salida", required=True, help="carpeta donde se escriben los reportes")
+    parser.add_argument("--formato", choices=FORMATOS, default="texto")
+    parser.add_argument("--procesos", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args(argumentos)
+
+    try:
+        pares = buscar_periodos(args.entradas, args.salida, args.formato)
+    except ValueError as e:
+        parser.error(str(e))
+    if not pares:
+        parser.error("No se encontraron archivos de empleados en las entradas.")
+
+    inicio = time.perf_counter()
+    resultados = procesar_periodos(pares, args.formato, args.procesos)
+    duracion = time.perf_counter() - inicio
+
+    correctos = [r for r in resultados if r.error is None]
+    print(f"{len(correctos)} de {len(resultados)} períodos, "
+          f"{sum(r.empleados for r in correctos)} empleados en {duracion:.2f} s")
+    return 0 if len(correctos) == len(resultados) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,211 @@
+"""
+Guardado y carga de todos los empleados en un archivo binario por columnas.
+
+Formato (todo en little-endian):
+    cabecera                 CABECERA: magia, versión, empleados, textos distintos
+    tabla de textos          largos (uint32 por texto) + UTF-8 de todos los textos seguidos
+    nombres, apellidos       un índice uint32 en la tabla de textos por empleado
+    cargo, genero            un byte por empleado (posición en CARGOS/GENEROS)
+    columnas numéricas       salario_dia, dias_trabajados (int16), otros_ingresos,
+                             pagos_salud, aporte_pensiones (float64)
+    sumas exactas            por cargo y por género, enteros de largo variable
+
+Cada columna se lee de una sola vez con ``array.fromfile``; no hay nada
+que interpretar línea por línea, así que cargar un millón de empleados
+lleva una fracción de segundo. Los nombres se guardan una vez por valor
+distinto. Las sumas exactas de ``ColeccionEmpleados`` se guardan tal
+cual; al cargar solo se comprueba que coincidan con los salarios (con
+``math.fsum``, en C), lo que es más barato que volver a sumarlas.
+
+``leer_empleados`` abre además los CSV y JSON Lines que escribe
+``reportes_nomina`` (la columna ``salario_mensual`` se ignora y se vuelve
+a calcular), eligiendo el formato por la extensión del archivo.
+"""
+
+import csv
+import json
+import os
+import struct
+import sys
+from array import array
+from operator import itemgetter
+from typing import Any, BinaryIO, Dict, List, Mapping
+
+from modelo_nomina import CARGOS, GENEROS, ColeccionEmpleados, Empleado, TipoCargo, TipoGenero
+
+MAGIA = b"NOM1"
+VERSION = 1
+EXTENSION = ".nom"
+# magia, versión, cantidad de empleados, cantidad de textos distintos
+CABECERA = struct.Struct("<4sHQQ")
+_LARGO = struct.Struct("<Q")
+
+# (columna, tipo de array) en el orden en que se guardan
+_COLUMNAS = (
+    ("cargo", "b"), ("genero", "b"), ("salario_dia", "d"), ("dias_trabajados", "h"),
+    ("otros_ingresos", "d"), ("pagos_salud", "d"), ("aporte_pensiones", "d"),
+)
+_INDICE = "I"  # uint32
+
+
+def _escribir_array(f: BinaryIO, valores: array) -> None:
+    if sys.byteorder == "big":
+        valores = array(valores.typecode, valores)
+        valores.byteswap()
+    valores.tofile(f)
+
+
+def _leer_array(f: BinaryIO, tipo: str, cantidad: int) -> array:
+    valores = array(tipo)
+    try:
+        valores.fromfile(f, cantidad)
+    except EOFError:
+        raise ValueError("El archivo de empleados está incompleto.")
+    if sys.byteorder == "big":
+        valores.byteswap()
+    return valores
+
+
+def _escribir_entero(f: BinaryIO, valor: int) -> None:
+    datos = valor.to_bytes((valor.bit_length() + 8) // 8, "little", signed=True)
+    f.write(_LARGO.pack(len(datos)))
+    f.write(datos)
+
+
+def _leer_entero(f: BinaryIO) -> int:
+    cabecera = f.read(_LARGO.size)
+    largo = _LARGO.unpack(cabecera)[0] if len(cabecera) == _LARGO.size else 0
+    datos = f.read(largo)
+    # _escribir_entero siempre escribe al menos un byte
+    if largo == 0 or len(datos) != largo:
+        raise ValueError("El archivo de empleados está incompleto.")
+    return int.from_bytes(datos, "little", signed=True)
+
+
+def guardar_empleados(coleccion: ColeccionEmpleados, ruta: str) -> None:
+    """Guarda la colección completa en ``ruta`` (se reemplaza de forma atómica)."""
+    textos: Dict[str, int] = {}
+    indices_nombre = array(_INDICE, [textos.setdefault(n, len(textos)) for n in coleccion.nombres])
+    indices_apellido = array(_INDICE, [textos.setdefault(a, len(textos)) for a in coleccion.apellidos])
+    codificados = [t.encode("utf-8") for t in textos]  # los dict conservan el orden de inserción
+
+    columnas = coleccion.columnas_numericas()
+    suma_cargo, suma_genero = coleccion.sumas_exactas()
+    archivo_temporal = ruta + ".tmp"
+    with open(archivo_temporal, "wb") as f:
+        f.write(CABECERA.pack(MAGIA, VERSION, len(coleccion), len(textos)))
+        _escribir_array(f, array(_INDICE, map(len, codificados)))
+        f.write(b"".join(codificados))
+        _escribir_array(f, indices_nombre)
+        _escribir_array(f, indices_apellido)
+        for campo, _ in _COLUMNAS:
+            _escribir_array(f, columnas[campo])
+        for suma in suma_cargo + suma_genero:
+            _escribir_entero(f, suma)
+    os.replace(archivo_temporal, ruta)
+
+
+def cargar_empleados(ruta: str) -> ColeccionEmpleados:
+    """Lee un archivo escrito por ``guardar_empleados``."""
+    with open(ruta, "rb") as f:
+        cabecera = f.read(CABECERA.size)
+        if len(cabecera) != CABECERA.size:
+            raise ValueError(f"{ruta} no es un archivo de empleados.")
+        magia, version, cantidad, cantidad_textos = CABECERA.unpack(cabecera)
+        if magia != MAGIA or version != VERSION:
+            raise ValueError(f"{ruta} no es un archivo de empleados (versión {VERSION}).")
+
+        largos = _leer_array(f, _INDICE, cantidad_textos)
+        datos = f.read(sum(largos))
+        if len(datos) != sum(largos):
+            raise ValueError("El archivo de empleados está incompleto.")
+        textos: List[str] = []
+        inicio = 0
+        for largo in largos:
+            textos.append(sys.intern(datos[inicio:inicio + largo].decode("utf-8")))
+            inicio += largo
+
+        indices_nombre = _leer_array(f, _INDICE, cantidad)
+        indices_apellido = _leer_array(f, _INDICE, cantidad)
+        columnas = {campo: _leer_array(f, tipo, cantidad) for campo, tipo in _COLUMNAS}
+        sumas = (
+            [_leer_entero(f) for _ in CARGOS],
+            [_leer_entero(f) for _ in GENEROS],
+        )
+        if f.read(1):
+            raise ValueError(f"{ruta} está dañado (sobran datos al final).")
+
+    if cantidad and max(max(indices_nombre), max(indices_apellido)) >= len(textos):
+        raise ValueError(f"{ruta} está dañado.")
+    # itemgetter con muchos índices arma la tupla de textos en C
+    nombres = itemgetter(*indices_nombre)(textos) if cantidad > 1 else [textos[i] for i in indices_nombre]
+    apellidos = itemgetter(*indices_apellido)(textos) if cantidad > 1 else [textos[i] for i in indices_apellido]
+    return ColeccionEmpleados.desde_columnas(nombres, apellidos, columnas, sumas)
+
+
+# ==========================
+#  CSV Y JSON LINES
+# ==========================
+
+CAMPOS_EMPLEADO = ("nombre", "apellidos", "cargo", "genero", *ColeccionEmpleados.CAMPOS_NUMERICOS)
+EXTENSIONES_ENTRADA = (EXTENSION, ".csv", ".jsonl")
+
+
+def _empleado_desde(datos: Mapping[str, Any]) -> Empleado:
+    return Empleado(
+        str(datos["nombre"]),
+        str(datos["apellidos"]),
+        TipoCargo(datos["cargo"]),
+        TipoGenero(datos["genero"]),
+        float(datos["salario_dia"]),
+        int(datos["dias_trabajados"]),
+        float(datos["otros_ingresos"]),
+        float(datos["pagos_salud"]),
+        float(datos["aporte_pensiones"]),
+    )
+
+
+def leer_csv(ruta: str) -> ColeccionEmpleados:
+    """Lee un CSV con encabezado; las columnas pueden venir en cualquier orden."""
+    coleccion = ColeccionEmpleados()
+    with open(ruta, newline="", encoding="utf-8") as f:
+        filas = csv.reader(f)
+        encabezado = next(filas, [])
+        faltantes = [c for c in CAMPOS_EMPLEADO if c not in encabezado]
+        if faltantes:
+            raise ValueError(f"{ruta}: faltan las columnas {', '.join(faltantes)}.")
+        try:
+            for fila in filas:
+                if not fila:
+                    continue
+                # agregar rechaza con ValueError los días fuera de 1 a 31 y los salarios no finitos
+                coleccion.agregar(_empleado_desde(dict(zip(encabezado, fila))))
+        except (KeyError, ValueError, csv.Error) as e:
+            raise ValueError(f"{ruta}, línea {filas.line_num}: {e}") from None
+    return coleccion
+
+
+def leer_jsonl(ruta: str) -> ColeccionEmpleados:
+    """Lee un archivo JSON Lines con un objeto por empleado."""
+    coleccion = ColeccionEmpleados()
+    with open(ruta, encoding="utf-8") as f:
+        for numero, linea in enumerate(f, start=1):
+            if not linea.strip():
+                continue
+            try:
+                coleccion.agregar(_empleado_desde(json.loads(linea)))
+            except (KeyError, TypeError, ValueError) as e:
+                raise ValueError(f"{ruta}, línea {numero}: {e}") from None
+    return coleccion
+
+
+def leer_empleados(ruta: str) -> ColeccionEmpleados:
+    """Abre un archivo de empleados según su extensión (``.nom``, ``.csv`` o ``.jsonl``)."""
+    extension = os.path.splitext(ruta)[1].lower()
+    if extension == EXTENSION:
+        return cargar_empleados(ruta)
+    if extension == ".csv":
+        return leer_csv(ruta)
+    if extension == ".jsonl":
+        return leer_jsonl(ruta)
+    raise ValueError(f"Formato de archivo desconocido: {ruta} (use {', '.join(EXTENSIONES_ENTRADA)}).")
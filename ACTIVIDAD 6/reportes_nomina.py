@@ -0,0 +1,202 @@
+"""
+Escritura del reporte de nómina.
+
+Formatos:
+    * ``texto``: el mismo diseño de ``Nomina.txt`` que generaba la aplicación.
+    * ``csv``: una fila por empleado con todos sus datos y el salario mensual.
+    * ``jsonl``: JSON Lines, un objeto JSON por línea.
+
+Las filas no se escriben de a una: se formatean por lotes de
+``TAM_LOTE`` empleados, cada lote se une en una sola cadena y se escribe
+de una vez sobre un archivo con un buffer grande. Para nóminas muy
+grandes los lotes se pueden formatear en varios procesos
+(``procesos > 1``); el orden de las filas se conserva.
+"""
+
+import csv
+import io
+import json
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from calculo_nomina import ResumenNomina, resumir_nomina
+from modelo_nomina import CARGOS, GENEROS, ColeccionEmpleados, Empleado
+
+FORMATOS = ("texto", "csv", "jsonl")
+EXTENSIONES = {"texto": ".txt", "csv": ".csv", "jsonl": ".jsonl"}
+TAM_LOTE = 20_000
+TAM_BUFFER = 1 << 20  # 1 MiB
+
+COLUMNAS = (
+    "nombre", "apellidos", "cargo", "genero", "salario_dia", "dias_trabajados",
+    "otros_ingresos", "pagos_salud", "aporte_pensiones", "salario_mensual",
+)
+
+_VALOR_CARGO = [c.value for c in CARGOS]
+_VALOR_GENERO = [g.value for g in GENEROS]
+
+# Un lote son las columnas de un tramo de empleados (cargo y género como
+# códigos); así se envía barato a otro proceso. El texto solo necesita
+# algunas columnas, el CSV y JSON Lines todas, en el orden de COLUMNAS.
+Lote = Tuple[list, ...]
+_COLUMNAS_TEXTO = ("nombre", "apellidos", "cargo", "genero", "salario_mensual")
+
+
+# ==========================
+#  FORMATEO DE LOTES
+# ==========================
+
+def _formatear_texto(lote: Lote) -> str:
+    nombres, apellidos, cargos, generos, salarios = lote
+    return "".join([
+        f"{n} {a} | Cargo: {_VALOR_CARGO[c]} | Género: {_VALOR_GENERO[g]} | "
+        f"Salario mensual: {s:.2f}\n"
+        for n, a, c, g, s in zip(nombres, apellidos, cargos, generos, salarios)
+    ])
+
+
+def _campo_csv(valor: str) -> str:
+    """Campo con comillas solo si hacen falta (como ``csv.QUOTE_MINIMAL``)."""
+    if not valor:
+        return valor  # en una fila de un solo campo csv lo escribiría como ""
+    salida = io.StringIO()
+    csv.writer(salida, lineterminator="\n").writerow([valor])
+    return salida.getvalue()[:-1]
+
+
+def _cadenas_codificadas(lote: Lote, codificar: Callable[[str], str]) -> Dict[str, str]:
+    """
+    Codifica cada nombre y apellido distinto del lote una sola vez.
+
+    Los nombres se repiten mucho (y están internados), así que esto
+    cambia una llamada por fila por una por valor distinto.
+    """
+    nombres, apellidos = lote[0], lote[1]
+    return {valor: codificar(valor) for valor in set(nombres).union(apellidos)}
+
+
+def _formatear_csv(lote: Lote) -> str:
+    nombres, apellidos, cargos, generos, *numeros = lote
+    campo = _cadenas_codificadas(lote, _campo_csv)
+    cargo_csv = [_campo_csv(v) for v in _VALOR_CARGO]
+    genero_csv = [_campo_csv(v) for v in _VALOR_GENERO]
+    # repr de un float es lo mismo que escribe el módulo csv
+    return "".join([
+        f"{campo[n]},{campo[a]},{cargo_csv[c]},{genero_csv[g]},{sd!r},{d},{o!r},{ps!r},{ap!r},{s!r}\n"
+        for n, a, c, g, sd, d, o, ps, ap, s in zip(nombres, apellidos, cargos, generos, *numeros)
+    ])
+
+
+def _json(valor: str) -> str:
+    return json.dumps(valor, ensure_ascii=False)
+
+
+def _formatear_jsonl(lote: Lote) -> str:
+    nombres, apellidos, cargos, generos, *numeros = lote
+    # solo las cadenas pasan por json.dumps; los números de Python ya son JSON válido
+    cadena = _cadenas_codificadas(lote, _json)
+    cargo_json = [_json(v) for v in _VALOR_CARGO]
+    genero_json = [_json(v) for v in _VALOR_GENERO]
+    return "".join([
+        f'{{"nombre": {cadena[n]}, "apellidos": {cadena[a]}, '
+        f'"cargo": {cargo_json[c]}, "genero": {genero_json[g]}, "salario_dia": {sd!r}, '
+        f'"dias_trabajados": {d}, "otros_ingresos": {o!r}, "pagos_salud": {ps!r}, '
+        f'"aporte_pensiones": {ap!r}, "salario_mensual": {s!r}}}\n'
+        for n, a, c, g, sd, d, o, ps, ap, s in zip(nombres, apellidos, cargos, generos, *numeros)
+    ])
+
+
+_FORMATEADORES: Dict[str, Callable[[Lote], str]] = {
+    "texto": _formatear_texto,
+    "csv": _formatear_csv,
+    "jsonl": _formatear_jsonl,
+}
+
+
+def _formatear_lote(formato: str, lote: Lote) -> str:
+    """Punto de entrada de los procesos del pool (debe poder importarse)."""
+    return _FORMATEADORES[formato](lote)
+
+
+def _lotes(
+    coleccion: ColeccionEmpleados, salarios: List[float], formato: str, tam_lote: int
+) -> Iterator[Lote]:
+    disponibles = dict(coleccion.columnas_numericas(), nombre=coleccion.nombres,
+                       apellidos=coleccion.apellidos, salario_mensual=salarios)
+    nombres = _COLUMNAS_TEXTO if formato == "texto" else COLUMNAS
+    columnas = [disponibles[nombre] for nombre in nombres]
+    for inicio in range(0, len(coleccion), tam_lote):
+        fin = inicio + tam_lote
+        yield tuple(list(columna[inicio:fin]) for columna in columnas)
+
+
+# ==========================
+#  ESCRITURA
+# ==========================
+
+def _encabezado(formato: str) -> str:
+    if formato == "texto":
+        return "NÓMINA DE EMPLEADOS\n" + "=" * 60 + "\n"
+    if formato == "csv":
+        return ",".join(COLUMNAS) + "\n"
+    return ""
+
+
+def _pie(formato: str, resumen: ResumenNomina) -> str:
+    if formato == "texto":
+        return "=" * 60 + "\n" + f"TOTAL NÓMINA: {resumen.total:.2f}\n"
+    return ""
+
+
+def escribir_reporte(
+    empleados: Sequence[Empleado],
+    ruta: str,
+    formato: str = "texto",
+    resumen: Optional[ResumenNomina] = None,
+    procesos: int = 0,
+    tam_lote: int = TAM_LOTE,
+    tam_buffer: int = TAM_BUFFER,
+) -> ResumenNomina:
+    """
+    Escribe el reporte de ``empleados`` en ``ruta`` y devuelve el resumen usado.
+
+    ``resumen`` evita recalcular los salarios si ya se tienen. El total y
+    los subtotales del resumen devuelto (y del pie del reporte) son los de
+    ``ColeccionEmpleados.totales()``, la suma exacta redondeada una vez,
+    para que coincidan con los que muestra la aplicación; la suma fila por
+    fila de ``resumir_nomina`` puede diferir en los últimos decimales. Con
+    ``procesos > 1`` los lotes se formatean en un ``ProcessPoolExecutor``;
+    solo compensa con cientos de miles de filas.
+    """
+    if formato not in _FORMATEADORES:
+        raise ValueError(f"Formato desconocido: {formato} (use {', '.join(FORMATOS)}).")
+    if not isinstance(empleados, ColeccionEmpleados):
+        empleados = ColeccionEmpleados(empleados)
+    if resumen is None:
+        resumen = resumir_nomina(empleados)
+    totales = empleados.totales()
+    resumen = replace(resumen, total=totales.total, por_cargo=totales.por_cargo,
+                      por_genero=totales.por_genero)
+
+    lotes = _lotes(empleados, resumen.salarios, formato, tam_lote)
+    with open(ruta, "w", encoding="utf-8", buffering=tam_buffer) as f:
+        f.write(_encabezado(formato))
+        if procesos > 1:
+            with ProcessPoolExecutor(procesos) as pool:
+                # pocos lotes en vuelo a la vez (no toda la nómina en memoria),
+                # y se escriben en el orden en que se enviaron
+                pendientes: deque = deque()
+                for lote in lotes:
+                    pendientes.append(pool.submit(_formatear_lote, formato, lote))
+                    if len(pendientes) >= 2 * procesos:
+                        f.write(pendientes.popleft().result())
+                while pendientes:
+                    f.write(pendientes.popleft().result())
+        else:
+            formatear = _FORMATEADORES[formato]
+            for lote in lotes:
+                f.write(formatear(lote))
+        f.write(_pie(formato, resumen))
+    return resumen
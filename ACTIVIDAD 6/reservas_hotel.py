@@ -0,0 +1,147 @@
+"""
+Reservas futuras de las habitaciones del hotel.
+
+``Habitacion`` solo sabe si está ocupada ahora; ``MotorReservas`` guarda
+además las reservas por rango de fechas. Cada habitación tiene su
+``AgendaHabitacion``: las reservas de una misma habitación no se pueden
+cruzar, así que basta con tenerlas ordenadas por fecha de ingreso (en
+``array`` de enteros, como ordinales de fecha) para responder con
+``bisect`` si está libre entre dos fechas, en tiempo logarítmico.
+
+Las fechas de salida no cuentan como noche: una reserva del 1 al 3 ocupa
+las noches del 1 y del 2, y otra puede entrar el día 3.
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import date
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from modelo_hotel import Hotel, Huesped
+
+
+class Reserva(NamedTuple):
+    habitacion: int
+    ingreso: date
+    salida: date
+    huesped: Optional[Huesped]
+
+
+class AgendaHabitacion:
+    """Reservas de una habitación, ordenadas y sin cruces."""
+
+    __slots__ = ("inicios", "fines")
+
+    def __init__(self) -> None:
+        # ordinales de fecha (date.toordinal); fines[i] es la salida de la reserva i
+        self.inicios = array("i")
+        self.fines = array("i")
+
+    def __len__(self) -> int:
+        return len(self.inicios)
+
+    def esta_libre(self, inicio: int, fin: int) -> bool:
+        # la única reserva que puede cruzarse es la última que empieza antes de ``fin``
+        i = bisect_left(self.inicios, fin) - 1
+        return i < 0 or self.fines[i] <= inicio
+
+    def agregar(self, inicio: int, fin: int) -> None:
+        if not self.esta_libre(inicio, fin):
+            raise ValueError("La habitación ya está reservada en esas fechas.")
+        i = bisect_left(self.inicios, inicio)
+        self.inicios.insert(i, inicio)
+        self.fines.insert(i, fin)
+
+    def quitar(self, inicio: int) -> int:
+        """Quita la reserva que empieza en ``inicio`` y devuelve su fin."""
+        i = bisect_left(self.inicios, inicio)
+        if i == len(self.inicios) or self.inicios[i] != inicio:
+            raise ValueError("No hay una reserva que empiece en esa fecha.")
+        fin = self.fines[i]
+        del self.inicios[i]
+        del self.fines[i]
+        return fin
+
+    def entre(self, inicio: int, fin: int) -> Iterator[Tuple[int, int]]:
+        """(inicio, fin) de las reservas que se cruzan con ``[inicio, fin)``."""
+        i = max(bisect_right(self.inicios, inicio) - 1, 0)
+        while i < len(self.inicios) and self.inicios[i] < fin:
+            if self.fines[i] > inicio:
+                yield self.inicios[i], self.fines[i]
+            i += 1
+
+
+class MotorReservas:
+    """Reservas por rango de fechas de todas las habitaciones de un hotel."""
+
+    def __init__(self, hotel: Hotel) -> None:
+        self.hotel = hotel
+        self._agendas: Dict[int, AgendaHabitacion] = {}
+        # solo se guardan los huéspedes que se indicaron, por (habitación, ingreso)
+        self._huespedes: Dict[Tuple[int, int], Huesped] = {}
+        self._cantidad = 0
+
+    def __len__(self) -> int:
+        return self._cantidad
+
+    def _agenda(self, numero: int) -> AgendaHabitacion:
+        if self.hotel.buscar_habitacion(numero) is None:
+            raise ValueError(f"La habitación {numero} no existe.")
+        agenda = self._agendas.get(numero)
+        if agenda is None:
+            agenda = self._agendas[numero] = AgendaHabitacion()
+        return agenda
+
+    @staticmethod
+    def _rango(ingreso: date, salida: date) -> Tuple[int, int]:
+        if salida <= ingreso:
+            raise ValueError("La fecha de salida debe ser posterior a la de ingreso.")
+        return ingreso.toordinal(), salida.toordinal()
+
+    # ---------- Reservas ----------
+
+    def reservar(
+        self, numero: int, ingreso: date, salida: date, huesped: Optional[Huesped] = None
+    ) -> Reserva:
+        inicio, fin = self._rango(ingreso, salida)
+        self._agenda(numero).agregar(inicio, fin)
+        if huesped is not None:
+            self._huespedes[numero, inicio] = huesped
+        self._cantidad += 1
+        return Reserva(numero, ingreso, salida, huesped)
+
+    def cancelar(self, numero: int, ingreso: date) -> Reserva:
+        inicio = ingreso.toordinal()
+        fin = self._agenda(numero).quitar(inicio)
+        self._cantidad -= 1
+        huesped = self._huespedes.pop((numero, inicio), None)
+        return Reserva(numero, ingreso, date.fromordinal(fin), huesped)
+
+    def reservas_de(self, numero: int, desde: date, hasta: date) -> List[Reserva]:
+        """Reservas de la habitación que se cruzan con ``[desde, hasta)``."""
+        inicio, fin = self._rango(desde, hasta)
+        agenda = self._agendas.get(numero)
+        if agenda is None:
+            return []
+        return [
+            Reserva(numero, date.fromordinal(i), date.fromordinal(f), self._huespedes.get((numero, i)))
+            for i, f in agenda.entre(inicio, fin)
+        ]
+
+    # ---------- Disponibilidad ----------
+
+    def esta_libre(self, numero: int, ingreso: date, salida: date) -> bool:
+        inicio, fin = self._rango(ingreso, salida)
+        agenda = self._agendas.get(numero)
+        if agenda is None:
+            return self.hotel.buscar_habitacion(numero) is not None
+        return agenda.esta_libre(inicio, fin)
+
+    def habitaciones_libres(self, ingreso: date, salida: date) -> List[int]:
+        """Números de las habitaciones sin reservas entre ``ingreso`` y ``salida``."""
+        inicio, fin = self._rango(ingreso, salida)
+        agendas = self._agendas
+        return [
+            h.numero for h in self.hotel.habitaciones
+            if h.numero not in agendas or agendas[h.numero].esta_libre(inicio, fin)
+        ]
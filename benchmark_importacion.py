@@ -0,0 +1,154 @@
+"""
+Tiempo de importación de los módulos de las actividades 3 a 6.
+
+Uso:
+    python benchmark_importacion.py [--repeticiones 5] [--guardar base.json] [--comparar base.json]
+
+Cada módulo se importa en un intérprete nuevo con ``python -X importtime``
+(sin nada en caché de una importación anterior). Para cada uno se muestra
+el tiempo total de la importación (mediana de ``--repeticiones``), si
+terminó cargando Tkinter y la dependencia que más tardó según importtime.
+
+Los módulos de modelo no deben importar Tkinter: si alguno lo hace el
+script termina con código 1. ``--guardar`` escribe los tiempos en un JSON
+y ``--comparar`` muestra al lado de cada tiempo el de un JSON guardado
+antes, para seguir la evolución módulo por módulo.
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+
+RAIZ = os.path.dirname(os.path.abspath(__file__))
+
+# (carpeta, archivo, es_modelo)
+MODULOS = (
+    ("ACTIVIDAD 3", "modelo_notas.py", True),
+    ("ACTIVIDAD 3", "modelo_figuras.py", True),
+    ("ACTIVIDAD 3", "Ejercicio 8.2.py", False),
+    ("ACTIVIDAD 3", "Ejercicio 8.3.py", False),
+    ("ACTIVIDAD 4", "modelo_vendedor.py", True),
+    ("ACTIVIDAD 4", "calculos_numericos.py", True),
+    ("ACTIVIDAD 4", "modelo_programadores.py", True),
+    ("ACTIVIDAD 4", "lectura_archivos.py", True),
+    ("ACTIVIDAD 4", "Actividad_4_2.py", False),
+    ("ACTIVIDAD 4", "Actividad_4_3.py", False),
+    ("ACTIVIDAD 4", "Actividad_4_4.py", False),
+    ("ACTIVIDAD 4", "Actividad_4_5.py", False),
+    ("ACTIVIDAD 5", "agenda_contactos.py", True),
+    ("ACTIVIDAD 5", "ejercicio_5.py", False),
+    ("ACTIVIDAD 6", "modelo_nomina.py", True),
+    ("ACTIVIDAD 6", "calculo_nomina.py", True),
+    ("ACTIVIDAD 6", "nomina_lotes.py", True),
+    ("ACTIVIDAD 6", "modelo_hotel.py", True),
+    ("ACTIVIDAD 6", "modelo_contacto.py", True),
+    ("ACTIVIDAD 6", "Ejercicio_8.4.py", False),
+    ("ACTIVIDAD 6", "Ejercicio_8.5.py", False),
+    ("ACTIVIDAD 6", "Ejercicio_9.1.py", False),
+)
+
+# Los nombres de archivo con espacios o puntos no se pueden importar con
+# ``import``, así que todos se cargan desde su ruta con importlib.
+_PRELUDIO = "import importlib.util, sys, time\nsys.path.insert(0, '.')\n"
+_CARGA = """
+spec = importlib.util.spec_from_file_location("modulo_medido", {archivo!r})
+modulo = importlib.util.module_from_spec(spec)
+inicio = time.perf_counter()
+spec.loader.exec_module(modulo)
+print(time.perf_counter() - inicio, "tkinter" in sys.modules)
+"""
+_LINEA_IMPORTTIME = re.compile(r"import time:\s+\d+ \|\s+(\d+) \| (\S.*)$")
+
+
+class Medicion(NamedTuple):
+    modulo: str
+    es_modelo: bool
+    milisegundos: float
+    tkinter: bool
+    mas_lenta: str  # dependencia de primer nivel que más tardó
+    error: Optional[str]
+
+
+def _importtime(codigo: str, carpeta: str) -> Tuple[str, List[Tuple[str, int]]]:
+    """Salida estándar y (módulo, microsegundos acumulados) de primer nivel."""
+    proceso = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", codigo],
+        cwd=carpeta, capture_output=True, text=True,
+    )
+    primer_nivel = []
+    for linea in proceso.stderr.splitlines():
+        coincidencia = _LINEA_IMPORTTIME.match(linea)
+        if coincidencia:
+            primer_nivel.append((coincidencia.group(2), int(coincidencia.group(1))))
+    if proceso.returncode != 0:
+        raise RuntimeError(proceso.stderr.strip().splitlines()[-1])
+    return proceso.stdout, primer_nivel
+
+
+def medir_modulo(carpeta: str, archivo: str, es_modelo: bool, repeticiones: int,
+                 base: Set[str]) -> Medicion:
+    ruta = os.path.join(RAIZ, carpeta)
+    nombre = f"{carpeta}/{archivo}"
+    tiempos = []
+    try:
+        for _ in range(repeticiones):
+            salida, primer_nivel = _importtime(_PRELUDIO + _CARGA.format(archivo=archivo), ruta)
+            segundos, tkinter = salida.split()[-2:]
+            tiempos.append(float(segundos) * 1000)
+    except RuntimeError as e:
+        return Medicion(nombre, es_modelo, 0.0, False, "", str(e))
+
+    propias = [(m, us) for m, us in primer_nivel if m not in base]
+    mas_lenta = max(propias, key=lambda par: par[1], default=None)
+    descripcion = f"{mas_lenta[0]} ({mas_lenta[1] / 1000:.1f} ms)" if mas_lenta else "-"
+    return Medicion(nombre, es_modelo, statistics.median(tiempos), tkinter == "True", descripcion, None)
+
+
+def medir_todos(repeticiones: int) -> List[Medicion]:
+    # lo que ya importa el preludio no cuenta como dependencia del módulo
+    _, preludio = _importtime(_PRELUDIO, RAIZ)
+    base = {modulo for modulo, _ in preludio}
+    return [medir_modulo(c, a, m, repeticiones, base) for c, a, m in MODULOS]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeticiones", type=int, default=5)
+    parser.add_argument("--guardar", help="JSON donde guardar los tiempos")
+    parser.add_argument("--comparar", help="JSON guardado antes con --guardar")
+    args = parser.parse_args()
+
+    anteriores: Dict[str, float] = {}
+    if args.comparar:
+        with open(args.comparar, encoding="utf-8") as f:
+            anteriores = json.load(f)
+
+    mediciones = medir_todos(args.repeticiones)
+    print(f"{'módulo':<36} {'capa':<7} {'tiempo':>10} {'antes':>10} {'Tk':>3}  dependencia más lenta")
+    for m in mediciones:
+        capa = "modelo" if m.es_modelo else "GUI"
+        if m.error:
+            print(f"{m.modulo:<36} {capa:<7} ERROR: {m.error}")
+            continue
+        antes = f"{anteriores[m.modulo]:7.1f} ms" if m.modulo in anteriores else ""
+        print(f"{m.modulo:<36} {capa:<7} {m.milisegundos:7.1f} ms {antes:>10} "
+              f"{'sí' if m.tkinter else 'no':>3}  {m.mas_lenta}")
+
+    if args.guardar:
+        with open(args.guardar, "w", encoding="utf-8") as f:
+            json.dump({m.modulo: round(m.milisegundos, 2) for m in mediciones if not m.error}, f, indent=2)
+
+    con_tkinter = [m.modulo for m in mediciones if m.es_modelo and m.tkinter]
+    if con_tkinter:
+        print("Módulos de modelo que importan Tkinter: " + ", ".join(con_tkinter))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())